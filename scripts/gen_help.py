@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Generate src/ingestor/_help.py from the Click CLI.
+
+The generated module holds the rendered ``--help`` text for the ingestor
+group and each subcommand, so ``ingestor --help`` and
+``ingestor <command> --help`` can be answered without importing Click.
+
+Re-run after changing any command, option or docstring:
+
+    python scripts/gen_help.py
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "src" / "ingestor" / "_help.py"
+
+# Fixed width so the output does not depend on the generating terminal
+HELP_WIDTH = 80
+
+
+def render_help() -> dict[str, str]:
+    """Render help text for the CLI group and every subcommand."""
+    import click
+
+    from ingestor.cli import main
+
+    def get_help(command: click.Command, name: str, parent=None) -> str:
+        ctx = click.Context(
+            command, info_name=name, parent=parent, terminal_width=HELP_WIDTH
+        )
+        return ctx.get_help()
+
+    root = click.Context(main, info_name="ingestor", terminal_width=HELP_WIDTH)
+    help_text = {"main": get_help(main, "ingestor")}
+    for name, command in main.commands.items():
+        help_text[name] = get_help(command, name, parent=root)
+    return help_text
+
+
+def render_module(help_text: dict[str, str]) -> str:
+    """Render the _help.py module source."""
+    lines = [
+        '"""Pre-rendered CLI help text.',
+        "",
+        "Generated by scripts/gen_help.py - do not edit by hand.",
+        '"""',
+        "",
+        "HELP = {",
+    ]
+    for name, text in help_text.items():
+        lines.append(f"    {name!r}: {text!r},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    sys.path.insert(0, str(ROOT / "src"))
+    OUTPUT.write_text(render_module(render_help()))
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,50 @@
 """Ingestor - Comprehensive media-to-markdown ingestion for LLM RAG and fine-tuning."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from .core import (
-    CharsetHandler,
-    ExtractorRegistry,
-    FileDetector,
-    Router,
-    create_default_registry,
-)
-from .types import ExtractedImage, ExtractionResult, IngestConfig, MediaType
+if TYPE_CHECKING:
+    from .core import (
+        CharsetHandler,
+        ExtractorRegistry,
+        FileDetector,
+        Router,
+        create_default_registry,
+    )
+    from .types import ExtractedImage, ExtractionResult, IngestConfig, MediaType
+
+# Public name -> defining module. Resolved on first attribute access so
+# that importing the package (e.g. for the CLI or ``__version__``) does
+# not load the core and the dependencies behind it.
+_LAZY_EXPORTS = {
+    "MediaType": ".types",
+    "ExtractedImage": ".types",
+    "ExtractionResult": ".types",
+    "IngestConfig": ".types",
+    "FileDetector": ".core",
+    "CharsetHandler": ".core",
+    "ExtractorRegistry": ".core",
+    "create_default_registry": ".core",
+    "Router": ".core",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Version
@@ -1,6 +1,41 @@
 """Entry point for python -m ingestor."""
 
-from .cli import main
+import os
+import sys
+
+
+def _write(text: str) -> None:
+    """Print a line to stdout, exiting quietly if the pipe was closed."""
+    try:
+        print(text, flush=True)
+    except BrokenPipeError:
+        # Point stdout at devnull so the flush at interpreter exit is silent
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+
+
+def main() -> None:
+    """Run the CLI, answering ``--version`` and ``--help`` without loading Click or Rich."""
+    args = sys.argv[1:]
+    if args == ["--version"]:
+        from . import __version__
+
+        _write(f"ingestor, version {__version__}")
+        return
+
+    if args and args[-1] == "--help" and len(args) <= 2:
+        from ._help import HELP
+
+        text = HELP.get(args[0] if len(args) == 2 else "main")
+        if text is not None:
+            _write(text)
+            return
+
+    from .cli import main as cli_main
+
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
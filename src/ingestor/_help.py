@@ -0,0 +1,13 @@
+"""Pre-rendered CLI help text.
+
+Generated by scripts/gen_help.py - do not edit by hand.
+"""
+
+HELP = {
+    'main': 'Usage: ingestor [OPTIONS] COMMAND [ARGS]...\n\n  Ingestor - Comprehensive media-to-markdown ingestion for LLM RAG.\n\nOptions:\n  --version  Show the version and exit.\n  --help     Show this message and exit.\n\nCommands:\n  batch     Process all supported files in a folder.\n  clone     Clone and ingest a git repository.\n  crawl     Deep crawl a website and convert to markdown.\n  describe  Generate VLM descriptions for images.\n  ingest    Ingest a single file or URL.',
+    'ingest': "Usage: ingestor ingest [OPTIONS] INPUT\n\n  Ingest a single file or URL.\n\n  INPUT can be a file path or URL (including YouTube URLs).\n\nOptions:\n  -o, --output PATH     Output directory\n  --keep-raw            Keep original image formats (don't convert to PNG)\n  --img-to TEXT         Target image format (default: png)\n  --metadata            Generate JSON metadata files\n  -v, --verbose         Verbose output\n  --describe            Generate VLM descriptions for images (requires Ollama)\n  --agent               Run Claude agent for cleanup (requires Claude Code)\n  --whisper-model TEXT  Whisper model for audio (default: turbo)\n  --ollama-host TEXT    Ollama server URL\n  --vlm-model TEXT      VLM model for image descriptions\n  --help                Show this message and exit.",
+    'batch': "Usage: ingestor batch [OPTIONS] FOLDER\n\n  Process all supported files in a folder.\n\n  Also processes .url files containing URLs to crawl.\n\nOptions:\n  -o, --output PATH             Output directory\n  --keep-raw                    Keep original image formats (don't convert to\n                                PNG)\n  --img-to TEXT                 Target image format (default: png)\n  --metadata                    Generate JSON metadata files\n  -v, --verbose                 Verbose output\n  --describe                    Generate VLM descriptions for images (requires\n                                Ollama)\n  --agent                       Run Claude agent for cleanup (requires Claude\n                                Code)\n  --recursive / --no-recursive  Process subdirectories\n  --concurrency INTEGER         Max concurrent extractions\n  --help                        Show this message and exit.",
+    'crawl': 'Usage: ingestor crawl [OPTIONS] URL\n\n  Deep crawl a website and convert to markdown.\n\n  Crawls the URL and all linked pages up to max-depth.\n\nOptions:\n  -o, --output PATH               Output directory\n  --strategy [bfs|dfs|bestfirst]  Crawl strategy\n  --max-depth INTEGER             Maximum crawl depth\n  --max-pages INTEGER             Maximum pages to crawl\n  --include TEXT                  URL patterns to include\n  --exclude TEXT                  URL patterns to exclude\n  --domain TEXT                   Restrict to domain\n  --metadata                      Generate JSON metadata files\n  -v, --verbose                   Verbose output\n  --help                          Show this message and exit.',
+    'clone': 'Usage: ingestor clone [OPTIONS] REPO\n\n  Clone and ingest a git repository.\n\n  REPO can be: - HTTPS URL: https://github.com/user/repo - SSH URL:\n  git@github.com:user/repo.git - Local path: /path/to/local/repo - .download_git\n  file: repos.download_git\n\n  Examples:     ingestor clone https://github.com/pallets/flask     ingestor\n  clone git@github.com:user/private-repo.git --token $TOKEN     ingestor clone\n  ./repos.download_git --max-files 200\n\nOptions:\n  -o, --output PATH        Output directory\n  --shallow / --full       Use shallow clone (default: shallow)\n  --depth INTEGER          Clone depth for shallow clones\n  --branch TEXT            Clone specific branch\n  --tag TEXT               Clone specific tag\n  --commit TEXT            Checkout specific commit after clone\n  --token TEXT             Git token for private repos\n  --submodules             Include git submodules\n  --max-files INTEGER      Maximum files to process\n  --max-file-size INTEGER  Maximum file size in bytes\n  --include-binary         Include binary file metadata\n  --metadata               Generate JSON metadata files\n  -v, --verbose            Verbose output\n  --help                   Show this message and exit.',
+    'describe': 'Usage: ingestor describe [OPTIONS] INPUT\n\n  Generate VLM descriptions for images.\n\n  INPUT can be an image file or folder of images.\n\nOptions:\n  --vlm-model TEXT       VLM model for image descriptions\n  --ollama-host TEXT     Ollama server URL\n  -v, --verbose          Verbose output\n  --concurrency INTEGER  Max concurrent VLM requests\n  --help                 Show this message and exit.',
+}
@@ -1,5 +1,6 @@
 """Ollama VLM for generating image descriptions."""
 
+import asyncio
 import base64
 from pathlib import Path
 from typing import Any
@@ -76,7 +77,10 @@ class OllamaVLM:
 
         client = self._get_client()
 
-        response = client.generate(
+        # The Ollama client is blocking; run it off the event loop so
+        # concurrent describe calls actually overlap.
+        response = await asyncio.to_thread(
+            client.generate,
             model=self.model,
             prompt=prompt,
             images=[img_b64],
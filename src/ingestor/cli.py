@@ -1,12 +1,17 @@
 """Command-line interface for ingestor."""
 
-import asyncio
+import contextlib
+import functools
+import inspect
+import os
+import re
+import stat
 import sys
+from collections.abc import Coroutine, Iterator
 from pathlib import Path
+from typing import Any
 
 import click
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from . import __version__
 from .types import IngestConfig
@@ -15,32 +20,356 @@ from .types import IngestConfig
 _IS_WINDOWS = sys.platform == "win32"
 _SPINNER = "line" if _IS_WINDOWS else "dots"  # "line" uses ASCII: -\|/
 
-console = Console(force_terminal=not _IS_WINDOWS)
+# Image types handled by the describe command
+_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp"})
+
+# Page writes allowed in flight while a crawl streams results
+_CRAWL_WRITE_CONCURRENCY = 4
+
+# Progress bars are redrawn at most this many times over a run
+_PROGRESS_STEPS = 40
+
+
+# The Rich style tags the CLI's messages use. Only these are stripped from
+# plain output, so bracketed text like [draft] in a file name is kept.
+_MARKUP_TAG = re.compile(r"\[/?(?:bold|green|red)\]")
+
+
+@functools.cache
+def _get_console(stderr: bool = False) -> Any:
+    """Create the console for stdout (or stderr) on first use.
+
+    Rich is only used when the stream is a terminal. Redirected output
+    gets a plain console that writes text without markup or ANSI codes.
+    Automatic highlighting is off: it regex-scans every printed string
+    for numbers, paths and URLs, and output here is styled explicitly.
+    """
+    stream = sys.stderr if stderr else sys.stdout
+    if not stream.isatty():
+        return _PlainConsole(stderr)
+
+    from rich.console import Console
+
+    return Console(stderr=stderr, highlight=False)
+
+
+def _progress_console(stderr: bool = False) -> Any:
+    """Return a Rich console suitable for a Progress display."""
+    console = _get_console(stderr)
+    return console.rich if isinstance(console, _PlainConsole) else console
+
+
+def _make_progress(*columns: Any, stderr: bool = False) -> Any:
+    """Build a Progress display with the CLI's spinner and description.
+
+    Args:
+        *columns: Extra columns shown after the description
+        stderr: Render on stderr instead of stdout
+
+    Returns:
+        A Rich Progress instance
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(spinner_name=_SPINNER),
+        TextColumn("[progress.description]{task.description}"),
+        *columns,
+        console=_progress_console(stderr),
+    )
+
+
+@functools.cache
+def _spinner_progress() -> Any:
+    """Create the spinner display shared by every command in the process."""
+    return _make_progress()
+
+
+@contextlib.contextmanager
+def _spinner(description: str) -> Iterator[tuple[Any, Any]]:
+    """Show a task on the shared spinner display.
+
+    The display is built once per process; each use only adds a task,
+    runs the display while the block executes, and removes the task
+    afterwards so the next command starts clean.
+
+    Yields:
+        (progress, task_id) for updating the description
+    """
+    progress = _spinner_progress()
+    task = progress.add_task(description, total=None)
+    progress.start()
+    try:
+        yield progress, task
+    finally:
+        progress.stop()
+        progress.remove_task(task)
+
+
+class _PlainConsole:
+    """Minimal stand-in for a Rich console when output is not a terminal.
+
+    Strings are written with markup tags stripped; anything else (tables,
+    progress displays) is handed to a Rich console that auto-detects the
+    stream, so Rich is only imported when such output is produced.
+    """
+
+    def __init__(self, stderr: bool = False):
+        self._stderr = stderr
+
+    @property
+    def _stream(self) -> Any:
+        # Looked up on each write so redirection (e.g. CliRunner) is honoured
+        return sys.stderr if self._stderr else sys.stdout
+
+    @functools.cached_property
+    def rich(self) -> Any:
+        """Rich console for renderables, without forced terminal output."""
+        from rich.console import Console
+
+        return Console(stderr=self._stderr, highlight=False)
+
+    def print(self, *objects: Any, sep: str = " ", end: str = "\n", **kwargs: Any) -> None:
+        """Write objects, stripping markup from strings."""
+        if not all(isinstance(obj, str) for obj in objects):
+            self.rich.print(*objects, sep=sep, end=end, **kwargs)
+            return
+        self._stream.write(_MARKUP_TAG.sub("", sep.join(objects)) + end)
+
+    def print_exception(self, **kwargs: Any) -> None:
+        """Write the current exception's traceback."""
+        import traceback
+
+        traceback.print_exc(file=self._stream)
+
+
+def _info_console(piped: bool) -> Any:
+    """Console for human-readable messages.
+
+    When stdout is piped it carries JSON lines only, so messages go to
+    stderr instead.
+    """
+    return _get_console(stderr=True) if piped else _get_console()
+
+
+def _json_dumps(record: dict[str, Any]) -> str:
+    """Serialize a status record, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(record, default=str)
+    return orjson.dumps(record, default=str).decode()
+
+
+class _LazyConsole:
+    """Proxy that defers importing Rich until something is printed.
+
+    Keeps Rich (and pygments) off the import path for invocations that
+    never print, such as ``--help``.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_get_console(), name)
+
+
+console = _LazyConsole()
+
+
+class _StatusBuffer:
+    """Collect per-file status lines and print them in periodic batches.
+
+    Printing one line per file makes Rich re-render and flush for every
+    result; batching at ~30 Hz keeps large runs smooth. A flush is only
+    scheduled once a line is pending, so an idle run does no wakeups.
+    When stdout is piped, records are written as JSON lines instead,
+    bypassing Rich, and flushed only when the buffer fills or on exit.
+    Use as an async context manager so pending lines are flushed on exit.
+    """
+
+    FLUSH_INTERVAL = 0.032  # seconds
+    MAX_CHARS = 1 << 20  # flush early if this much text is pending
+
+    def __init__(self, piped: bool = False):
+        self.piped = piped
+        self._lines: list[str] = []
+        self._chars = 0
+        self._loop: Any = None
+        self._timer: Any = None
+
+    def add(self, record: dict[str, Any], line: str | None = None) -> None:
+        """Queue a status record for the next flush.
+
+        Args:
+            record: Machine-readable status, emitted as JSON when piped
+            line: Rich markup shown on a terminal (None to show nothing)
+        """
+        if self.piped:
+            line = _json_dumps(record)
+        elif line is None:
+            return
+        self._lines.append(line)
+        self._chars += len(line)
+        if self._chars >= self.MAX_CHARS:
+            self.flush()
+        elif self._timer is None and self._loop is not None:
+            self._timer = self._loop.call_later(self.FLUSH_INTERVAL, self.flush)
+
+    def flush(self) -> None:
+        """Print all pending lines at once."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._lines:
+            return
+        if self.piped:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+        else:
+            console.print("\n".join(self._lines))
+        self._lines.clear()
+        self._chars = 0
+
+    async def __aenter__(self) -> "_StatusBuffer":
+        import asyncio
+
+        if not self.piped:
+            self._loop = asyncio.get_running_loop()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.flush()
+        self._loop = None
+
+
+# CLI parameter name -> IngestConfig field
+_CONFIG_PARAMS = {
+    "output": "output_dir",
+    "keep_raw": "keep_raw_images",
+    "img_to": "target_image_format",
+    "metadata": "generate_metadata",
+    "verbose": "verbose",
+    "describe": "describe_images",
+    "agent": "use_agent",
+    "strategy": "crawl_strategy",
+    "max_depth": "crawl_max_depth",
+    "max_pages": "crawl_max_pages",
+    "captions": "youtube_captions",
+    "playlist": "youtube_playlist",
+    "whisper_model": "whisper_model",
+    "ollama_host": "ollama_host",
+    "vlm_model": "vlm_model",
+}
 
 
 def create_config(ctx: click.Context) -> IngestConfig:
-    """Create IngestConfig from CLI context."""
+    """Create IngestConfig from CLI context.
+
+    The config is built once per context and cached on ``ctx.obj``.
+    Options a command does not define fall back to IngestConfig defaults.
+    """
+    cache = ctx.ensure_object(dict)
+    if "config" in cache:
+        return cache["config"]
+
     params = ctx.params
-    return IngestConfig(
-        output_dir=Path(params.get("output", "./output")),
-        keep_raw_images=params.get("keep_raw", False),
-        target_image_format=params.get("img_to", "png"),
-        generate_metadata=params.get("metadata", False),
-        verbose=params.get("verbose", False),
-        describe_images=params.get("describe", False),
-        use_agent=params.get("agent", False),
-        crawl_strategy=params.get("strategy", "bfs"),
-        crawl_max_depth=params.get("max_depth", 2),
-        crawl_max_pages=params.get("max_pages", 50),
-        youtube_captions=params.get("captions", "auto"),
-        youtube_playlist=params.get("playlist", False),
-        whisper_model=params.get("whisper_model", "turbo"),
-        ollama_host=params.get("ollama_host", "http://localhost:11434"),
-        vlm_model=params.get("vlm_model", "llava:7b"),
-    )
+    fields = {
+        field: params[param]
+        for param, field in _CONFIG_PARAMS.items()
+        if params.get(param) is not None
+    }
+
+    config = IngestConfig(**fields)
+    cache["config"] = config
+    return config
+
+
+# Options shared by several commands, applied by name with _options()
+_SHARED_OPTIONS = {
+    "output": click.option(
+        "-o", "--output", type=click.Path(), default="./output", help="Output directory"
+    ),
+    "keep_raw": click.option(
+        "--keep-raw", is_flag=True, help="Keep original image formats (don't convert to PNG)"
+    ),
+    "img_to": click.option(
+        "--img-to", type=str, default="png", help="Target image format (default: png)"
+    ),
+    "metadata": click.option("--metadata", is_flag=True, help="Generate JSON metadata files"),
+    "verbose": click.option("-v", "--verbose", is_flag=True, help="Verbose output"),
+    "describe": click.option(
+        "--describe", is_flag=True, help="Generate VLM descriptions for images (requires Ollama)"
+    ),
+    "agent": click.option(
+        "--agent", is_flag=True, help="Run Claude agent for cleanup (requires Claude Code)"
+    ),
+    "ollama_host": click.option(
+        "--ollama-host", type=str, default="http://localhost:11434", help="Ollama server URL"
+    ),
+    "vlm_model": click.option(
+        "--vlm-model", type=str, default="llava:7b", help="VLM model for image descriptions"
+    ),
+}
+
+
+def _options(*names: str):
+    """Apply shared options by name, listed in the order they appear in --help."""
+
+    def decorator(f):
+        for name in reversed(names):
+            f = _SHARED_OPTIONS[name](f)
+        return f
+
+    return decorator
+
+
+class _AsyncCommand(click.Command):
+    """Click command whose callback may be a coroutine function."""
+
+    def invoke(self, ctx: click.Context) -> Any:
+        rv = super().invoke(ctx)
+        if not inspect.isawaitable(rv):
+            return rv
+
+        # Click closes the context when invoke returns, before the body
+        # runs; hold it open until the coroutine finishes so call_on_close
+        # and with_resource cleanups run after the command, not before
+        stack = contextlib.ExitStack()
+        stack.enter_context(ctx)
+
+        async def run() -> Any:
+            # Enter again so ctx is click's current context during the body
+            with stack, ctx:
+                return await rv
+
+        return run()
+
+
+class _AsyncGroup(click.Group):
+    """Click group whose commands are coroutine functions.
+
+    The whole dispatch runs inside a single event loop, so each command
+    body is awaited directly rather than starting its own loop.
+    """
+
+    command_class = _AsyncCommand
+
+    def invoke(self, ctx: click.Context) -> Any:
+        async def dispatch() -> Any:
+            from .core.http import shared_http_client
 
+            # One pooled HTTP client for every extractor the command uses
+            async with shared_http_client():
+                rv = super(_AsyncGroup, self).invoke(ctx)
+                if inspect.isawaitable(rv):
+                    rv = await rv
+                return rv
 
-@click.group()
+        return _run(dispatch())
+
+
+@click.group(cls=_AsyncGroup)
 @click.version_option(version=__version__)
 def main():
     """Ingestor - Comprehensive media-to-markdown ingestion for LLM RAG."""
@@ -49,176 +378,205 @@ def main():
 
 @main.command()
 @click.argument("input", type=str)
-@click.option("-o", "--output", type=click.Path(), default="./output", help="Output directory")
-@click.option("--keep-raw", is_flag=True, help="Keep original image formats (don't convert to PNG)")
-@click.option("--img-to", type=str, default="png", help="Target image format (default: png)")
-@click.option("--metadata", is_flag=True, help="Generate JSON metadata files")
-@click.option("-v", "--verbose", is_flag=True, help="Verbose output")
-@click.option("--describe", is_flag=True, help="Generate VLM descriptions for images (requires Ollama)")
-@click.option("--agent", is_flag=True, help="Run Claude agent for cleanup (requires Claude Code)")
+@_options("output", "keep_raw", "img_to", "metadata", "verbose", "describe", "agent")
 @click.option("--whisper-model", type=str, default="turbo", help="Whisper model for audio (default: turbo)")
-@click.option("--ollama-host", type=str, default="http://localhost:11434", help="Ollama server URL")
-@click.option("--vlm-model", type=str, default="llava:7b", help="VLM model for image descriptions")
+@_options("ollama_host", "vlm_model")
 @click.pass_context
-def ingest(ctx: click.Context, input: str, **kwargs):
+async def ingest(ctx: click.Context, input: str, **kwargs):
     """Ingest a single file or URL.
 
     INPUT can be a file path or URL (including YouTube URLs).
     """
+    from .core import Router
+    from .output.writer import OutputWriter
+
     config = create_config(ctx)
 
-    async def run():
-        from .core import Router
-        from .output.writer import OutputWriter
-
-        # Initialize registry with available extractors
-        registry = _create_registry()
-        router = Router(registry, config)
-        writer = OutputWriter(config)
-
-        # Check if we can process this input
-        if not router.can_process(input):
-            media_type = router.detect_type(input)
-            console.print(f"[red]Error:[/red] No extractor available for {input}")
-            console.print(f"Detected type: {media_type.value}")
-            console.print("\nMake sure you have installed the required dependencies:")
-            console.print(f"  pip install ingestor[{media_type.value}]")
-            raise SystemExit(1)
-
-        with Progress(
-            SpinnerColumn(spinner_name=_SPINNER),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Processing {input}...", total=None)
+    # Initialize registry with available extractors
+    registry = _create_registry()
+    router = Router(registry, config)
+    writer = OutputWriter(config)
 
-            try:
-                result = await router.process(input)
-                progress.update(task, description="Writing output...")
-                output_path = await writer.write(result)
-                progress.update(task, completed=True, description="Done!")
+    # Check if we can process this input
+    if not router.can_process(input):
+        media_type = router.detect_type(input)
+        console.print(f"[red]Error:[/red] No extractor available for {input}")
+        console.print(f"Detected type: {media_type.value}")
+        console.print("\nMake sure you have installed the required dependencies:")
+        console.print(f"  pip install ingestor[{media_type.value}]")
+        raise SystemExit(1)
 
-                console.print(f"\n[green]Success![/green] Output written to: {output_path}")
-                if result.has_images:
-                    console.print(f"  Images: {result.image_count}")
+    with _spinner(f"Processing {input}...") as (progress, task):
 
-            except Exception as e:
-                progress.stop()
-                console.print(f"[red]Error:[/red] {e}")
-                if config.verbose:
-                    console.print_exception()
-                raise SystemExit(1) from e
-
-    asyncio.run(run())
+        try:
+            result = await router.process(input)
+            if progress.console.is_terminal:
+                progress.update(task, description="Writing output...")
+            output_path = await writer.write(result)
+            progress.update(task, completed=True, description="Done!")
+
+            console.print(f"\n[green]Success![/green] Output written to: {output_path}")
+            if result.has_images:
+                console.print(f"  Images: {result.image_count}")
+
+        except Exception as e:
+            progress.stop()
+            console.print(f"[red]Error:[/red] {e}")
+            if config.verbose:
+                console.print_exception()
+            raise SystemExit(1) from e
 
 
 @main.command()
-@click.argument("folder", type=click.Path(exists=True))
-@click.option("-o", "--output", type=click.Path(), default="./output", help="Output directory")
-@click.option("--keep-raw", is_flag=True, help="Keep original image formats")
-@click.option("--img-to", type=str, default="png", help="Target image format")
-@click.option("--metadata", is_flag=True, help="Generate JSON metadata files")
-@click.option("-v", "--verbose", is_flag=True, help="Verbose output")
-@click.option("--describe", is_flag=True, help="Generate VLM descriptions")
-@click.option("--agent", is_flag=True, help="Run Claude agent for cleanup")
+@click.argument("folder", type=click.Path())
+@_options("output", "keep_raw", "img_to", "metadata", "verbose", "describe", "agent")
 @click.option("--recursive/--no-recursive", default=True, help="Process subdirectories")
 @click.option("--concurrency", type=int, default=5, help="Max concurrent extractions")
 @click.pass_context
-def batch(ctx: click.Context, folder: str, recursive: bool, concurrency: int, **kwargs):
+async def batch(ctx: click.Context, folder: str, recursive: bool, concurrency: int, **kwargs):
     """Process all supported files in a folder.
 
     Also processes .url files containing URLs to crawl.
     """
-    config = create_config(ctx)
+    import asyncio
 
-    async def run():
-        from .core import Router
-        from .output.writer import OutputWriter
+    from .core import Router
+    from .output.writer import OutputWriter
 
-        registry = _create_registry()
-        router = Router(registry, config)
-        writer = OutputWriter(config)
+    if not stat.S_ISDIR(_stat_input(ctx, folder, "FOLDER").st_mode):
+        raise click.BadParameter(f"Directory '{folder}' is a file.", ctx=ctx, param_hint="'FOLDER'")
 
-        console.print(f"Processing folder: {folder}")
-        console.print(f"Recursive: {recursive}, Concurrency: {concurrency}")
+    config = create_config(ctx)
 
-        count = 0
-        errors = 0
+    registry = _create_registry()
+    router = Router(registry, config)
+    writer = OutputWriter(config)
 
-        async for result in router.process_directory(folder, recursive, concurrency):
-            try:
-                output_path = await writer.write(result)
-                count += 1
-                console.print(f"  [green]OK[/green] {result.source} -> {output_path}")
-            except Exception as e:
-                errors += 1
-                console.print(f"  [red]ERROR[/red] {result.source}: {e}")
+    piped = not sys.stdout.isatty()
+    info = _info_console(piped)
+    info.print(f"Processing folder: {folder}")
+    info.print(f"Recursive: {recursive}, Concurrency: {concurrency}")
+
+    count = 0
+    failures: list[tuple[str | None, BaseException]] = []
 
-        console.print(f"\nCompleted: {count} files, {errors} errors")
+    async def write_one(result):
+        # Failures are recorded, not raised, so one bad file neither
+        # cancels the TaskGroup nor costs a render per error.
+        nonlocal count
+        try:
+            output_path = await writer.write(result)
+        except Exception as e:
+            failures.append((result.source, e))
+            status.add({"source": result.source, "status": "error", "error": str(e)})
+        else:
+            count += 1
+            status.add(
+                {"source": result.source, "output": output_path, "status": "ok"},
+                f"  [green]OK[/green] {result.source} -> {output_path}",
+            )
+
+    # Overlap writes with ongoing extraction; the semaphore caps the
+    # number of pending writes so memory stays O(concurrency).
+    write_slots = asyncio.Semaphore(concurrency)
+    async with _StatusBuffer(piped) as status, asyncio.TaskGroup() as tg:
+        async for result in router.process_directory(folder, recursive, concurrency):
+            await write_slots.acquire()
+            task = tg.create_task(write_one(result))
+            task.add_done_callback(lambda _: write_slots.release())
 
-    asyncio.run(run())
+    if failures:
+        _print_failures(failures, info)
+    info.print(f"\nCompleted: {count} files, {len(failures)} errors")
 
 
 @main.command()
 @click.argument("url", type=str)
-@click.option("-o", "--output", type=click.Path(), default="./output", help="Output directory")
+@_options("output")
 @click.option("--strategy", type=click.Choice(["bfs", "dfs", "bestfirst"]), default="bfs", help="Crawl strategy")
 @click.option("--max-depth", type=int, default=2, help="Maximum crawl depth")
 @click.option("--max-pages", type=int, default=50, help="Maximum pages to crawl")
 @click.option("--include", type=str, multiple=True, help="URL patterns to include")
 @click.option("--exclude", type=str, multiple=True, help="URL patterns to exclude")
 @click.option("--domain", type=str, help="Restrict to domain")
-@click.option("--metadata", is_flag=True, help="Generate JSON metadata")
-@click.option("-v", "--verbose", is_flag=True, help="Verbose output")
+@_options("metadata", "verbose")
 @click.pass_context
-def crawl(ctx: click.Context, url: str, **kwargs):
+async def crawl(ctx: click.Context, url: str, **kwargs):
     """Deep crawl a website and convert to markdown.
 
     Crawls the URL and all linked pages up to max-depth.
     """
-    config = create_config(ctx)
+    import asyncio
 
-    async def run():
-        from .output.writer import OutputWriter
+    from rich.progress import BarColumn, MofNCompleteColumn
 
-        registry = _create_registry()
-        writer = OutputWriter(config)
+    from .output.writer import OutputWriter
 
-        # Get web extractor
-        from .types import MediaType
-        extractor = registry.get(MediaType.WEB)
-        if extractor is None:
-            console.print("[red]Error:[/red] Web extractor not available")
-            console.print("Install with: pip install ingestor[web]")
-            raise SystemExit(1)
+    config = create_config(ctx)
 
-        console.print(f"Crawling: {url}")
-        console.print(f"Strategy: {config.crawl_strategy}, Max depth: {config.crawl_max_depth}")
+    registry = _create_registry()
+    writer = OutputWriter(config)
 
-        # Configure extractor with crawl settings
-        extractor.strategy = config.crawl_strategy
-        extractor.max_depth = config.crawl_max_depth
-        extractor.max_pages = config.crawl_max_pages
+    # Get web extractor
+    from .types import MediaType
+    extractor = registry.get(MediaType.WEB)
+    if extractor is None:
+        console.print("[red]Error:[/red] Web extractor not available")
+        console.print("Install with: pip install ingestor[web]")
+        raise SystemExit(1)
 
-        count = 0
-        results = await extractor.crawl_deep(url)
-        for result in results:
-            try:
-                await writer.write(result)
-                count += 1
-                depth = result.metadata.get("depth", 0)
-                console.print(f"  [green]OK[/green] [depth={depth}] {result.source}")
-            except Exception as e:
-                console.print(f"  [red]ERROR[/red] {result.source}: {e}")
+    piped = not sys.stdout.isatty()
+    info = _info_console(piped)
+    info.print(f"Crawling: {url}")
+    info.print(f"Strategy: {config.crawl_strategy}, Max depth: {config.crawl_max_depth}")
 
-        console.print(f"\nCrawled {count} pages")
+    # Configure extractor with crawl settings
+    extractor.strategy = config.crawl_strategy
+    extractor.max_depth = config.crawl_max_depth
+    extractor.max_pages = config.crawl_max_pages
 
-    asyncio.run(run())
+    count = 0
+    pages = 0
+
+    async def write_one(result):
+        nonlocal count
+        try:
+            output_path = await writer.write(result)
+            count += 1
+            depth = result.metadata.get("depth", 0)
+            status.add(
+                {"source": result.source, "output": output_path, "depth": depth, "status": "ok"},
+                f"  [green]OK[/green] [depth={depth}] {result.source}",
+            )
+        except Exception as e:
+            status.add(
+                {"source": result.source, "status": "error", "error": str(e)},
+                f"  [red]ERROR[/red] {result.source}: {e}",
+            )
+
+    with _make_progress(BarColumn(), MofNCompleteColumn(), stderr=piped) as progress:
+        task = progress.add_task("Crawling...", total=config.crawl_max_pages)
+        # Advance the bar in ~_PROGRESS_STEPS increments rather than per page
+        step = max(1, config.crawl_max_pages // _PROGRESS_STEPS)
+
+        # Write pages while the crawl continues; bound pending writes
+        write_slots = asyncio.Semaphore(_CRAWL_WRITE_CONCURRENCY)
+        async with _StatusBuffer(piped) as status, asyncio.TaskGroup() as tg:
+            async for result in extractor.crawl_deep(url):
+                await write_slots.acquire()
+                write_task = tg.create_task(write_one(result))
+                write_task.add_done_callback(lambda _: write_slots.release())
+                pages += 1
+                if pages % step == 0:
+                    progress.update(task, completed=pages)
+        progress.update(task, total=pages, completed=pages, description="Done!")
+
+    info.print(f"\nCrawled {count} pages")
 
 
 @main.command()
 @click.argument("repo", type=str)
-@click.option("-o", "--output", type=click.Path(), default="./output", help="Output directory")
+@_options("output")
 @click.option("--shallow/--full", default=True, help="Use shallow clone (default: shallow)")
 @click.option("--depth", type=int, default=1, help="Clone depth for shallow clones")
 @click.option("--branch", type=str, help="Clone specific branch")
@@ -229,10 +587,9 @@ def crawl(ctx: click.Context, url: str, **kwargs):
 @click.option("--max-files", type=int, default=500, help="Maximum files to process")
 @click.option("--max-file-size", type=int, default=500000, help="Maximum file size in bytes")
 @click.option("--include-binary", is_flag=True, help="Include binary file metadata")
-@click.option("--metadata", is_flag=True, help="Generate JSON metadata files")
-@click.option("-v", "--verbose", is_flag=True, help="Verbose output")
+@_options("metadata", "verbose")
 @click.pass_context
-def clone(ctx: click.Context, repo: str, **kwargs):
+async def clone(ctx: click.Context, repo: str, **kwargs):
     """Clone and ingest a git repository.
 
     REPO can be:
@@ -246,223 +603,209 @@ def clone(ctx: click.Context, repo: str, **kwargs):
         ingestor clone git@github.com:user/private-repo.git --token $TOKEN
         ingestor clone ./repos.download_git --max-files 200
     """
+    from .extractors.git.git_extractor import GitExtractor, GitRepoConfig
+    from .output.writer import OutputWriter
+
     config = create_config(ctx)
 
-    async def run():
-        from .extractors.git.git_extractor import GitExtractor, GitRepoConfig
-        from .output.writer import OutputWriter
-
-        # Create git-specific config
-        git_config = GitRepoConfig(
-            shallow=kwargs.get("shallow", True),
-            depth=kwargs.get("depth", 1),
-            branch=kwargs.get("branch"),
-            tag=kwargs.get("tag"),
-            commit=kwargs.get("commit"),
-            include_submodules=kwargs.get("submodules", False),
-            max_total_files=kwargs.get("max_files", 500),
-            max_file_size=kwargs.get("max_file_size", 500000),
-            include_binary_metadata=kwargs.get("include_binary", False),
-        )
-
-        # Create registry for nested extractions
-        registry = _create_registry()
-
-        extractor = GitExtractor(
-            config=git_config,
-            token=kwargs.get("token"),
-            registry=registry,
-        )
-        writer = OutputWriter(config)
-
-        console.print(f"Cloning repository: {repo}")
-        if git_config.branch:
-            console.print(f"  Branch: {git_config.branch}")
-        if git_config.tag:
-            console.print(f"  Tag: {git_config.tag}")
-        if git_config.shallow:
-            console.print(f"  Shallow clone: depth={git_config.depth}")
-
-        with Progress(
-            SpinnerColumn(spinner_name=_SPINNER),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Cloning and processing...", total=None)
+    # Create git-specific config
+    git_config = GitRepoConfig(
+        shallow=kwargs.get("shallow", True),
+        depth=kwargs.get("depth", 1),
+        branch=kwargs.get("branch"),
+        tag=kwargs.get("tag"),
+        commit=kwargs.get("commit"),
+        include_submodules=kwargs.get("submodules", False),
+        max_total_files=kwargs.get("max_files", 500),
+        max_file_size=kwargs.get("max_file_size", 500000),
+        include_binary_metadata=kwargs.get("include_binary", False),
+    )
 
-            try:
-                result = await extractor.extract(repo)
-                progress.update(task, description="Writing output...")
-                output_path = await writer.write(result)
-                progress.update(task, completed=True, description="Done!")
+    # Create registry for nested extractions
+    registry = _create_registry()
 
-                console.print(f"\n[green]Success![/green] Output written to: {output_path}")
-                file_count = result.metadata.get("file_count", 0)
-                console.print(f"  Files processed: {file_count}")
-                if result.metadata.get("skipped_count"):
-                    console.print(f"  Files skipped: {result.metadata['skipped_count']}")
-                if result.has_images:
-                    console.print(f"  Images: {result.image_count}")
+    extractor = GitExtractor(
+        config=git_config,
+        token=kwargs.get("token"),
+        registry=registry,
+    )
+    writer = OutputWriter(config)
 
-            except Exception as e:
-                progress.stop()
-                console.print(f"[red]Error:[/red] {e}")
-                if config.verbose:
-                    console.print_exception()
-                raise SystemExit(1) from e
+    console.print(f"Cloning repository: {repo}")
+    if git_config.branch:
+        console.print(f"  Branch: {git_config.branch}")
+    if git_config.tag:
+        console.print(f"  Tag: {git_config.tag}")
+    if git_config.shallow:
+        console.print(f"  Shallow clone: depth={git_config.depth}")
 
-    asyncio.run(run())
+    with _spinner("Cloning and processing...") as (progress, task):
+
+        try:
+            result = await extractor.extract(repo)
+            progress.update(task, description="Writing output...")
+            output_path = await writer.write(result)
+            progress.update(task, completed=True, description="Done!")
+
+            console.print(f"\n[green]Success![/green] Output written to: {output_path}")
+            file_count = result.metadata.get("file_count", 0)
+            console.print(f"  Files processed: {file_count}")
+            if result.metadata.get("skipped_count"):
+                console.print(f"  Files skipped: {result.metadata['skipped_count']}")
+            if result.has_images:
+                console.print(f"  Images: {result.image_count}")
+
+        except Exception as e:
+            progress.stop()
+            console.print(f"[red]Error:[/red] {e}")
+            if config.verbose:
+                console.print_exception()
+            raise SystemExit(1) from e
 
 
 @main.command()
-@click.argument("input", type=click.Path(exists=True))
-@click.option("--vlm-model", type=str, default="llava:7b", help="VLM model")
-@click.option("--ollama-host", type=str, default="http://localhost:11434", help="Ollama server")
-@click.option("-v", "--verbose", is_flag=True, help="Verbose output")
-def describe(input: str, vlm_model: str, ollama_host: str, verbose: bool):
+@click.argument("input", type=click.Path())
+@_options("vlm_model", "ollama_host", "verbose")
+@click.option("--concurrency", type=int, default=5, help="Max concurrent VLM requests")
+@click.pass_context
+async def describe(
+    ctx: click.Context, input: str, vlm_model: str, ollama_host: str, verbose: bool, concurrency: int
+):
     """Generate VLM descriptions for images.
 
     INPUT can be an image file or folder of images.
     """
-    async def run():
-        try:
-            from .ai.ollama.vlm import VLMDescriber
-        except ImportError as e:
-            console.print("[red]Error:[/red] VLM dependencies not installed")
-            console.print("Install with: pip install ingestor[vlm]")
-            raise SystemExit(1) from e
+    import asyncio
 
-        describer = VLMDescriber(host=ollama_host, model=vlm_model)
-        input_path = Path(input)
+    input_stat = _stat_input(ctx, input, "INPUT")
 
-        if input_path.is_file():
-            images = [input_path]
-        else:
-            images = list(input_path.glob("**/*"))
-            images = [p for p in images if p.suffix.lower() in {".png", ".jpg", ".jpeg", ".gif", ".webp"}]
+    try:
+        from .ai.ollama.vlm import VLMDescriber
+    except ImportError as e:
+        console.print("[red]Error:[/red] VLM dependencies not installed")
+        console.print("Install with: pip install ingestor[vlm]")
+        raise SystemExit(1) from e
 
-        console.print(f"Describing {len(images)} image(s)...")
+    describer = VLMDescriber(host=ollama_host, model=vlm_model)
+    input_path = Path(input)
 
-        for img_path in images:
-            try:
-                description = await describer.describe_file(img_path)
-                console.print(f"\n[bold]{img_path.name}[/bold]")
-                console.print(description)
-            except Exception as e:
-                console.print(f"[red]Error[/red] {img_path.name}: {e}")
+    if not stat.S_ISDIR(input_stat.st_mode):
+        images = [input_path]
+    else:
+        images = list(_iter_images(input_path))
 
-    asyncio.run(run())
-
-def _create_registry():
-    """Create and populate the extractor registry."""
-    from .core import ExtractorRegistry
+    console.print(f"Describing {len(images)} image(s)...")
 
-    registry = ExtractorRegistry()
+    semaphore = asyncio.Semaphore(concurrency)
 
-    # Try to import and register each extractor
-    # These will fail silently if dependencies aren't installed
+    async def describe_one(img_path: Path) -> tuple[Path, str | Exception]:
+        async with semaphore:
+            try:
+                return img_path, await describer.describe_file(img_path)
+            except Exception as e:
+                return img_path, e
 
-    try:
-        from .extractors.text.txt_extractor import TxtExtractor
-        registry.register(TxtExtractor())
-    except ImportError:
-        pass
+    # Print each description as soon as it arrives rather than after the slowest
+    for next_done in asyncio.as_completed([describe_one(p) for p in images]):
+        img_path, description = await next_done
+        if isinstance(description, Exception):
+            console.print(f"[red]Error[/red] {img_path.name}: {description}")
+        else:
+            console.print(f"\n[bold]{img_path.name}[/bold]")
+            console.print(description)
 
-    try:
-        from .extractors.pdf.pdf_extractor import PdfExtractor
-        registry.register(PdfExtractor())
-    except ImportError:
-        pass
 
-    try:
-        from .extractors.docx.docx_extractor import DocxExtractor
-        registry.register(DocxExtractor())
-    except ImportError:
-        pass
+def _stat_input(ctx: click.Context, path: str, param_hint: str) -> os.stat_result:
+    """Stat a path argument once, in place of ``click.Path(exists=True)``.
 
-    try:
-        from .extractors.pptx.pptx_extractor import PptxExtractor
-        registry.register(PptxExtractor())
-    except ImportError:
-        pass
+    Commands branch on the returned result instead of re-statting.
 
+    Raises:
+        click.BadParameter: If the path does not exist or cannot be read
+    """
     try:
-        from .extractors.epub.epub_extractor import EpubExtractor
-        registry.register(EpubExtractor())
-    except ImportError:
-        pass
+        return os.stat(path)
+    except OSError as e:
+        reason = "does not exist" if isinstance(e, FileNotFoundError) else f"is not accessible: {e.strerror}"
+        raise click.BadParameter(
+            f"Path '{path}' {reason}.", ctx=ctx, param_hint=f"'{param_hint}'"
+        ) from None
 
-    try:
-        from .extractors.excel.xlsx_extractor import XlsxExtractor
-        registry.register(XlsxExtractor())
-    except ImportError:
-        pass
 
-    try:
-        from .extractors.excel.xls_extractor import XlsExtractor
-        registry.register(XlsExtractor())
-    except ImportError:
-        pass
+def _print_failures(failures: list[tuple[str | None, BaseException]], out: Any = console) -> None:
+    """Print collected per-file failures as a single table."""
+    from rich.table import Table
 
-    try:
-        from .extractors.data.csv_extractor import CsvExtractor
-        registry.register(CsvExtractor())
-    except ImportError:
-        pass
+    table = Table(title=f"{len(failures)} error(s)", title_justify="left")
+    table.add_column("Source", style="red")
+    table.add_column("Error")
+    for source, error in failures:
+        table.add_row(str(source), str(error))
+    out.print(table)
 
-    try:
-        from .extractors.data.json_extractor import JsonExtractor
-        registry.register(JsonExtractor())
-    except ImportError:
-        pass
 
-    try:
-        from .extractors.data.xml_extractor import XmlExtractor
-        registry.register(XmlExtractor())
-    except ImportError:
-        pass
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    import asyncio
 
-    try:
-        from .extractors.web.web_extractor import WebExtractor
-        registry.register(WebExtractor())
-    except ImportError:
-        pass
+    loop_factory = None
+    if not _IS_WINDOWS:
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            loop_factory = uvloop.new_event_loop
 
-    try:
-        from .extractors.youtube.youtube_extractor import YouTubeExtractor
-        registry.register(YouTubeExtractor())
-    except ImportError:
-        pass
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
 
-    try:
-        from .extractors.git.git_extractor import GitExtractor
-        from .types import MediaType
-        git_extractor = GitExtractor(registry=registry)
-        registry.register(git_extractor)
-        # Also register for GITHUB type since unified extractor handles both
-        registry._extractors[MediaType.GITHUB] = git_extractor
-    except ImportError:
-        pass
 
-    try:
-        from .extractors.audio.audio_extractor import AudioExtractor
-        registry.register(AudioExtractor())
-    except ImportError:
-        pass
+def _iter_images(root: Path) -> Iterator[Path]:
+    """Yield image files under root in a single scandir pass.
 
-    try:
-        from .extractors.archive.zip_extractor import ZipExtractor
-        registry.register(ZipExtractor(registry))
-    except ImportError:
-        pass
+    Filters on the raw entry name so no Path is built for rejected
+    entries. Symlinked directories are not followed, and a file reached
+    through several links is yielded once, so it is not described twice.
+    """
+    seen: set[tuple[int, int]] = set()
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # An unreadable folder is left out rather than ending the walk
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                # Only the suffix is lowercased. is_file() is only consulted for
+                # matching names and follows symlinks, so dangling links and
+                # linked dirs are skipped
+                if dot != -1 and name[dot:].lower() in _IMAGE_SUFFIXES and entry.is_file():
+                    st = entry.stat()
+                    file_id = (st.st_dev, st.st_ino)
+                    if file_id not in seen:
+                        seen.add(file_id)
+                        yield Path(entry.path)
+
+
+@functools.cache
+def _create_registry():
+    """Create the extractor registry.
 
-    try:
-        from .extractors.image.image_extractor import ImageExtractor
-        registry.register(ImageExtractor())
-    except ImportError:
-        pass
+    Extractors are registered lazily and only imported when a command
+    first looks them up. The registry does not depend on command options,
+    so one instance (and its file detector) is shared by every command
+    run in the process.
+    """
+    from .core import create_default_registry
 
-    return registry
+    return create_default_registry()
 
 
 if __name__ == "__main__":
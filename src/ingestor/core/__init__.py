@@ -1,9 +1,43 @@
 """Core infrastructure for the ingestor package."""
 
-from .charset import CharsetHandler
-from .detector import FileDetector
-from .registry import ExtractorRegistry, create_default_registry
-from .router import Router
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .charset import CharsetHandler
+    from .detector import FileDetector
+    from .http import http_client, shared_http_client
+    from .registry import ExtractorRegistry, create_default_registry
+    from .router import Router
+
+# Public name -> defining module. Resolved on first attribute access so
+# that an extractor importing e.g. ``core.charset`` does not also load
+# httpx, the registry and the router.
+_LAZY_EXPORTS = {
+    "FileDetector": ".detector",
+    "CharsetHandler": ".charset",
+    "ExtractorRegistry": ".registry",
+    "create_default_registry": ".registry",
+    "Router": ".router",
+    "http_client": ".http",
+    "shared_http_client": ".http",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "FileDetector",
@@ -11,4 +45,6 @@ __all__ = [
     "ExtractorRegistry",
     "create_default_registry",
     "Router",
+    "http_client",
+    "shared_http_client",
 ]
@@ -0,0 +1,25 @@
+"""Location of ingestor's on-disk caches."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Set to disable every on-disk cache
+NO_CACHE_ENV = "INGESTOR_NO_CACHE"
+
+
+def cache_dir() -> Path | None:
+    """Get the directory for ingestor's caches.
+
+    This is ``$XDG_CACHE_HOME/ingestor`` (``~/.cache/ingestor`` by
+    default). It is not created here.
+
+    Returns:
+        The directory, or None if caching is disabled with
+        ``INGESTOR_NO_CACHE``
+    """
+    if os.environ.get(NO_CACHE_ENV):
+        return None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "ingestor"
@@ -1,12 +1,27 @@
 """File type detection using Google's Magika (AI-powered, 99% accuracy)."""
 
+from __future__ import annotations
+
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from pathlib import Path
-
-from magika import Magika
+from typing import TYPE_CHECKING
 
 from ..types import MediaType
 
+if TYPE_CHECKING:
+    from magika import Magika
+
+# Bytes Magika reads from each end of a file
+_MAGIKA_BLOCK_SIZE = 4096
+
+# Magika results remembered per detector, by file content
+_CACHE_SIZE = 10_000
+
 
 class FileDetector:
     """Detect file types using Google's Magika AI model.
@@ -90,6 +105,111 @@ class FileDetector:
         "dart": MediaType.TXT,
     }
 
+    # Fallback map from file extension (without the dot) to MediaType
+    EXTENSION_TO_MEDIA_TYPE: dict[str, MediaType] = {
+        # Documents
+        "pdf": MediaType.PDF,
+        "docx": MediaType.DOCX,
+        "doc": MediaType.DOCX,
+        "pptx": MediaType.PPTX,
+        "ppt": MediaType.PPTX,
+        "xlsx": MediaType.XLSX,
+        "xls": MediaType.XLS,
+        "csv": MediaType.CSV,
+        "tsv": MediaType.CSV,
+        "epub": MediaType.EPUB,
+        # Audio
+        "mp3": MediaType.AUDIO,
+        "wav": MediaType.AUDIO,
+        "flac": MediaType.AUDIO,
+        "m4a": MediaType.AUDIO,
+        "ogg": MediaType.AUDIO,
+        "aac": MediaType.AUDIO,
+        # Data
+        "json": MediaType.JSON,
+        "xml": MediaType.XML,
+        # Archives
+        "zip": MediaType.ZIP,
+        "tar": MediaType.ZIP,
+        "gz": MediaType.ZIP,
+        "tgz": MediaType.ZIP,
+        "rar": MediaType.ZIP,
+        "7z": MediaType.ZIP,
+        # Images
+        "png": MediaType.IMAGE,
+        "jpg": MediaType.IMAGE,
+        "jpeg": MediaType.IMAGE,
+        "gif": MediaType.IMAGE,
+        "webp": MediaType.IMAGE,
+        "bmp": MediaType.IMAGE,
+        "tiff": MediaType.IMAGE,
+        "svg": MediaType.IMAGE,
+        "ico": MediaType.IMAGE,
+        # Text/Plain text
+        "txt": MediaType.TXT,
+        "text": MediaType.TXT,
+        "md": MediaType.TXT,
+        "markdown": MediaType.TXT,
+        "rst": MediaType.TXT,
+        "html": MediaType.TXT,
+        "htm": MediaType.TXT,
+        "log": MediaType.TXT,
+        "cfg": MediaType.TXT,
+        "conf": MediaType.TXT,
+        "ini": MediaType.TXT,
+        # Code files (treated as text)
+        "py": MediaType.TXT,
+        "pyw": MediaType.TXT,
+        "pyi": MediaType.TXT,
+        "js": MediaType.TXT,
+        "mjs": MediaType.TXT,
+        "cjs": MediaType.TXT,
+        "ts": MediaType.TXT,
+        "tsx": MediaType.TXT,
+        "jsx": MediaType.TXT,
+        "java": MediaType.TXT,
+        "c": MediaType.TXT,
+        "h": MediaType.TXT,
+        "cpp": MediaType.TXT,
+        "hpp": MediaType.TXT,
+        "cc": MediaType.TXT,
+        "cxx": MediaType.TXT,
+        "cs": MediaType.TXT,
+        "go": MediaType.TXT,
+        "rs": MediaType.TXT,
+        "rb": MediaType.TXT,
+        "php": MediaType.TXT,
+        "sh": MediaType.TXT,
+        "bash": MediaType.TXT,
+        "zsh": MediaType.TXT,
+        "ps1": MediaType.TXT,
+        "sql": MediaType.TXT,
+        "yaml": MediaType.TXT,
+        "yml": MediaType.TXT,
+        "toml": MediaType.TXT,
+        "css": MediaType.TXT,
+        "scss": MediaType.TXT,
+        "less": MediaType.TXT,
+        "sass": MediaType.TXT,
+        "r": MediaType.TXT,
+        "scala": MediaType.TXT,
+        "kt": MediaType.TXT,
+        "kts": MediaType.TXT,
+        "swift": MediaType.TXT,
+        "dart": MediaType.TXT,
+        "lua": MediaType.TXT,
+        "pl": MediaType.TXT,
+        "pm": MediaType.TXT,
+        "ex": MediaType.TXT,
+        "exs": MediaType.TXT,
+        "erl": MediaType.TXT,
+        "hrl": MediaType.TXT,
+        "clj": MediaType.TXT,
+        "cljs": MediaType.TXT,
+        "vue": MediaType.TXT,
+        "svelte": MediaType.TXT,
+    }
+
     # URL patterns for web content
     YOUTUBE_PATTERNS = [
         r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+",
@@ -110,14 +230,81 @@ class FileDetector:
 
     WEB_PATTERN = r"^https?://"
 
-    def __init__(self):
-        """Initialize the file detector with Magika."""
+    # The patterns above, compiled once
+    _YOUTUBE_RE = re.compile("|".join(YOUTUBE_PATTERNS))
+    _GITHUB_RE = re.compile("|".join(GITHUB_PATTERNS))
+    _GIT_RE = re.compile("|".join(GIT_PATTERNS))
+    _WEB_RE = re.compile(WEB_PATTERN)
+
+    # Every URL kind in one alternation, in detection order, so a source
+    # is classified in a single match. The named group that matched
+    # gives the kind.
+    _URL_KIND_RE = re.compile("|".join((
+        f"(?P<youtube>{'|'.join(YOUTUBE_PATTERNS)})",
+        f"(?P<github>{'|'.join(GITHUB_PATTERNS)})",
+        f"(?P<git>{'|'.join(GIT_PATTERNS)})",
+        f"(?P<web>{WEB_PATTERN})",
+    )))
+    # Every string the alternation above can match starts with one of
+    # these; anything else (i.e. a file path) skips the regex.
+    _URL_PREFIXES = (
+        "http://",
+        "https://",
+        "youtu",
+        "www.youtu",
+        "git@",
+        "git://",
+        "ssh://",
+    )
+    _URL_KIND_TO_MEDIA_TYPE: dict[str, MediaType] = {
+        "youtube": MediaType.YOUTUBE,
+        "github": MediaType.GITHUB,
+        "git": MediaType.GIT,
+        "web": MediaType.WEB,
+    }
+
+    # Extensions whose leading magic bytes identify the format on their
+    # own. A file with one of these extensions and a matching signature
+    # is typed by extension without running Magika.
+    TRUSTED_SIGNATURES: dict[str, tuple[bytes, ...]] = {
+        "pdf": (b"%PDF",),
+        "docx": (b"PK\x03\x04",),
+        "pptx": (b"PK\x03\x04",),
+        "xlsx": (b"PK\x03\x04",),
+        "zip": (b"PK\x03\x04",),
+        "png": (b"\x89PNG\r\n\x1a\n",),
+        "jpg": (b"\xff\xd8\xff",),
+        "jpeg": (b"\xff\xd8\xff",),
+        "mp3": (b"ID3", b"\xff\xfb", b"\xff\xf3", b"\xff\xf2"),
+        "flac": (b"fLaC",),
+    }
+
+    def __init__(self, trust_extensions: bool = True):
+        """Initialize the file detector with Magika.
+
+        Args:
+            trust_extensions: Type files with a trusted extension and a
+                matching signature without running Magika. Disable to
+                run Magika on every file.
+        """
+        self.trust_extensions = trust_extensions
         self._magika: Magika | None = None
+        # Content key -> Magika result, in least recently used order.
+        # Directory scans detect a file once when listing it and again
+        # when it is processed; the second detection is a cache hit.
+        self._cache: OrderedDict[bytes, MediaType] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     @property
     def magika(self) -> Magika:
-        """Lazy-load Magika instance."""
+        """Lazy-load Magika instance.
+
+        The magika package (and onnxruntime) is only imported here, so
+        detecting URLs never loads the model.
+        """
         if self._magika is None:
+            from magika import Magika
+
             self._magika = Magika()
         return self._magika
 
@@ -130,24 +317,65 @@ class FileDetector:
         Returns:
             Detected MediaType
         """
-        source_str = str(source)
+        media_type = self._detect_by_name(str(source))
+        if media_type is not None:
+            return media_type
 
-        # Check for URLs first
-        if self._is_youtube_url(source_str):
-            return MediaType.YOUTUBE
+        # For files, use Magika
+        path = Path(source)
+        if path.exists() and path.is_file():
+            return self._detect_by_signature(path) or self._detect_file(path)
 
-        if self._is_github_url(source_str):
-            return MediaType.GITHUB
+        # Fallback to extension-based detection
+        return self._detect_by_extension(path)
 
-        if self._is_git_url(source_str):
-            return MediaType.GIT
+    def detect_many(self, sources: Sequence[str | Path]) -> list[MediaType]:
+        """Detect the media types of several sources.
 
-        # Check for PDF URLs before generic web URLs
-        if self._is_pdf_url(source_str):
-            return MediaType.PDF
+        Equivalent to calling ``detect`` on each source, but all local
+        files are identified with a single batched Magika call.
 
-        if self._is_web_url(source_str):
-            return MediaType.WEB
+        Args:
+            sources: File paths or URLs
+
+        Returns:
+            Detected MediaType for each source, in order
+        """
+        results = [self._detect_by_name(str(source)) for source in sources]
+        files: list[tuple[int, Path]] = []
+        for i, source in enumerate(sources):
+            path = Path(source)
+            if results[i] is None and path.is_file():
+                results[i] = self._detect_by_signature(path)
+                if results[i] is None:
+                    files.append((i, path))
+
+        if files:
+            detected = self._detect_files([path for _, path in files])
+            for (i, _), media_type in zip(files, detected, strict=True):
+                results[i] = media_type
+
+        return [
+            media_type if media_type is not None else self._detect_by_extension(Path(source))
+            for source, media_type in zip(sources, results, strict=True)
+        ]
+
+    def _detect_by_name(self, source_str: str) -> MediaType | None:
+        """Detect URLs and URL-list files from the source string alone.
+
+        Returns:
+            The MediaType, or None if the source's content must be checked
+        """
+        # Check for URLs first
+        if source_str.startswith(self._URL_PREFIXES):
+            match = self._URL_KIND_RE.match(source_str)
+        else:
+            match = None
+        if match is not None and match.lastgroup is not None:
+            # Check for PDF URLs before generic web URLs
+            if match.lastgroup == "web" and self._is_pdf_url(source_str):
+                return MediaType.PDF
+            return self._URL_KIND_TO_MEDIA_TYPE[match.lastgroup]
 
         # Check for .url files (contain URLs to crawl)
         if source_str.lower().endswith(".url"):
@@ -157,13 +385,7 @@ class FileDetector:
         if source_str.lower().endswith(".download_git"):
             return MediaType.GIT
 
-        # For files, use Magika
-        path = Path(source)
-        if path.exists() and path.is_file():
-            return self._detect_file(path)
-
-        # Fallback to extension-based detection
-        return self._detect_by_extension(path)
+        return None
 
     def detect_bytes(self, data: bytes) -> MediaType:
         """Detect media type from raw bytes.
@@ -175,144 +397,128 @@ class FileDetector:
             Detected MediaType
         """
         result = self.magika.identify_bytes(data)
-        label = result.output.label.lower()
+        # Magika labels are already lowercase
+        label = result.output.label
         return self.MAGIKA_TO_MEDIA_TYPE.get(label, MediaType.UNKNOWN)
 
+    def _detect_by_signature(self, path: Path) -> MediaType | None:
+        """Detect a file with a trusted extension from its magic bytes.
+
+        Returns:
+            The MediaType, or None if Magika is needed
+        """
+        if not self.trust_extensions:
+            return None
+        signatures = self.TRUSTED_SIGNATURES.get(path.suffix.lower().lstrip("."))
+        if signatures is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                header = f.read(8)
+        except OSError:
+            return None
+        if header.startswith(signatures):
+            return self._detect_by_extension(path)
+        return None
+
     def _detect_file(self, path: Path) -> MediaType:
         """Detect file type using Magika with extension-based fallback."""
-        try:
-            result = self.magika.identify_path(path)
-            label = result.output.label.lower()
-            detected = self.MAGIKA_TO_MEDIA_TYPE.get(label, MediaType.UNKNOWN)
+        return self._detect_files([path])[0]
 
-            # If Magika returns UNKNOWN, try extension-based detection
-            if detected == MediaType.UNKNOWN:
-                return self._detect_by_extension(path)
+    def _detect_files(self, paths: list[Path]) -> list[MediaType]:
+        """Detect file types with one batched Magika call.
 
-            return detected
-        except Exception:
-            # Fallback to extension if Magika fails
-            return self._detect_by_extension(path)
+        Files whose content was already identified are answered from the
+        cache; only the rest are passed to Magika.
+        """
+        keys = [self._content_key(path) for path in paths]
+        detected = [self._cache_get(key) for key in keys]
+
+        misses = [i for i, media_type in enumerate(detected) if media_type is None]
+        if misses:
+            try:
+                results = self.magika.identify_paths([paths[i] for i in misses])
+            except Exception:
+                # Fallback to extension if Magika fails
+                results = []
+            for i, result in zip(misses, results, strict=False):
+                try:
+                    # Magika labels are already lowercase
+                    label = result.output.label
+                except Exception:
+                    # Magika could not read or identify this file
+                    continue
+                media_type = self.MAGIKA_TO_MEDIA_TYPE.get(label, MediaType.UNKNOWN)
+                self._cache_put(keys[i], media_type)
+                detected[i] = media_type
+
+        # If Magika returns UNKNOWN, try extension-based detection
+        return [
+            media_type
+            if media_type is not None and media_type != MediaType.UNKNOWN
+            else self._detect_by_extension(path)
+            for media_type, path in zip(detected, paths, strict=True)
+        ]
+
+    def _content_key(self, path: Path) -> bytes | None:
+        """Key identifying the bytes Magika looks at in a file.
+
+        Magika only reads the first and last 4 KiB of a file, so the size
+        and a hash of those blocks determine its result exactly.
+
+        Returns:
+            The key, or None if the file cannot be read
+        """
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                digest = hashlib.blake2b(f.read(_MAGIKA_BLOCK_SIZE), digest_size=16)
+                if size > _MAGIKA_BLOCK_SIZE:
+                    f.seek(max(_MAGIKA_BLOCK_SIZE, size - _MAGIKA_BLOCK_SIZE))
+                    digest.update(f.read(_MAGIKA_BLOCK_SIZE))
+        except OSError:
+            return None
+        return size.to_bytes(8, "little") + digest.digest()
+
+    def _cache_get(self, key: bytes | None) -> MediaType | None:
+        """Get the cached Magika result for a content key."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            media_type = self._cache.get(key)
+            if media_type is not None:
+                self._cache.move_to_end(key)
+            return media_type
+
+    def _cache_put(self, key: bytes | None, media_type: MediaType) -> None:
+        """Cache a Magika result, evicting the least recently used."""
+        if key is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = media_type
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
 
     def _detect_by_extension(self, path: Path) -> MediaType:
         """Fallback detection by file extension."""
-        ext = path.suffix.lower().lstrip(".")
-        extension_map = {
-            # Documents
-            "pdf": MediaType.PDF,
-            "docx": MediaType.DOCX,
-            "doc": MediaType.DOCX,
-            "pptx": MediaType.PPTX,
-            "ppt": MediaType.PPTX,
-            "xlsx": MediaType.XLSX,
-            "xls": MediaType.XLS,
-            "csv": MediaType.CSV,
-            "tsv": MediaType.CSV,
-            "epub": MediaType.EPUB,
-            # Audio
-            "mp3": MediaType.AUDIO,
-            "wav": MediaType.AUDIO,
-            "flac": MediaType.AUDIO,
-            "m4a": MediaType.AUDIO,
-            "ogg": MediaType.AUDIO,
-            "aac": MediaType.AUDIO,
-            # Data
-            "json": MediaType.JSON,
-            "xml": MediaType.XML,
-            # Archives
-            "zip": MediaType.ZIP,
-            "tar": MediaType.ZIP,
-            "gz": MediaType.ZIP,
-            "tgz": MediaType.ZIP,
-            "rar": MediaType.ZIP,
-            "7z": MediaType.ZIP,
-            # Images
-            "png": MediaType.IMAGE,
-            "jpg": MediaType.IMAGE,
-            "jpeg": MediaType.IMAGE,
-            "gif": MediaType.IMAGE,
-            "webp": MediaType.IMAGE,
-            "bmp": MediaType.IMAGE,
-            "tiff": MediaType.IMAGE,
-            "svg": MediaType.IMAGE,
-            "ico": MediaType.IMAGE,
-            # Text/Plain text
-            "txt": MediaType.TXT,
-            "text": MediaType.TXT,
-            "md": MediaType.TXT,
-            "markdown": MediaType.TXT,
-            "rst": MediaType.TXT,
-            "html": MediaType.TXT,
-            "htm": MediaType.TXT,
-            "log": MediaType.TXT,
-            "cfg": MediaType.TXT,
-            "conf": MediaType.TXT,
-            "ini": MediaType.TXT,
-            # Code files (treated as text)
-            "py": MediaType.TXT,
-            "pyw": MediaType.TXT,
-            "pyi": MediaType.TXT,
-            "js": MediaType.TXT,
-            "mjs": MediaType.TXT,
-            "cjs": MediaType.TXT,
-            "ts": MediaType.TXT,
-            "tsx": MediaType.TXT,
-            "jsx": MediaType.TXT,
-            "java": MediaType.TXT,
-            "c": MediaType.TXT,
-            "h": MediaType.TXT,
-            "cpp": MediaType.TXT,
-            "hpp": MediaType.TXT,
-            "cc": MediaType.TXT,
-            "cxx": MediaType.TXT,
-            "cs": MediaType.TXT,
-            "go": MediaType.TXT,
-            "rs": MediaType.TXT,
-            "rb": MediaType.TXT,
-            "php": MediaType.TXT,
-            "sh": MediaType.TXT,
-            "bash": MediaType.TXT,
-            "zsh": MediaType.TXT,
-            "ps1": MediaType.TXT,
-            "sql": MediaType.TXT,
-            "yaml": MediaType.TXT,
-            "yml": MediaType.TXT,
-            "toml": MediaType.TXT,
-            "css": MediaType.TXT,
-            "scss": MediaType.TXT,
-            "less": MediaType.TXT,
-            "sass": MediaType.TXT,
-            "r": MediaType.TXT,
-            "scala": MediaType.TXT,
-            "kt": MediaType.TXT,
-            "kts": MediaType.TXT,
-            "swift": MediaType.TXT,
-            "dart": MediaType.TXT,
-            "lua": MediaType.TXT,
-            "pl": MediaType.TXT,
-            "pm": MediaType.TXT,
-            "ex": MediaType.TXT,
-            "exs": MediaType.TXT,
-            "erl": MediaType.TXT,
-            "hrl": MediaType.TXT,
-            "clj": MediaType.TXT,
-            "cljs": MediaType.TXT,
-            "vue": MediaType.TXT,
-            "svelte": MediaType.TXT,
-        }
-        return extension_map.get(ext, MediaType.UNKNOWN)
+        ext = path.suffix[1:]
+        media_type = self.EXTENSION_TO_MEDIA_TYPE.get(ext)
+        if media_type is None:
+            # Only lowercase when the extension as written is not found
+            media_type = self.EXTENSION_TO_MEDIA_TYPE.get(ext.lower(), MediaType.UNKNOWN)
+        return media_type
 
     def _is_youtube_url(self, url: str) -> bool:
         """Check if URL is a YouTube video or playlist."""
-        return any(re.match(pattern, url) for pattern in self.YOUTUBE_PATTERNS)
+        return self._YOUTUBE_RE.match(url) is not None
 
     def _is_github_url(self, url: str) -> bool:
         """Check if URL is a GitHub repository."""
-        return any(re.match(pattern, url) for pattern in self.GITHUB_PATTERNS)
+        return self._GITHUB_RE.match(url) is not None
 
     def _is_git_url(self, url: str) -> bool:
         """Check if URL is a git repository URL (SSH, git://, etc.)."""
-        return any(re.match(pattern, url) for pattern in self.GIT_PATTERNS)
+        return self._GIT_RE.match(url) is not None
 
     def _is_pdf_url(self, url: str) -> bool:
         """Check if URL points to a PDF file."""
@@ -327,4 +533,4 @@ class FileDetector:
 
     def _is_web_url(self, url: str) -> bool:
         """Check if string is a web URL."""
-        return bool(re.match(self.WEB_PATTERN, url))
+        return self._WEB_RE.match(url) is not None
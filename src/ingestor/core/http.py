@@ -0,0 +1,84 @@
+"""Shared HTTP client for extractors.
+
+Extractors that make HTTP requests get their client from ``http_client()``.
+Inside a ``shared_http_client()`` block they all reuse one pooled
+``httpx.AsyncClient``, so connections and TLS sessions are kept alive
+across extractions. Outside such a block a short-lived client is created
+per call.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+_shared_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "ingestor_shared_http_client", default=None
+)
+
+# Connection pool limits for the shared client
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+# HTTP/2 needs the optional h2 package (httpx[http2]). With it, concurrent
+# requests to one host (e.g. the GitHub API) share a single connection.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+@asynccontextmanager
+async def shared_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Make one pooled client available to every extractor in this context.
+
+    Tasks started inside the block inherit the client. It is closed when
+    the block exits. A nested block reuses the enclosing block's client,
+    so extractors can open one around their own requests without
+    replacing a client shared by their caller.
+
+    Yields:
+        The shared AsyncClient
+    """
+    client = _shared_client.get()
+    if client is not None:
+        yield client
+        return
+
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    )
+    async with httpx.AsyncClient(timeout=30.0, limits=limits, http2=_HTTP2) as client:
+        token = _shared_client.set(client)
+        try:
+            yield client
+        finally:
+            _shared_client.reset(token)
+
+
+@asynccontextmanager
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Get the shared client if one is active, else a temporary one.
+
+    Callers should pass request-specific options such as ``timeout`` and
+    ``follow_redirects`` per request rather than relying on client
+    defaults.
+
+    Yields:
+        An AsyncClient
+    """
+    client = _shared_client.get()
+    if client is not None:
+        yield client
+        return
+
+    import httpx
+
+    async with httpx.AsyncClient() as client:
+        yield client
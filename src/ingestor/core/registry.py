@@ -2,26 +2,79 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import entry_points
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..types import MediaType
+from .cache import cache_dir
 from .detector import FileDetector
 
 if TYPE_CHECKING:
     from ..extractors.base import BaseExtractor
 
+# Entry point group for third-party extractors. Entry point names are
+# MediaType values, e.g. ``pdf = "my_pkg.pdf:FastPdfExtractor"``.
+ENTRY_POINT_GROUP = "ingestor.extractors"
+
+# Upper bound on threads used to import extractor modules in parallel
+_MAX_IMPORT_WORKERS = 8
+
+# Built-in extractors as (module, class name). Modules are only imported
+# when the extractor is first looked up.
+_EXTRACTOR_SPECS: dict[MediaType, tuple[str, str]] = {
+    # Documents
+    MediaType.TXT: ("ingestor.extractors.text.txt_extractor", "TxtExtractor"),
+    MediaType.PDF: ("ingestor.extractors.pdf.pdf_extractor", "PdfExtractor"),
+    MediaType.DOCX: ("ingestor.extractors.docx.docx_extractor", "DocxExtractor"),
+    MediaType.PPTX: ("ingestor.extractors.pptx.pptx_extractor", "PptxExtractor"),
+    MediaType.EPUB: ("ingestor.extractors.epub.epub_extractor", "EpubExtractor"),
+    # Spreadsheets
+    MediaType.XLSX: ("ingestor.extractors.excel.xlsx_extractor", "XlsxExtractor"),
+    MediaType.XLS: ("ingestor.extractors.excel.xls_extractor", "XlsExtractor"),
+    # Data
+    MediaType.CSV: ("ingestor.extractors.data.csv_extractor", "CsvExtractor"),
+    MediaType.JSON: ("ingestor.extractors.data.json_extractor", "JsonExtractor"),
+    MediaType.XML: ("ingestor.extractors.data.xml_extractor", "XmlExtractor"),
+    # Web
+    MediaType.WEB: ("ingestor.extractors.web.web_extractor", "WebExtractor"),
+    MediaType.YOUTUBE: ("ingestor.extractors.youtube.youtube_extractor", "YouTubeExtractor"),
+    # Git (one unified extractor handles both cloning and the GitHub API)
+    MediaType.GIT: ("ingestor.extractors.git.git_extractor", "GitExtractor"),
+    MediaType.GITHUB: ("ingestor.extractors.git.git_extractor", "GitExtractor"),
+    # Audio
+    MediaType.AUDIO: ("ingestor.extractors.audio.audio_extractor", "AudioExtractor"),
+    # Archives
+    MediaType.ZIP: ("ingestor.extractors.archive.zip_extractor", "ZipExtractor"),
+    # Images
+    MediaType.IMAGE: ("ingestor.extractors.image.image_extractor", "ImageExtractor"),
+}
+
 
 class ExtractorRegistry:
     """Registry for managing and accessing extractors.
 
     The registry maintains a mapping of MediaType to Extractor instances
     and handles extractor lookup based on file type detection.
+
+    Extractors can also be registered lazily as ``(module, class name)``
+    specs; the module is imported and the extractor instantiated on the
+    first lookup for that media type.
     """
 
     def __init__(self):
         """Initialize the registry."""
         self._extractors: dict[MediaType, BaseExtractor] = {}
+        self._specs: dict[MediaType, tuple[str, str]] = {}
         self._detector = FileDetector()
 
     def register(self, extractor: BaseExtractor) -> None:
@@ -31,6 +84,7 @@ class ExtractorRegistry:
             extractor: Extractor instance to register
         """
         self._extractors[extractor.media_type] = extractor
+        self._specs.pop(extractor.media_type, None)
 
     def register_class(
         self, extractor_class: type[BaseExtractor], *args, **kwargs
@@ -45,16 +99,82 @@ class ExtractorRegistry:
         extractor = extractor_class(*args, **kwargs)
         self.register(extractor)
 
+    def register_lazy(self, media_type: MediaType, module: str, class_name: str) -> None:
+        """Register an extractor to be imported on first use.
+
+        Args:
+            media_type: The media type the extractor handles
+            module: Dotted module path containing the extractor
+            class_name: Name of the extractor class in the module
+        """
+        self._extractors.pop(media_type, None)
+        self._specs[media_type] = (module, class_name)
+
     def get(self, media_type: MediaType) -> BaseExtractor | None:
         """Get an extractor by media type.
 
+        Lazily registered extractors are imported and instantiated here.
+        If the import fails (missing optional dependency), the spec is
+        dropped and None is returned.
+
         Args:
             media_type: The media type to get an extractor for
 
         Returns:
             Extractor instance or None if not registered
         """
-        return self._extractors.get(media_type)
+        extractor = self._extractors.get(media_type)
+        if extractor is not None or media_type not in self._specs:
+            return extractor
+
+        spec = self._specs.pop(media_type)
+        extractor = self._load(spec)
+        if extractor is not None:
+            self._extractors[media_type] = extractor
+        return extractor
+
+    def _load(self, spec: tuple[str, str]) -> BaseExtractor | None:
+        """Import and instantiate an extractor from a spec.
+
+        Extractors sharing a spec (e.g. GIT and GITHUB) share one instance.
+        Extractors whose constructor takes a ``registry`` argument receive
+        this registry for nested extraction.
+        """
+        for extractor in self._extractors.values():
+            if _spec_of(extractor) == spec:
+                return extractor
+
+        module_name, class_name = spec
+        try:
+            extractor_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError):
+            return None
+
+        if "registry" in inspect.signature(extractor_class).parameters:
+            return extractor_class(registry=self)
+        return extractor_class()
+
+    def preload(self, media_types: Iterable[MediaType] | None = None) -> None:
+        """Resolve lazily registered extractors ahead of use.
+
+        Extractor modules not yet imported are imported in parallel on a
+        thread pool, since much of import time is spent reading files and
+        loading extension modules. Instantiation then happens on the
+        calling thread in the usual way.
+
+        Args:
+            media_types: Media types to resolve (default: all pending)
+        """
+        if media_types is None:
+            media_types = list(self._specs)
+        pending = [t for t in media_types if t in self._specs]
+        modules = {self._specs[t][0] for t in pending} - sys.modules.keys()
+        if len(modules) > 1:
+            with ThreadPoolExecutor(max_workers=min(_MAX_IMPORT_WORKERS, len(modules))) as pool:
+                list(pool.map(_try_import, modules))
+
+        for media_type in pending:
+            self.get(media_type)
 
     def get_for_source(self, source: str | Path) -> BaseExtractor | None:
         """Get an extractor for a given source.
@@ -73,13 +193,16 @@ class ExtractorRegistry:
     def has(self, media_type: MediaType) -> bool:
         """Check if an extractor is registered for a media type.
 
+        Lazily registered extractors count as registered without being
+        imported.
+
         Args:
             media_type: The media type to check
 
         Returns:
             True if an extractor is registered
         """
-        return media_type in self._extractors
+        return media_type in self._extractors or media_type in self._specs
 
     def list_supported(self) -> list[MediaType]:
         """List all supported media types.
@@ -87,14 +210,17 @@ class ExtractorRegistry:
         Returns:
             List of registered MediaType values
         """
-        return list(self._extractors.keys())
+        return list(self._extractors.keys() | self._specs.keys())
 
     def list_extractors(self) -> list[BaseExtractor]:
         """List all registered extractors.
 
+        Resolves any lazily registered extractors.
+
         Returns:
             List of registered extractor instances
         """
+        self.preload()
         return list(self._extractors.values())
 
     @property
@@ -104,122 +230,107 @@ class ExtractorRegistry:
 
     def __len__(self) -> int:
         """Return the number of registered extractors."""
-        return len(self._extractors)
+        return len(self._extractors.keys() | self._specs.keys())
 
     def __contains__(self, media_type: MediaType) -> bool:
         """Check if a media type is registered."""
-        return media_type in self._extractors
+        return self.has(media_type)
+
+
+def _try_import(module_name: str) -> None:
+    """Import a module to warm sys.modules, ignoring any failure.
+
+    Failures are left for ExtractorRegistry.get() to handle on the
+    calling thread.
+    """
+    with contextlib.suppress(Exception):
+        importlib.import_module(module_name)
+
+
+def _spec_of(extractor: BaseExtractor) -> tuple[str, str]:
+    """Return the (module, class name) spec of an extractor instance."""
+    cls = type(extractor)
+    return cls.__module__, cls.__qualname__
 
 
 def create_default_registry() -> ExtractorRegistry:
     """Create a registry with all available extractors.
 
-    Attempts to register each extractor, skipping those whose
-    dependencies are not installed.
+    Built-in extractors and any extractors advertised through the
+    ``ingestor.extractors`` entry point group are registered lazily, so
+    no extractor module is imported until it is needed. Extractors whose
+    dependencies are not installed resolve to None on lookup.
 
     Returns:
         Configured ExtractorRegistry
     """
     registry = ExtractorRegistry()
 
-    # Text extractor (always available)
-    try:
-        from ..extractors.text import TxtExtractor
-        registry.register(TxtExtractor())
-    except ImportError:
-        pass
-
-    # PDF extractor (placeholder)
-    try:
-        from ..extractors.pdf import PdfExtractor
-        registry.register(PdfExtractor())
-    except ImportError:
-        pass
-
-    # Document extractors
-    try:
-        from ..extractors.docx import DocxExtractor
-        registry.register(DocxExtractor())
-    except ImportError:
-        pass
-
-    try:
-        from ..extractors.pptx import PptxExtractor
-        registry.register(PptxExtractor())
-    except ImportError:
-        pass
-
-    try:
-        from ..extractors.epub import EpubExtractor
-        registry.register(EpubExtractor())
-    except ImportError:
-        pass
-
-    # Spreadsheet extractors
-    try:
-        from ..extractors.excel import XlsxExtractor
-        registry.register(XlsxExtractor())
-    except ImportError:
-        pass
-
-    try:
-        from ..extractors.excel import XlsExtractor
-        registry.register(XlsExtractor())
-    except ImportError:
-        pass
-
-    # Data extractors
-    try:
-        from ..extractors.data import CsvExtractor
-        registry.register(CsvExtractor())
-    except ImportError:
-        pass
-
-    try:
-        from ..extractors.data import JsonExtractor
-        registry.register(JsonExtractor())
-    except ImportError:
-        pass
-
-    try:
-        from ..extractors.data import XmlExtractor
-        registry.register(XmlExtractor())
-    except ImportError:
-        pass
-
-    # Web extractors
-    try:
-        from ..extractors.web import WebExtractor
-        registry.register(WebExtractor())
-    except ImportError:
-        pass
-
-    try:
-        from ..extractors.youtube import YouTubeExtractor
-        registry.register(YouTubeExtractor())
-    except ImportError:
-        pass
-
-    # Audio extractor
-    try:
-        from ..extractors.audio import AudioExtractor
-        registry.register(AudioExtractor())
-    except ImportError:
-        pass
-
-    # Archive extractor (needs registry reference)
-    try:
-        from ..extractors.archive import ZipExtractor
-        zip_extractor = ZipExtractor(registry=registry)
-        registry.register(zip_extractor)
-    except ImportError:
-        pass
-
-    # Image extractor
-    try:
-        from ..extractors.image import ImageExtractor
-        registry.register(ImageExtractor())
-    except ImportError:
-        pass
+    for media_type, (module, class_name) in _EXTRACTOR_SPECS.items():
+        registry.register_lazy(media_type, module, class_name)
+
+    # Third-party extractors override built-ins for the same media type
+    for name, module, class_name in _entry_point_specs():
+        try:
+            media_type = MediaType(name)
+        except ValueError:
+            continue
+        registry.register_lazy(media_type, module, class_name)
 
     return registry
+
+
+def _entry_point_specs() -> list[tuple[str, str, str]]:
+    """Get the ``(name, module, class name)`` specs of entry point extractors.
+
+    Scanning installed distributions for entry points costs more than
+    building the rest of the registry, so the result is cached on disk
+    and reused until the Python installation or import path changes.
+    Set ``INGESTOR_NO_CACHE=1`` to always scan.
+    """
+    cache_path = key = None
+    root = cache_dir()
+    if root is not None:
+        cache_path, key = _entry_point_cache(root)
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached["key"] == key:
+                return [(name, module, class_name) for name, module, class_name in cached["specs"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    specs = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        module, _, class_name = entry_point.value.partition(":")
+        if class_name:
+            specs.append((entry_point.name, module.strip(), class_name.strip()))
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"key": key, "specs": specs}))
+        except OSError:
+            pass
+    return specs
+
+
+def _entry_point_cache(root: Path) -> tuple[Path, str]:
+    """Get the entry point cache file and the key its content must match.
+
+    The key covers the interpreter, the ingestor version and the
+    modification times of the import path directories, which change
+    whenever a distribution is installed or removed.
+    """
+    from .. import __version__
+
+    fingerprint = [sys.version, __version__]
+    for entry in sys.path:
+        if not entry:
+            continue
+        try:
+            fingerprint.append(f"{entry}:{os.stat(entry).st_mtime_ns}")
+        except OSError:
+            continue
+    key = hashlib.blake2b("\n".join(fingerprint).encode(), digest_size=16).hexdigest()
+
+    return root / "entry_points.json", key
@@ -1,12 +1,17 @@
 """Router for directing inputs to the appropriate extractors."""
 
 import asyncio
-from collections.abc import AsyncIterator
+import os
+import threading
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 
 from ..types import ExtractionResult, IngestConfig, MediaType
 from .registry import ExtractorRegistry
 
+# Files per batched type detection when scanning a directory
+_DETECT_BATCH_SIZE = 64
+
 
 class Router:
     """Route inputs to the appropriate extractors.
@@ -79,6 +84,10 @@ class Router:
     ) -> AsyncIterator[ExtractionResult]:
         """Process all supported files in a directory.
 
+        The directory is scanned on a worker thread that feeds a bounded
+        queue, so extraction starts as soon as the first file is found
+        and memory stays bounded however large the tree is.
+
         Args:
             directory: Directory to process
             recursive: Whether to process subdirectories
@@ -91,24 +100,112 @@ class Router:
         if not directory.is_dir():
             raise ValueError(f"Not a directory: {directory}")
 
-        # Collect all files
-        sources: list[str | Path] = []
-        pattern = "**/*" if recursive else "*"
-
-        for path in directory.glob(pattern):
-            if path.is_file():
-                # Check if we have an extractor for this file
-                if self.registry.get_for_source(path) is not None:
-                    sources.append(path)
-                # Handle .url files specially
-                elif path.suffix.lower() == ".url":
-                    sources.extend(self._parse_url_file(path))
-                # Handle .download_git files specially
-                elif path.suffix.lower() == ".download_git":
-                    sources.extend(self._parse_download_git_file(path))
-
-        async for result in self.process_batch(sources, concurrency):
-            yield result
+        loop = asyncio.get_running_loop()
+        sources: asyncio.Queue[str | Path | None] = asyncio.Queue(maxsize=concurrency * 4)
+        results: asyncio.Queue[ExtractionResult | Exception | None] = asyncio.Queue()
+        stop = threading.Event()
+
+        def scan() -> None:
+            # Runs on a worker thread; each put blocks while the queue is full
+            def put(item: str | Path | None) -> None:
+                asyncio.run_coroutine_threadsafe(sources.put(item), loop).result()
+
+            try:
+                for source in self._scan_sources(directory, recursive):
+                    if stop.is_set():
+                        return
+                    put(source)
+            finally:
+                if not stop.is_set():
+                    for _ in range(concurrency):
+                        put(None)
+
+        async def worker() -> None:
+            while (source := await sources.get()) is not None:
+                try:
+                    results.put_nowait(await self.process(source))
+                except Exception as e:
+                    results.put_nowait(e)
+            results.put_nowait(None)
+
+        producer = asyncio.ensure_future(asyncio.to_thread(scan))
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+
+        try:
+            finished = 0
+            while finished < concurrency:
+                item = await results.get()
+                if item is None:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+            await producer
+        finally:
+            stop.set()
+            for task in workers:
+                task.cancel()
+            # Unblock the scanner if it is waiting for queue space
+            while not producer.done():
+                while not sources.empty():
+                    sources.get_nowait()
+                await asyncio.wait({producer}, timeout=0.05)
+            await asyncio.gather(producer, *workers, return_exceptions=True)
+
+    def _scan_sources(self, directory: Path, recursive: bool) -> Iterator[str | Path]:
+        """Yield processable sources in a directory using os.scandir.
+
+        Files with a registered extractor are yielded as paths; .url and
+        .download_git files are expanded into the URLs they contain.
+        Symlinked directories are not followed.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            File paths and URLs to process
+        """
+        stack = [os.fspath(directory)]
+        preloaded: set[MediaType] = set()
+        while stack:
+            files: list[Path] = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                            continue
+                        if entry.is_file():
+                            files.append(Path(entry.path))
+            except OSError:
+                # Skip unreadable directories, as Path.glob does
+                continue
+
+            # Files are detected in batches, one Magika call per batch
+            for start in range(0, len(files), _DETECT_BATCH_SIZE):
+                batch = files[start:start + _DETECT_BATCH_SIZE]
+                media_types = self.registry.detector.detect_many(batch)
+
+                # Import the extractors this batch needs, in parallel, before
+                # any of its files reach a worker
+                new_types = set(media_types) - preloaded
+                if new_types:
+                    self.registry.preload(new_types)
+                    preloaded |= new_types
+
+                for path, media_type in zip(batch, media_types, strict=True):
+                    # Check if we have an extractor for this file
+                    if self.registry.has(media_type):
+                        yield path
+                    # Handle .url files specially
+                    elif path.suffix.lower() == ".url":
+                        yield from self._parse_url_file(path)
+                    # Handle .download_git files specially
+                    elif path.suffix.lower() == ".download_git":
+                        yield from self._parse_download_git_file(path)
 
     def _parse_url_file(self, path: Path) -> list[str]:
         """Parse a .url file containing URLs to crawl.
@@ -176,4 +273,4 @@ class Router:
         Returns:
             True if an extractor is available
         """
-        return self.registry.get_for_source(source) is not None
+        return self.registry.has(self.detect_type(source))
@@ -1,31 +1,68 @@
 """Extractors for various media formats."""
 
-# Archive extractor
-from .archive import ZipExtractor
+from __future__ import annotations
 
-# Audio extractor
-from .audio import AudioExtractor
-from .base import BaseExtractor
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Data extractors
-from .data import CsvExtractor, JsonExtractor, XmlExtractor
-from .docx import DocxExtractor
-from .epub import EpubExtractor
+if TYPE_CHECKING:
+    from .archive import ZipExtractor
+    from .audio import AudioExtractor
+    from .base import BaseExtractor
+    from .data import CsvExtractor, JsonExtractor, XmlExtractor
+    from .docx import DocxExtractor
+    from .epub import EpubExtractor
+    from .excel import XlsExtractor, XlsxExtractor
+    from .image import ImageExtractor
+    from .pdf import PdfExtractor
+    from .pptx import PptxExtractor
+    from .text import TxtExtractor
+    from .web import WebExtractor
+    from .youtube import YouTubeExtractor
 
-# Spreadsheet extractors
-from .excel import XlsExtractor, XlsxExtractor
+# Public name -> defining subpackage. Resolved on first attribute access:
+# the registry imports e.g. ``extractors.text.txt_extractor``, which runs
+# this module first, and loading every extractor (and its dependencies)
+# here would undo the registry's lazy loading.
+_LAZY_EXPORTS = {
+    "BaseExtractor": ".base",
+    # Documents
+    "TxtExtractor": ".text",
+    "PdfExtractor": ".pdf",
+    "DocxExtractor": ".docx",
+    "PptxExtractor": ".pptx",
+    "EpubExtractor": ".epub",
+    # Spreadsheets
+    "XlsxExtractor": ".excel",
+    "XlsExtractor": ".excel",
+    # Data
+    "CsvExtractor": ".data",
+    "JsonExtractor": ".data",
+    "XmlExtractor": ".data",
+    # Web
+    "WebExtractor": ".web",
+    "YouTubeExtractor": ".youtube",
+    # Audio
+    "AudioExtractor": ".audio",
+    # Archive
+    "ZipExtractor": ".archive",
+    # Image
+    "ImageExtractor": ".image",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Image extractor
-from .image import ImageExtractor
-from .pdf import PdfExtractor
-from .pptx import PptxExtractor
 
-# Document extractors
-from .text import TxtExtractor
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
 
-# Web extractors
-from .web import WebExtractor
-from .youtube import YouTubeExtractor
 
 __all__ = [
     "BaseExtractor",
@@ -73,16 +73,17 @@ class ZipExtractor(BaseExtractor):
                 zf.extractall(tmpdir)
                 tmpdir_path = Path(tmpdir)
 
-                # Process each file
-                for file_name in file_list:
-                    file_path = tmpdir_path / file_name
-
-                    if not file_path.exists() or not file_path.is_file():
-                        continue
-
-                    # Try to extract with registry
-                    if self._registry:
-                        extractor = self._registry.get_for_source(file_path)
+                files = [
+                    (file_name, tmpdir_path / file_name)
+                    for file_name in file_list
+                    if (tmpdir_path / file_name).is_file()
+                ]
+
+                # Try to extract with registry, detecting all files at once
+                if self._registry:
+                    media_types = self._registry.detector.detect_many([p for _, p in files])
+                    for (file_name, file_path), media_type in zip(files, media_types, strict=True):
+                        extractor = self._registry.get(media_type)
                         if extractor:
                             try:
                                 result = await extractor.extract(file_path)
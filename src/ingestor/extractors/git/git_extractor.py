@@ -12,18 +12,30 @@ Handles:
 import asyncio
 import base64
 import fnmatch
+import hashlib
+import io
+import json
 import os
 import re
 import subprocess
 import tempfile
+import time
+import zipfile
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
+from ...core.cache import cache_dir
+from ...core.http import http_client, shared_http_client
 from ...types import ExtractedImage, ExtractionResult, MediaType
 from ..base import BaseExtractor
 
+# A git blob SHA (SHA-1, or SHA-256 for SHA-256 repositories)
+_BLOB_SHA_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
 
 @dataclass
 class GitRepoConfig:
@@ -113,16 +125,37 @@ class GitExtractor(BaseExtractor):
         r"^ssh://git@[^/]+/[^/]+/[^/]+(?:\.git)?$",  # SSH with ssh://
     ]
 
-    # GitHub-specific URL patterns (for API access)
-    GITHUB_PATTERNS = {
-        "repo": r"^https?://(?:www\.)?github\.com/([^/]+)/([^/]+)/?$",
-        "file": r"^https?://(?:www\.)?github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.+)$",
-        "tree": r"^https?://(?:www\.)?github\.com/([^/]+)/([^/]+)/tree/([^/]+)/?(.*)$",
-        "raw": r"^https?://(?:www\.)?github\.com/([^/]+)/([^/]+)/raw/([^/]+)/(.+)$",
-    }
+    # GitHub-specific URL pattern (for API access): a repository root, or a
+    # file (blob), directory (tree) or raw file within it. A blob or raw
+    # URL must name a path.
+    GITHUB_PATTERN = (
+        r"^https?://(?:www\.)?github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)"
+        r"(?:/?|/(?P<kind>blob|tree|raw)/(?P<branch>[^/]+)(?:/(?P<path>.*))?)$"
+    )
+
+    # The patterns above, compiled once
+    _GITHUB_RE = re.compile(GITHUB_PATTERN)
+    _SUPPORTED_RE = re.compile("|".join([GITHUB_PATTERN, *GIT_URL_PATTERNS]), re.IGNORECASE)
+
+    # GitHub URL path kind -> url_type
+    _GITHUB_URL_TYPES = {None: "repo", "blob": "file", "tree": "tree", "raw": "raw"}
+
+    # Maximum concurrent GitHub API requests when fetching a directory's files
+    API_CONCURRENCY = 10
+
+    # GitHub API responses are reused for this many seconds, then
+    # revalidated with their ETag or Last-Modified date
+    API_CACHE_TTL = 300.0
+    API_CACHE_SIZE = 512
+
+    # A directory with at least this many files to fetch is read from one
+    # zipball of the repository instead, if the repository is no larger
+    # than ZIPBALL_MAX_SIZE (in KB, as reported by the API)
+    ZIPBALL_MIN_FILES = 5
+    ZIPBALL_MAX_SIZE = 20_000
 
     # Binary file extensions to skip content extraction
-    BINARY_EXTENSIONS = {
+    BINARY_EXTENSIONS = frozenset({
         ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg", ".webp", ".bmp", ".tiff",
         ".mp3", ".wav", ".ogg", ".flac", ".m4a", ".aac",
         ".mp4", ".avi", ".mov", ".mkv", ".webm",
@@ -131,8 +164,41 @@ class GitExtractor(BaseExtractor):
         ".exe", ".dll", ".so", ".dylib", ".a", ".o", ".pyc", ".pyo",
         ".woff", ".woff2", ".ttf", ".eot", ".otf",
         ".db", ".sqlite", ".sqlite3",
+    })
+
+    # Code block language for syntax highlighting, by file extension
+    EXTENSION_TO_LANGUAGE = {
+        ".py": "python", ".js": "javascript", ".ts": "typescript",
+        ".jsx": "jsx", ".tsx": "tsx", ".java": "java",
+        ".c": "c", ".cpp": "cpp", ".h": "c", ".hpp": "cpp",
+        ".go": "go", ".rs": "rust", ".rb": "ruby", ".php": "php",
+        ".swift": "swift", ".kt": "kotlin", ".scala": "scala",
+        ".r": "r",
+        ".sh": "bash", ".bash": "bash", ".zsh": "zsh", ".fish": "fish",
+        ".ps1": "powershell", ".bat": "batch", ".cmd": "batch",
+        ".html": "html", ".css": "css", ".scss": "scss", ".sass": "sass", ".less": "less",
+        ".vue": "vue", ".svelte": "svelte",
+        ".json": "json", ".yaml": "yaml", ".yml": "yaml", ".toml": "toml",
+        ".xml": "xml", ".ini": "ini", ".cfg": "ini", ".conf": "conf",
+        ".md": "markdown", ".rst": "rst",
+        ".sql": "sql", ".graphql": "graphql", ".proto": "protobuf",
+        ".dockerfile": "dockerfile", ".makefile": "makefile", ".cmake": "cmake",
+        ".gradle": "gradle",
+    }
+
+    # ... and by file name (lowercase), checked first
+    FILENAME_TO_LANGUAGE = {
+        "dockerfile": "dockerfile",
+        "makefile": "makefile",
+        "gemfile": "ruby",
+        "rakefile": "ruby",
     }
 
+    # Text files commonly named without an extension (lowercase)
+    NO_EXTENSION_TEXT_FILES = frozenset({
+        "license", "readme", "changelog", "contributing", "makefile", "dockerfile",
+    })
+
     def __init__(
         self,
         config: GitRepoConfig | None = None,
@@ -152,6 +218,11 @@ class GitExtractor(BaseExtractor):
         self.token = token or os.environ.get("GITHUB_TOKEN") or os.environ.get("GIT_TOKEN")
         self._registry = registry
         self.use_api_for_github = use_api_for_github
+        # URL -> (expiry time, ETag, Last-Modified, parsed JSON), in least
+        # recently used order
+        self._api_cache: OrderedDict[
+            str, tuple[float, str | None, str | None, Any]
+        ] = OrderedDict()
 
     def set_registry(self, registry: Any):
         """Set the extractor registry."""
@@ -171,17 +242,12 @@ class GitExtractor(BaseExtractor):
             git_dir = path / ".git"
             return git_dir.exists() and git_dir.is_dir()
 
-        # Check GitHub URL patterns (file, tree, repo)
-        for pattern in self.GITHUB_PATTERNS.values():
-            if re.match(pattern, source_str, re.IGNORECASE):
-                return True
-
-        # Check git URL patterns
-        for pattern in self.GIT_URL_PATTERNS:
-            if re.match(pattern, source_str, re.IGNORECASE):
-                return True
-
-        return False
+        # Check GitHub URL patterns (file, tree, repo) and git URL patterns
+        match = self._SUPPORTED_RE.match(source_str)
+        if match is None:
+            return False
+        # A GitHub blob or raw URL without a path is not a file
+        return match["kind"] not in ("blob", "raw") or bool(match["path"])
 
     async def extract(self, source: str | Path) -> ExtractionResult:
         """Extract content from a git repository or GitHub URL."""
@@ -201,14 +267,16 @@ class GitExtractor(BaseExtractor):
         if github_parsed and self.use_api_for_github:
             url_type = github_parsed["url_type"]
 
-            # For single files and directories, use GitHub API (faster)
-            if url_type in ("file", "tree", "raw"):
-                return await self._extract_via_github_api(github_parsed, source_str)
+            # API requests share one connection pool (and TLS session)
+            async with shared_http_client():
+                # For single files and directories, use GitHub API (faster)
+                if url_type in ("file", "tree", "raw"):
+                    return await self._extract_via_github_api(github_parsed, source_str)
 
-            # For full repo, clone is more comprehensive
-            # But we can still get metadata via API
-            if url_type == "repo":
-                return await self._extract_github_repo_hybrid(github_parsed, source_str)
+                # For full repo, clone is more comprehensive
+                # But we can still get metadata via API
+                if url_type == "repo":
+                    return await self._extract_github_repo_hybrid(github_parsed, source_str)
 
         # For all other URLs, clone the repository
         return await self._extract_from_remote_repo(source_str)
@@ -219,51 +287,22 @@ class GitExtractor(BaseExtractor):
         """Parse a GitHub URL to extract components."""
         url = str(url).rstrip("/")
 
-        # Repository root
-        match = re.match(self.GITHUB_PATTERNS["repo"], url)
-        if match:
-            return {
-                "owner": match.group(1),
-                "repo": match.group(2),
-                "branch": None,
-                "path": "",
-                "url_type": "repo",
-            }
-
-        # File
-        match = re.match(self.GITHUB_PATTERNS["file"], url)
-        if match:
-            return {
-                "owner": match.group(1),
-                "repo": match.group(2),
-                "branch": match.group(3),
-                "path": match.group(4),
-                "url_type": "file",
-            }
-
-        # Directory
-        match = re.match(self.GITHUB_PATTERNS["tree"], url)
-        if match:
-            return {
-                "owner": match.group(1),
-                "repo": match.group(2),
-                "branch": match.group(3),
-                "path": match.group(4),
-                "url_type": "tree",
-            }
-
-        # Raw file
-        match = re.match(self.GITHUB_PATTERNS["raw"], url)
-        if match:
-            return {
-                "owner": match.group(1),
-                "repo": match.group(2),
-                "branch": match.group(3),
-                "path": match.group(4),
-                "url_type": "raw",
-            }
-
-        return None
+        match = self._GITHUB_RE.match(url)
+        if match is None:
+            return None
+
+        kind = match["kind"]
+        path = match["path"] or ""
+        if kind in ("blob", "raw") and not path:
+            return None
+
+        return {
+            "owner": match["owner"],
+            "repo": match["repo"],
+            "branch": match["branch"],
+            "path": path,
+            "url_type": self._GITHUB_URL_TYPES[kind],
+        }
 
     def _get_api_headers(self) -> dict:
         """Get HTTP headers for GitHub API requests."""
@@ -276,13 +315,93 @@ class GitExtractor(BaseExtractor):
         return headers
 
     async def _api_request(self, url: str) -> Any:
-        """Make a request to GitHub API."""
-        import httpx
+        """Make a request to GitHub API.
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self._get_api_headers(), timeout=30.0)
+        Responses are cached by URL. A fresh entry is returned without a
+        request; a stale one is revalidated with ``If-None-Match`` /
+        ``If-Modified-Since``, and a 304 reply (which does not count
+        against the rate limit) renews it. Validated responses are also
+        kept on disk, so later runs revalidate rather than re-download.
+        """
+        cached = self._api_cache.get(url)
+        if cached is None:
+            cached = self._read_api_cache_file(url)
+        else:
+            self._api_cache.move_to_end(url)
+            if time.monotonic() < cached[0]:
+                return cached[3]
+
+        headers = self._get_api_headers()
+        if cached is not None:
+            _, etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async with http_client() as client:
+            response = await client.get(url, headers=headers, timeout=30.0)
+        if cached is not None and response.status_code == 304:
+            _, etag, last_modified, data = cached
+        else:
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+            self._write_api_cache_file(url, etag, last_modified, data)
+
+        self._api_cache[url] = (time.monotonic() + self.API_CACHE_TTL, etag, last_modified, data)
+        self._api_cache.move_to_end(url)
+        if len(self._api_cache) > self.API_CACHE_SIZE:
+            self._api_cache.popitem(last=False)
+        return data
+
+    def _api_cache_path(self, url: str) -> Path | None:
+        """Get the on-disk cache file for a GitHub API URL.
+
+        The key includes the token, so responses fetched with one token's
+        access are not revalidated with another's.
+        """
+        root = cache_dir()
+        if root is None:
+            return None
+        key = hashlib.blake2b(f"{self.token}\n{url}".encode(), digest_size=16).hexdigest()
+        return root / "github" / "api" / f"{key}.json"
+
+    def _read_api_cache_file(self, url: str) -> tuple[float, str | None, str | None, Any] | None:
+        """Read a response from the on-disk cache, as an expired cache entry."""
+        path = self._api_cache_path(url)
+        if path is None:
+            return None
+        try:
+            cached = json.loads(path.read_bytes())
+            if cached["url"] != url:
+                return None
+            return (0.0, cached["etag"], cached["last_modified"], cached["body"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_api_cache_file(
+        self, url: str, etag: str | None, last_modified: str | None, data: Any
+    ) -> None:
+        """Store a response in the on-disk cache, if it can be revalidated."""
+        if not (etag or last_modified):
+            return
+        path = self._api_cache_path(url)
+        if path is None:
+            return
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": data,
+            }))
+            tmp_path.replace(path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
 
     async def _extract_via_github_api(
         self, parsed: dict[str, Any], url: str
@@ -322,12 +441,9 @@ class GitExtractor(BaseExtractor):
         self, owner: str, repo: str, branch: str, path: str, url: str
     ) -> ExtractionResult:
         """Extract a single file via GitHub API."""
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
-        data = await self._api_request(api_url)
-
-        content = "*File content could not be retrieved*"
-        if data.get("content"):
-            content = base64.b64decode(data["content"]).decode("utf-8", errors="replace")
+        content = await self._get_file_content(owner, repo, branch, path)
+        if content is None:
+            content = "*File content could not be retrieved*"
 
         filename = path.split("/")[-1]
         lang = self._detect_language(Path(filename))
@@ -382,8 +498,19 @@ class GitExtractor(BaseExtractor):
             "",
         ]
 
-        dirs = [item for item in contents if item.get("type") == "dir"]
-        files = [item for item in contents if item.get("type") == "file"]
+        # Sort the listing into directories, files and files to fetch in
+        # one pass
+        dirs: list[dict[str, Any]] = []
+        files: list[dict[str, Any]] = []
+        eligible: list[dict[str, Any]] = []
+        for item in contents:
+            item_type = item.get("type")
+            if item_type == "dir":
+                dirs.append(item)
+            elif item_type == "file":
+                files.append(item)
+                if len(eligible) < self.config.max_total_files and self._is_wanted_api_file(item):
+                    eligible.append(item)
 
         if dirs:
             markdown_parts.append("### Directories")
@@ -405,37 +532,22 @@ class GitExtractor(BaseExtractor):
         markdown_parts.append("## File Contents")
         markdown_parts.append("")
 
-        extracted_count = 0
-        for item in files:
-            if extracted_count >= self.config.max_total_files:
-                break
+        file_contents = await self._get_directory_files(owner, repo, branch, eligible)
 
+        # Add them in listing order, skipping files that could not be fetched
+        for item, content in zip(eligible, file_contents, strict=True):
+            if content is None:
+                continue
             name = item.get("name", "")
-            size = item.get("size", 0)
-            file_path = item.get("path", "")
-            ext = Path(name).suffix.lower()
-
-            is_important = name.lower() in self.config.important_files
-            is_code = ext in self.config.include_extensions
-
-            if (is_important or is_code) and size <= self.config.max_file_size:
-                try:
-                    file_api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}?ref={branch}"
-                    file_data = await self._api_request(file_api_url)
-                    if file_data.get("content"):
-                        content = base64.b64decode(file_data["content"]).decode("utf-8", errors="replace")
-                        lang = self._detect_language(Path(name))
-                        markdown_parts.extend([
-                            f"### {name}",
-                            "",
-                            f"```{lang}",
-                            content,
-                            "```",
-                            "",
-                        ])
-                        extracted_count += 1
-                except Exception:
-                    pass
+            lang = self._detect_language(Path(name))
+            markdown_parts.extend([
+                f"### {name}",
+                "",
+                f"```{lang}",
+                content,
+                "```",
+                "",
+            ])
 
         return ExtractionResult(
             markdown="\n".join(markdown_parts),
@@ -454,6 +566,205 @@ class GitExtractor(BaseExtractor):
             },
         )
 
+    def _is_wanted_api_file(self, item: dict[str, Any]) -> bool:
+        """Check if a file in a GitHub API listing should be fetched."""
+        name = item.get("name", "")
+        ext = os.path.splitext(name)[1].lower()
+
+        is_important = name.lower() in self.config.important_files
+        is_code = ext in self.config.include_extensions
+
+        return (is_important or is_code) and item.get("size", 0) <= self.config.max_file_size
+
+    async def _get_directory_files(
+        self, owner: str, repo: str, branch: str, items: list[dict[str, Any]]
+    ) -> list[str | None]:
+        """Get the text of several files in a GitHub repository.
+
+        Files already in the blob cache are read from disk. If many of the
+        rest are needed they are read from one zipball of the repository;
+        any still missing are fetched concurrently.
+
+        Args:
+            items: Files from a GitHub API directory listing
+
+        Returns:
+            Each file's content, or None if it could not be fetched
+        """
+        paths = [item.get("path", "") for item in items]
+        shas = [item.get("sha") for item in items]
+        blobs = [self._read_cached_blob(sha) for sha in shas]
+        missing = [i for i, blob in enumerate(blobs) if blob is None]
+
+        if len(missing) >= self.ZIPBALL_MIN_FILES:
+            archive = await self._get_zipball(owner, repo, branch)
+            if archive is not None:
+                with archive:
+                    zipped = self._read_zipball_files(archive, [paths[i] for i in missing])
+                for i, data in zip(missing, zipped, strict=True):
+                    if data is not None:
+                        self._cache_blob(shas[i], data)
+                        blobs[i] = data
+                # Files not in the archive (e.g. export-ignore) are fetched below
+                missing = [i for i in missing if blobs[i] is None]
+
+        # Fetch the files concurrently, a few requests at a time
+        semaphore = asyncio.Semaphore(self.API_CONCURRENCY)
+
+        async def fetch(path: str) -> bytes | None:
+            try:
+                async with semaphore:
+                    return await self._fetch_file(owner, repo, branch, path)
+            except Exception:
+                return None
+
+        fetched = await asyncio.gather(*(fetch(paths[i]) for i in missing))
+        for i, data in zip(missing, fetched, strict=True):
+            if data is not None:
+                self._cache_blob(shas[i], data)
+                blobs[i] = data
+
+        return [None if blob is None else blob.decode("utf-8", errors="replace") for blob in blobs]
+
+    async def _get_file_content(
+        self, owner: str, repo: str, branch: str, path: str, sha: str | None = None
+    ) -> str | None:
+        """Get the text of a file in a GitHub repository.
+
+        Args:
+            sha: The file's blob SHA, if known, to use the blob cache
+
+        Returns:
+            The file content, or None if the API has no content for it
+
+        Raises:
+            httpx.HTTPError: If a request fails
+        """
+        data = self._read_cached_blob(sha)
+        if data is None:
+            data = await self._fetch_file(owner, repo, branch, path)
+            if data is None:
+                return None
+            self._cache_blob(sha, data)
+        return data.decode("utf-8", errors="replace")
+
+    async def _fetch_file(self, owner: str, repo: str, branch: str, path: str) -> bytes | None:
+        """Download a file from a GitHub repository.
+
+        The file is downloaded as is from raw.githubusercontent.com. The
+        contents API, which wraps it in base64 inside JSON, is only used
+        when that returns 404 (e.g. for a submodule).
+
+        Returns:
+            The file's bytes, or None if the API has no content for it
+
+        Raises:
+            httpx.HTTPError: If a request fails
+        """
+        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{quote(path)}"
+        async with http_client() as client:
+            response = await client.get(raw_url, headers=self._get_api_headers(), timeout=30.0)
+        if response.status_code != 404:
+            response.raise_for_status()
+            return response.content
+
+        api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
+        data = await self._api_request(api_url)
+        if not data.get("content"):
+            return None
+        return base64.b64decode(data["content"])
+
+    @staticmethod
+    def _blob_cache_path(sha: str | None) -> Path | None:
+        """Get the blob cache file for a git blob SHA.
+
+        Blobs are content-addressed, so cached files never go stale.
+
+        Returns:
+            The path, or None if there is no valid SHA or caching is
+            disabled
+        """
+        if not sha or _BLOB_SHA_RE.fullmatch(sha) is None:
+            return None
+        root = cache_dir()
+        if root is None:
+            return None
+        return root / "github" / "blobs" / sha[:2] / sha
+
+    def _read_cached_blob(self, sha: str | None) -> bytes | None:
+        """Read a blob from the blob cache."""
+        path = self._blob_cache_path(sha)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _cache_blob(self, sha: str | None, data: bytes) -> None:
+        """Add a blob to the blob cache.
+
+        The blob is written to a temporary file that is renamed into
+        place, so readers never see a partial file. Data is fetched by
+        branch name, which may have moved since the SHA was listed, so it
+        is only cached if it hashes to that SHA.
+        """
+        path = self._blob_cache_path(sha)
+        if sha is None or path is None or _git_blob_sha(data, sha256=len(sha) == 64) != sha:
+            return
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    async def _get_zipball(self, owner: str, repo: str, branch: str) -> zipfile.ZipFile | None:
+        """Download a repository's zipball at a branch.
+
+        Returns:
+            The archive, or None if the repository is too large or the
+            download fails
+        """
+        try:
+            repo_data = await self._api_request(f"https://api.github.com/repos/{owner}/{repo}")
+            if repo_data.get("size", 0) > self.ZIPBALL_MAX_SIZE:
+                return None
+
+            # Redirects to codeload.github.com, which serves the archive
+            zip_url = f"https://api.github.com/repos/{owner}/{repo}/zipball/{branch}"
+            async with http_client() as client:
+                response = await client.get(
+                    zip_url, headers=self._get_api_headers(), timeout=60.0, follow_redirects=True
+                )
+                response.raise_for_status()
+            return zipfile.ZipFile(io.BytesIO(response.content))
+        except Exception:
+            return None
+
+    @staticmethod
+    def _read_zipball_files(archive: zipfile.ZipFile, paths: list[str]) -> list[bytes | None]:
+        """Read files from a repository zipball by their repository paths.
+
+        The archive's entries sit under one ``{owner}-{repo}-{sha}/``
+        directory. Entries are only looked up by the names built from the
+        given paths; nothing is extracted to disk.
+
+        Returns:
+            Each file's bytes, or None if it is not in the archive
+        """
+        names = archive.namelist()
+        root = names[0].split("/", 1)[0] if names else ""
+
+        contents: list[bytes | None] = []
+        for path in paths:
+            try:
+                contents.append(archive.read(f"{root}/{path}"))
+            except (KeyError, zipfile.BadZipFile):
+                contents.append(None)
+        return contents
+
     async def _extract_github_repo_hybrid(
         self, parsed: dict[str, Any], url: str
     ) -> ExtractionResult:
@@ -481,40 +792,13 @@ class GitExtractor(BaseExtractor):
         except Exception:
             pass
 
-        # Clone the repository
-        result = await self._extract_from_remote_repo(url)
+        # Clone the repository; GitHub stats go into its markdown as it is built
+        result = await self._extract_from_remote_repo(url, github_metadata)
 
         # Merge GitHub metadata into result
         if github_metadata:
             result.metadata.update(github_metadata)
 
-            # Add GitHub stats to markdown
-            if result.markdown and "## Repository Info" in result.markdown:
-                stats_lines = []
-                if github_metadata.get("stars"):
-                    stats_lines.append(f"- **Stars:** {github_metadata['stars']:,}")
-                if github_metadata.get("forks"):
-                    stats_lines.append(f"- **Forks:** {github_metadata['forks']:,}")
-                if github_metadata.get("language"):
-                    stats_lines.append(f"- **Language:** {github_metadata['language']}")
-                if github_metadata.get("license"):
-                    stats_lines.append(f"- **License:** {github_metadata['license']}")
-                if github_metadata.get("topics"):
-                    stats_lines.append(f"- **Topics:** {', '.join(github_metadata['topics'])}")
-                if github_metadata.get("description"):
-                    # Add description after title
-                    result.markdown = result.markdown.replace(
-                        "\n\n## Repository Info",
-                        f"\n\n> {github_metadata['description']}\n\n## Repository Info"
-                    )
-
-                if stats_lines:
-                    stats_text = "\n".join(stats_lines)
-                    result.markdown = result.markdown.replace(
-                        "## Repository Info\n\n",
-                        f"## Repository Info\n\n{stats_text}\n"
-                    )
-
         return result
 
     # ==================== Git Clone Methods ====================
@@ -549,21 +833,22 @@ class GitExtractor(BaseExtractor):
                 metadata={"error": "Empty file"},
             )
 
-        # Process each repository
+        # Process each repository, with one HTTP client for all of them
         results: list[ExtractionResult] = []
-        for repo_url in repos:
-            try:
-                result = await self.extract(repo_url)
-                results.append(result)
-            except Exception as e:
-                results.append(ExtractionResult(
-                    markdown=f"# Error\n\nFailed to process {repo_url}: {e}",
-                    title="Error",
-                    source=repo_url,
-                    media_type=MediaType.GIT,
-                    images=[],
-                    metadata={"error": str(e)},
-                ))
+        async with shared_http_client():
+            for repo_url in repos:
+                try:
+                    result = await self.extract(repo_url)
+                    results.append(result)
+                except Exception as e:
+                    results.append(ExtractionResult(
+                        markdown=f"# Error\n\nFailed to process {repo_url}: {e}",
+                        title="Error",
+                        source=repo_url,
+                        media_type=MediaType.GIT,
+                        images=[],
+                        metadata={"error": str(e)},
+                    ))
 
         return self._combine_results(results, file_path)
 
@@ -609,7 +894,9 @@ class GitExtractor(BaseExtractor):
             },
         )
 
-    async def _extract_from_remote_repo(self, url: str) -> ExtractionResult:
+    async def _extract_from_remote_repo(
+        self, url: str, github_metadata: dict[str, Any] | None = None
+    ) -> ExtractionResult:
         """Clone and extract from a remote repository."""
         repo_name = self._parse_repo_name(url)
 
@@ -628,7 +915,7 @@ class GitExtractor(BaseExtractor):
                     metadata={"error": str(e), "url": url},
                 )
 
-            return await self._extract_from_local_repo(clone_path, url)
+            return await self._extract_from_local_repo(clone_path, url, github_metadata)
 
     async def _clone_repo(self, url: str, target_path: Path) -> None:
         """Clone a git repository."""
@@ -691,7 +978,7 @@ class GitExtractor(BaseExtractor):
                 )
 
     async def _extract_from_local_repo(
-        self, repo_path: Path, source: str
+        self, repo_path: Path, source: str, github_metadata: dict[str, Any] | None = None
     ) -> ExtractionResult:
         """Extract content from a local git repository."""
         repo_name = repo_path.name
@@ -708,6 +995,7 @@ class GitExtractor(BaseExtractor):
             structure=structure,
             files=files_content,
             source=source,
+            github_metadata=github_metadata,
         )
 
         return ExtractionResult(
@@ -880,9 +1168,7 @@ class GitExtractor(BaseExtractor):
 
             is_important = name_lower in self.config.important_files
             is_included_ext = ext in self.config.include_extensions
-            is_no_ext_text = ext == "" and name_lower in {
-                "license", "readme", "changelog", "contributing", "makefile", "dockerfile"
-            }
+            is_no_ext_text = ext == "" and name_lower in self.NO_EXTENSION_TEXT_FILES
 
             if not (is_important or is_included_ext or is_no_ext_text):
                 if self.config.include_binary_metadata and ext in self.BINARY_EXTENSIONS:
@@ -930,34 +1216,11 @@ class GitExtractor(BaseExtractor):
 
     def _detect_language(self, file_path: Path) -> str:
         """Detect the programming language for syntax highlighting."""
-        ext_to_lang = {
-            ".py": "python", ".js": "javascript", ".ts": "typescript",
-            ".jsx": "jsx", ".tsx": "tsx", ".java": "java",
-            ".c": "c", ".cpp": "cpp", ".h": "c", ".hpp": "cpp",
-            ".go": "go", ".rs": "rust", ".rb": "ruby", ".php": "php",
-            ".swift": "swift", ".kt": "kotlin", ".scala": "scala",
-            ".r": "r", ".R": "r",
-            ".sh": "bash", ".bash": "bash", ".zsh": "zsh", ".fish": "fish",
-            ".ps1": "powershell", ".bat": "batch", ".cmd": "batch",
-            ".html": "html", ".css": "css", ".scss": "scss", ".sass": "sass", ".less": "less",
-            ".vue": "vue", ".svelte": "svelte",
-            ".json": "json", ".yaml": "yaml", ".yml": "yaml", ".toml": "toml",
-            ".xml": "xml", ".ini": "ini", ".cfg": "ini", ".conf": "conf",
-            ".md": "markdown", ".rst": "rst",
-            ".sql": "sql", ".graphql": "graphql", ".proto": "protobuf",
-            ".dockerfile": "dockerfile", ".makefile": "makefile", ".cmake": "cmake",
-            ".gradle": "gradle",
-        }
+        language = self.FILENAME_TO_LANGUAGE.get(file_path.name.lower())
+        if language is not None:
+            return language
 
-        name_lower = file_path.name.lower()
-        if name_lower == "dockerfile":
-            return "dockerfile"
-        if name_lower == "makefile":
-            return "makefile"
-        if name_lower in {"gemfile", "rakefile"}:
-            return "ruby"
-
-        return ext_to_lang.get(file_path.suffix.lower(), "")
+        return self.EXTENSION_TO_LANGUAGE.get(file_path.suffix.lower(), "")
 
     def _build_markdown(
         self,
@@ -966,11 +1229,30 @@ class GitExtractor(BaseExtractor):
         structure: str,
         files: list[dict[str, Any]],
         source: str,
+        github_metadata: dict[str, Any] | None = None,
     ) -> str:
-        """Build the final markdown document."""
+        """Build the final markdown document.
+
+        ``github_metadata`` (from the GitHub API) adds the repository's
+        description and stats.
+        """
+        github_metadata = github_metadata or {}
         lines = [f"# {repo_name}", ""]
 
+        if github_metadata.get("description"):
+            lines.extend([f"> {github_metadata['description']}", ""])
+
         lines.extend(["## Repository Info", ""])
+        if github_metadata.get("stars"):
+            lines.append(f"- **Stars:** {github_metadata['stars']:,}")
+        if github_metadata.get("forks"):
+            lines.append(f"- **Forks:** {github_metadata['forks']:,}")
+        if github_metadata.get("language"):
+            lines.append(f"- **Language:** {github_metadata['language']}")
+        if github_metadata.get("license"):
+            lines.append(f"- **License:** {github_metadata['license']}")
+        if github_metadata.get("topics"):
+            lines.append(f"- **Topics:** {', '.join(github_metadata['topics'])}")
         lines.append(f"- **Source:** `{source}`")
 
         if metadata.get("branch"):
@@ -990,9 +1272,24 @@ class GitExtractor(BaseExtractor):
             "```", structure, "```", "",
         ])
 
-        text_files = [f for f in files if f.get("type") == "text"]
-        skipped_files = [f for f in files if f.get("type") == "skipped"]
-        binary_files = [f for f in files if f.get("type") == "binary"]
+        # Group the files by type in one pass
+        text_files: list[dict[str, Any]] = []
+        readme_files: list[dict[str, Any]] = []
+        code_files: list[dict[str, Any]] = []
+        skipped_files: list[dict[str, Any]] = []
+        binary_files: list[dict[str, Any]] = []
+        for f in files:
+            file_type = f.get("type")
+            if file_type == "text":
+                text_files.append(f)
+                if f["path"].lower().startswith("readme"):
+                    readme_files.append(f)
+                else:
+                    code_files.append(f)
+            elif file_type == "skipped":
+                skipped_files.append(f)
+            elif file_type == "binary":
+                binary_files.append(f)
 
         lines.extend([
             "## File Statistics", "",
@@ -1003,12 +1300,10 @@ class GitExtractor(BaseExtractor):
             lines.append(f"- **Binary Files:** {len(binary_files)}")
         lines.extend(["", ""])
 
-        readme_files = [f for f in text_files if f["path"].lower().startswith("readme")]
         if readme_files:
             readme = readme_files[0]
             lines.extend(["## README", "", readme["content"], ""])
 
-        code_files = [f for f in text_files if not f["path"].lower().startswith("readme")]
         if code_files:
             lines.extend(["## Source Files", ""])
 
@@ -1066,3 +1361,14 @@ def parse_download_git_file(path: Path) -> list[str]:
     except Exception:
         pass
     return urls
+
+
+def _git_blob_sha(data: bytes, sha256: bool = False) -> str:
+    """Compute the git blob ID of some file content.
+
+    Args:
+        data: The file content
+        sha256: Hash as a SHA-256 repository does, instead of SHA-1
+    """
+    header = b"blob %d\0" % len(data)
+    return (hashlib.sha256 if sha256 else hashlib.sha1)(header + data).hexdigest()
@@ -1,5 +1,6 @@
 """Image extractor with EXIF metadata extraction."""
 
+import re
 from pathlib import Path
 from typing import Any
 
@@ -97,8 +98,6 @@ class ImageExtractor(BaseExtractor):
 
     def _extract_svg(self, path: Path, content: bytes) -> ExtractionResult:
         """Extract metadata from an SVG file."""
-        import re
-
         # Try to decode the content
         try:
             svg_text = content.decode('utf-8')
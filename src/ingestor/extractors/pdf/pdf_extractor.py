@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+from ...core.http import http_client
 from ...types import ExtractedImage, ExtractionResult, MediaType
 from ..base import BaseExtractor
 
@@ -133,8 +134,6 @@ class PdfExtractor(BaseExtractor):
         Returns:
             Path to temporary PDF file
         """
-        import httpx
-
         # Extract filename from URL
         parsed = urlparse(url)
         path_part = parsed.path.split("?")[0].split("#")[0]
@@ -143,8 +142,8 @@ class PdfExtractor(BaseExtractor):
             filename = filename + ".pdf"
 
         # Download to temp file
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-            response = await client.get(url)
+        async with http_client() as client:
+            response = await client.get(url, timeout=60.0, follow_redirects=True)
             response.raise_for_status()
 
             # Create temp file
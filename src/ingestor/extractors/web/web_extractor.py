@@ -1,5 +1,7 @@
 """Web content extractor using Crawl4AI."""
 
+import re
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -7,6 +9,9 @@ from urllib.parse import urlparse
 from ...types import ExtractedImage, ExtractionResult, MediaType
 from ..base import BaseExtractor
 
+# Markdown image: ![alt](url)
+_MARKDOWN_IMAGE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
 
 class WebExtractor(BaseExtractor):
     """Extract content from web pages using Crawl4AI.
@@ -112,14 +117,18 @@ class WebExtractor(BaseExtractor):
                 },
             )
 
-    async def crawl_deep(self, source: str | Path) -> list[ExtractionResult]:
+    async def crawl_deep(self, source: str | Path) -> AsyncIterator[ExtractionResult]:
         """Perform deep crawling of a website.
 
+        Pages are streamed from the crawler and yielded as soon as each
+        one is fetched, so callers can process results while the crawl
+        continues.
+
         Args:
             source: Starting URL
 
-        Returns:
-            List of extraction results for each page
+        Yields:
+            Extraction result for each successfully crawled page
         """
         from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
         from crawl4ai.deep_crawling import BFSDeepCrawlStrategy, DFSDeepCrawlStrategy
@@ -153,16 +162,11 @@ class WebExtractor(BaseExtractor):
         run_config = CrawlerRunConfig(
             deep_crawl_strategy=strategy,
             wait_until="networkidle",
+            stream=True,
         )
 
-        results = []
         async with AsyncWebCrawler(config=browser_config) as crawler:
-            crawl_results = await crawler.arun(url=url, config=run_config)
-            # Handle both list and single result
-            if not isinstance(crawl_results, list):
-                crawl_results = [crawl_results]
-
-            for result in crawl_results:
+            async for result in await crawler.arun(url=url, config=run_config):
                 if result.success:
                     markdown = result.markdown or ""
                     title = result.metadata.get("title", "") if result.metadata else ""
@@ -172,16 +176,14 @@ class WebExtractor(BaseExtractor):
                     if image_url_map:
                         markdown = self._rewrite_image_paths(markdown, image_url_map)
 
-                    results.append(ExtractionResult(
+                    yield ExtractionResult(
                         markdown=markdown,
                         title=title,
                         source=result.url,
                         media_type=MediaType.WEB,
                         images=images,
                         metadata={"url": result.url},
-                    ))
-
-        return results
+                    )
 
     def _read_url_file(self, path: Path) -> str:
         """Read URL from a .url file.
@@ -253,11 +255,6 @@ class WebExtractor(BaseExtractor):
         Returns:
             Markdown with rewritten image paths
         """
-        import re
-
-        # Pattern to match markdown images: ![alt](url)
-        img_pattern = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
-
         def replace_url(match):
             alt_text = match.group(1)
             original_url = match.group(2)
@@ -275,7 +272,7 @@ class WebExtractor(BaseExtractor):
             # Keep original if we don't have it extracted
             return match.group(0)
 
-        return img_pattern.sub(replace_url, markdown)
+        return _MARKDOWN_IMAGE.sub(replace_url, markdown)
 
     def supports(self, source: str | Path) -> bool:
         """Check if this extractor handles the source.
@@ -8,6 +8,19 @@ from urllib.parse import parse_qs, urlparse
 from ...types import ExtractionResult, MediaType
 from ..base import BaseExtractor
 
+# Video ID in the various YouTube URL formats (watch, short link, embed,
+# /v/ and shorts)
+_VIDEO_ID_IN_URL = re.compile(
+    r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/"
+    r"|youtube\.com/v/|youtube\.com/shorts/)([a-zA-Z0-9_-]{11})"
+)
+_VIDEO_ID = re.compile(r"^[a-zA-Z0-9_-]{11}$")
+
+# Any YouTube URL this extractor handles
+_YOUTUBE_URL = re.compile(
+    r"youtube\.com/(?:watch|embed/|v/|shorts/|playlist)|youtu\.be/"
+)
+
 
 class YouTubeExtractor(BaseExtractor):
     """Extract transcripts and metadata from YouTube videos.
@@ -288,19 +301,12 @@ class YouTubeExtractor(BaseExtractor):
             Video ID or None
         """
         # Handle various YouTube URL formats
-        patterns = [
-            r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})",
-            r"youtube\.com/v/([a-zA-Z0-9_-]{11})",
-            r"youtube\.com/shorts/([a-zA-Z0-9_-]{11})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _VIDEO_ID_IN_URL.search(url)
+        if match:
+            return match.group(1)
 
         # Check if it's already just an ID
-        if re.match(r"^[a-zA-Z0-9_-]{11}$", url):
+        if _VIDEO_ID.match(url):
             return url
 
         # Try parsing as URL
@@ -324,16 +330,5 @@ class YouTubeExtractor(BaseExtractor):
         Returns:
             True if this is a YouTube URL
         """
-        source_str = str(source)
-
         # Check for YouTube URLs
-        youtube_patterns = [
-            r"youtube\.com/watch",
-            r"youtu\.be/",
-            r"youtube\.com/embed/",
-            r"youtube\.com/v/",
-            r"youtube\.com/shorts/",
-            r"youtube\.com/playlist",
-        ]
-
-        return any(re.search(pattern, source_str) for pattern in youtube_patterns)
+        return _YOUTUBE_URL.search(str(source)) is not None
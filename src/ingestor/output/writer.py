@@ -1,7 +1,10 @@
 """Output writer for extraction results."""
 
+import asyncio
 import json
+from collections.abc import Coroutine
 from pathlib import Path
+from typing import Any
 
 import aiofiles
 
@@ -51,6 +54,8 @@ class OutputWriter:
         output_dir = self.config.output_dir / name
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        writes: list[Coroutine[Any, Any, None]] = []
+
         # Process and write images
         if result.has_images:
             img_dir = output_dir / "img"
@@ -61,18 +66,21 @@ class OutputWriter:
                 source_name=name,
             )
 
-            for image in processed_images:
-                img_path = img_dir / image.filename
-                async with aiofiles.open(img_path, "wb") as f:
-                    await f.write(image.data)
+            writes.extend(
+                self._write_bytes(img_dir / image.filename, image.data)
+                for image in processed_images
+            )
 
             # Update result with processed images for metadata
             result.images = processed_images
 
         # Write markdown
         md_path = output_dir / f"{name}.md"
-        async with aiofiles.open(md_path, "w", encoding="utf-8") as f:
-            await f.write(result.markdown)
+        writes.append(self._write_text(md_path, result.markdown))
+
+        # Files are independent, so write them concurrently rather than
+        # awaiting each aiofiles round trip in turn
+        await asyncio.gather(*writes)
 
         # Write metadata if enabled
         if self.config.generate_metadata:
@@ -80,6 +88,16 @@ class OutputWriter:
 
         return output_dir
 
+    async def _write_bytes(self, path: Path, data: bytes) -> None:
+        """Write binary data to a file."""
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(data)
+
+    async def _write_text(self, path: Path, text: str) -> None:
+        """Write UTF-8 text to a file."""
+        async with aiofiles.open(path, "w", encoding="utf-8") as f:
+            await f.write(text)
+
     async def _write_metadata(self, result: ExtractionResult, path: Path) -> None:
         """Write metadata JSON file.
 
@@ -107,8 +125,7 @@ class OutputWriter:
             **result.metadata,
         }
 
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(metadata, indent=2, ensure_ascii=False))
+        await self._write_text(path, json.dumps(metadata, indent=2, ensure_ascii=False))
 
     def _clean_name(self, source: str) -> str:
         """Clean a source name for use as a directory/file name.
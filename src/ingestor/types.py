@@ -45,6 +45,11 @@ class MediaType(Enum):
     # Unknown
     UNKNOWN = "unknown"
 
+    # Members are singletons compared by identity, so hash by identity
+    # too. Enum's default hashes the member name in Python code, which is
+    # slow for the registry and detector tables keyed by MediaType.
+    __hash__ = object.__hash__
+
 
 @dataclass
 class ExtractedImage:
@@ -116,3 +121,8 @@ class IngestConfig:
     # VLM options
     ollama_host: str = "http://localhost:11434"
     vlm_model: str = "llava:7b"
+
+    def __post_init__(self):
+        # Accept plain strings (e.g. raw CLI values); convert once here
+        if not isinstance(self.output_dir, Path):
+            self.output_dir = Path(self.output_dir)
@@ -31,22 +31,69 @@ Example:
     >>> refs = parser.parse_file("research_report.md")
 """
 
-# Orchestration layer (from paper-acq)
-from .acquisition.config import Config
-from .acquisition.downloader import DownloadConfig, PaperDownloader
-from .acquisition.logger import RetrievalLogger
-from .acquisition.rate_limiter import RateLimiter
-from .acquisition.retriever import PaperRetriever, RetrievalResult, RetrievalStatus
-from .doi2bib.metadata import Author, PaperMetadata, get_metadata
-from .doi2bib.resolver import IdentifierType, PaperIdentifier, resolve_identifier
-from .doi2bib.verifier import (
-    BibEntry,
-    CitationVerifier,
-    VerificationResult,
-    VerificationStats,
-    parse_bib_file,
-)
-from .parser import ParsedReference, ReferenceType, ResearchParser
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .acquisition.config import Config
+    from .acquisition.downloader import DownloadConfig, PaperDownloader
+    from .acquisition.logger import RetrievalLogger
+    from .acquisition.rate_limiter import RateLimiter
+    from .acquisition.retriever import PaperRetriever, RetrievalResult, RetrievalStatus
+    from .doi2bib.metadata import Author, PaperMetadata, get_metadata
+    from .doi2bib.resolver import IdentifierType, PaperIdentifier, resolve_identifier
+    from .doi2bib.verifier import (
+        BibEntry,
+        CitationVerifier,
+        VerificationResult,
+        VerificationStats,
+        parse_bib_file,
+    )
+    from .parser import ParsedReference, ReferenceType, ResearchParser
+
+# Public name -> defining module. Resolved on first attribute access so
+# that starting the CLI (which imports this package) does not load the
+# retriever, clients and httpx for commands that never use them.
+_LAZY_EXPORTS = {
+    "PaperDownloader": ".acquisition.downloader",
+    "DownloadConfig": ".acquisition.downloader",
+    "PaperIdentifier": ".doi2bib.resolver",
+    "IdentifierType": ".doi2bib.resolver",
+    "resolve_identifier": ".doi2bib.resolver",
+    "PaperMetadata": ".doi2bib.metadata",
+    "Author": ".doi2bib.metadata",
+    "get_metadata": ".doi2bib.metadata",
+    "ResearchParser": ".parser",
+    "ParsedReference": ".parser",
+    "ReferenceType": ".parser",
+    "CitationVerifier": ".doi2bib.verifier",
+    "BibEntry": ".doi2bib.verifier",
+    "VerificationResult": ".doi2bib.verifier",
+    "VerificationStats": ".doi2bib.verifier",
+    "parse_bib_file": ".doi2bib.verifier",
+    "Config": ".acquisition.config",
+    "RateLimiter": ".acquisition.rate_limiter",
+    "RetrievalLogger": ".acquisition.logger",
+    "PaperRetriever": ".acquisition.retriever",
+    "RetrievalResult": ".acquisition.retriever",
+    "RetrievalStatus": ".acquisition.retriever",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Main downloader
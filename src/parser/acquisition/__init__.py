@@ -12,19 +12,56 @@ Key Features:
 - API clients for various sources
 """
 
-from .config import Config
-from .downloader import (
-    DownloadConfig,
-    DownloadResult,
-    PaperDownloader,
-)
-from .logger import RetrievalLogger
-from .rate_limiter import RateLimiter
-from .retriever import (
-    PaperRetriever,
-    RetrievalResult,
-    RetrievalStatus,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .downloader import (
+        DownloadConfig,
+        DownloadResult,
+        PaperDownloader,
+    )
+    from .logger import RetrievalLogger
+    from .metadata_cache import MetadataCache
+    from .rate_limiter import RateLimiter
+    from .retriever import (
+        PaperRetriever,
+        RetrievalResult,
+        RetrievalStatus,
+    )
+
+# Public name -> defining module. Resolved on first attribute access so
+# that importing e.g. ``acquisition.config`` does not also load the
+# retriever and httpx.
+_LAZY_EXPORTS = {
+    "PaperRetriever": ".retriever",
+    "RetrievalResult": ".retriever",
+    "RetrievalStatus": ".retriever",
+    "PaperDownloader": ".downloader",
+    "DownloadConfig": ".downloader",
+    "DownloadResult": ".downloader",
+    "RetrievalLogger": ".logger",
+    "Config": ".config",
+    "RateLimiter": ".rate_limiter",
+    "MetadataCache": ".metadata_cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Retriever
@@ -40,4 +77,5 @@ __all__ = [
     # Config
     "Config",
     "RateLimiter",
+    "MetadataCache",
 ]
@@ -124,6 +124,28 @@ class CrossRefClient(BaseClient):
             "source": "crossref",
         }
 
+    async def get_works(self, dois: list[str]) -> list[dict[str, Any]]:
+        """Get the raw CrossRef work records for several DOIs in one request.
+
+        Args:
+            dois: DOIs to look up (keep to about 100 per call so the
+                filter fits in the URL)
+
+        Returns:
+            Work records for the DOIs CrossRef knows, in no particular order
+        """
+        if not dois:
+            return []
+
+        data = await self.get("works", params={
+            "filter": ",".join(f"doi:{doi}" for doi in dois),
+            "rows": len(dois),
+        })
+
+        if not data or "message" not in data:
+            return []
+        return data["message"].get("items", [])
+
     async def search(
         self,
         query: str,
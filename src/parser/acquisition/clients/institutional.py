@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import importlib.util
 import pickle
 import subprocess
 import time
@@ -210,12 +211,8 @@ class InstitutionalAccessClient:
             return False
 
     def _check_selenium_available(self) -> bool:
-        """Check if Selenium is available."""
-        try:
-            from selenium import webdriver  # noqa: F401
-            return True
-        except ImportError:
-            return False
+        """Check if Selenium is available (without importing it)."""
+        return importlib.util.find_spec("selenium") is not None
 
     def _get_available_browser(self) -> tuple[Any, str] | None:
         """Detect and return an available browser driver.
@@ -12,6 +12,7 @@ The client is disabled by default and must be explicitly enabled.
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import re
 import time
 from pathlib import Path
@@ -62,12 +63,8 @@ class ScihubClient:
             print("⚠️ WARNING: Sci-Hub client enabled. Use may violate copyright laws.")
 
     def _check_scidownl(self) -> bool:
-        """Check if scidownl library is available."""
-        try:
-            from scidownl import scihub_download  # noqa: F401
-            return True
-        except ImportError:
-            return False
+        """Check if scidownl library is available (without importing it)."""
+        return importlib.util.find_spec("scidownl") is not None
 
     async def _rate_limit_wait(self) -> None:
         """Wait to respect rate limits."""
@@ -16,6 +16,7 @@ NOTE: This client intentionally does NOT search for or suggest:
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import re
 import time
 from typing import Any
@@ -58,12 +59,8 @@ class WebSearchClient:
         if self._sdk_available is not None:
             return self._sdk_available
 
-        try:
-            from claude_code_sdk import query  # noqa: F401
-            self._sdk_available = True
-        except ImportError:
-            self._sdk_available = False
-
+        # find_spec does not import the SDK, which is only needed for a search
+        self._sdk_available = importlib.util.find_spec("claude_code_sdk") is not None
         return self._sdk_available
 
     async def search_for_pdf(
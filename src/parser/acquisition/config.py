@@ -126,6 +126,7 @@ class Config:
             "max_retries": 2,
             "save_progress": True,
             "progress_file": ".retrieval_progress.json",
+            "metadata_cache": ".metadata_cache.db",
         }
         batch: dict[str, Any] = data.get("batch", {})
         for key, value in default_batch.items():
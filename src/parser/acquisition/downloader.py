@@ -5,6 +5,7 @@ Simple interface for downloading papers. Uses PaperRetriever internally.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -12,6 +13,9 @@ from typing import Any
 from .config import Config
 from .retriever import PaperRetriever, RetrievalStatus
 
+# Citation key of a BibTeX entry, e.g. "@article{doe2024attention,"
+_BIBTEX_KEY = re.compile(r"^@\w+\{([^,\s]+),", re.MULTILINE)
+
 
 @dataclass
 class DownloadConfig:
@@ -53,6 +57,8 @@ class PaperDownloader:
     def __init__(self, config: DownloadConfig | None = None):
         self.config = config or DownloadConfig()
         self._retriever: PaperRetriever | None = None
+        # citation.bib path -> keys already in it, read once per file
+        self._bibtex_keys: dict[Path, set[str]] = {}
 
     @property
     def retriever(self) -> PaperRetriever:
@@ -134,7 +140,10 @@ class PaperDownloader:
             return DownloadResult(success=False, identifier=source_str, error=str(e))
 
     def _generate_bibtex(self, metadata: dict[str, Any], output_dir: Path) -> Path | None:
-        """Generate BibTeX file from metadata."""
+        """Append a BibTeX entry for the paper to citation.bib.
+
+        Entries whose key is already in the file are not written again.
+        """
         from ..doi2bib.metadata import Author, PaperMetadata
 
         authors = [
@@ -152,9 +161,25 @@ class PaperDownloader:
         )
 
         bibtex_path = output_dir / "citation.bib"
-        bibtex_path.write_text(paper.to_bibtex())
+        known_keys = self._known_bibtex_keys(bibtex_path)
+        key = paper.bibtex_key
+        if key not in known_keys:
+            with open(bibtex_path, "a", encoding="utf-8") as f:
+                f.write(("\n" if f.tell() else "") + paper.to_bibtex(key) + "\n")
+            known_keys.add(key)
         return bibtex_path
 
+    def _known_bibtex_keys(self, bibtex_path: Path) -> set[str]:
+        """Get the citation keys in a BibTeX file, parsing it only once."""
+        keys = self._bibtex_keys.get(bibtex_path)
+        if keys is None:
+            try:
+                text = bibtex_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                text = ""
+            keys = self._bibtex_keys[bibtex_path] = set(_BIBTEX_KEY.findall(text))
+        return keys
+
     async def _get_references(self, identifier, output_dir: Path) -> Path | None:
         """Get references from Semantic Scholar."""
         from .clients import SemanticScholarClient
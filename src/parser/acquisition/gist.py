@@ -0,0 +1,121 @@
+"""GitHub gist access for syncing the config file between machines."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+
+def github_token() -> str | None:
+    """Get a GitHub token from the environment (GH_TOKEN or GITHUB_TOKEN)."""
+    return os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+
+
+class GistClient:
+    """Minimal client for the GitHub gists REST API.
+
+    Talks to api.github.com directly over one connection, rather than
+    starting the GitHub CLI for each operation.
+
+    Example:
+        >>> with GistClient(token) as gists:
+        ...     gist_id, url = gists.create(Path("config.yaml"), "parser config")
+    """
+
+    API_URL = "https://api.github.com"
+
+    def __init__(self, token: str, timeout: float = 30.0):
+        """Initialize the client.
+
+        Args:
+            token: GitHub token with the ``gist`` scope.
+            timeout: Request timeout in seconds.
+        """
+        self._client = httpx.Client(
+            base_url=self.API_URL,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            timeout=timeout,
+        )
+
+    def __enter__(self) -> GistClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection."""
+        self._client.close()
+
+    def create(self, path: Path, description: str) -> tuple[str, str]:
+        """Upload a file to a new private gist.
+
+        Args:
+            path: File to upload.
+            description: Gist description.
+
+        Returns:
+            The new gist's ID and URL.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        response = self._client.post("/gists", json={
+            "description": description,
+            "public": False,
+            "files": {path.name: {"content": path.read_text()}},
+        })
+        response.raise_for_status()
+        gist = response.json()
+        return gist["id"], gist["html_url"]
+
+    def update(self, gist_id: str, path: Path) -> None:
+        """Replace a file in an existing gist with a local file.
+
+        Args:
+            gist_id: Gist to update.
+            path: File to upload; the gist file of the same name is replaced.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        response = self._client.patch(f"/gists/{gist_id}", json={
+            "files": {path.name: {"content": path.read_text()}},
+        })
+        response.raise_for_status()
+
+    def read(self, gist_id: str, filename: str | None = None) -> str:
+        """Get the content of a file in a gist.
+
+        Args:
+            gist_id: Gist to read.
+            filename: File to read (default: the gist's first file).
+
+        Returns:
+            The file content.
+
+        Raises:
+            httpx.HTTPError: If a request fails.
+            LookupError: If the gist has no files.
+        """
+        response = self._client.get(f"/gists/{gist_id}")
+        response.raise_for_status()
+        files = response.json().get("files") or {}
+        if not files:
+            raise LookupError(f"Gist {gist_id} has no files")
+
+        file = files.get(filename) or next(iter(files.values()))
+        if not file.get("truncated"):
+            return file["content"]
+
+        # Large files are truncated in the API response; fetch them raw
+        raw = self._client.get(file["raw_url"])
+        raw.raise_for_status()
+        return raw.text
@@ -5,6 +5,10 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+# Runs of characters not allowed in filenames (and of underscores), each
+# collapsed to a single underscore
+_UNSAFE_FILENAME_RUN = re.compile(r"[/\\:*?\"<>|_]+")
+
 
 class RetrievalLogger:
     """Handles console output and per-paper log files.
@@ -51,9 +55,7 @@ class RetrievalLogger:
 
     def _sanitize_filename(self, name: str) -> str:
         """Convert DOI or title to safe filename."""
-        safe = re.sub(r"[/\\:*?\"<>|]", "_", name)
-        safe = re.sub(r"_+", "_", safe)
-        return safe[:100]
+        return _UNSAFE_FILENAME_RUN.sub("_", name)[:100]
 
     def _write_header(self) -> None:
         """Write log file header."""
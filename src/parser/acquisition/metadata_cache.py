@@ -0,0 +1,80 @@
+"""On-disk cache of resolved paper metadata."""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+# How long a cached lookup stays valid (30 days)
+DEFAULT_TTL = 30 * 86400
+
+
+class MetadataCache:
+    """SQLite-backed cache of metadata lookups, keyed by DOI or title.
+
+    Re-running a batch into the same output directory then reuses the
+    CrossRef results from earlier runs instead of querying again for
+    every paper.
+    """
+
+    def __init__(self, path: Path, ttl: float = DEFAULT_TTL):
+        """Open (or create) the cache.
+
+        Args:
+            path: SQLite database file.
+            ttl: Seconds before a cached entry expires.
+        """
+        self.ttl = ttl
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS metadata "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored REAL NOT NULL)"
+        )
+
+    @staticmethod
+    def key(doi: str | None, title: str | None) -> str:
+        """Build the cache key for a lookup.
+
+        Args:
+            doi: Paper DOI.
+            title: Paper title, used when there is no DOI.
+
+        Returns:
+            The cache key.
+        """
+        if doi:
+            return f"doi:{doi.lower()}"
+        return "title:" + " ".join((title or "").lower().split())
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get cached metadata.
+
+        Args:
+            key: Cache key from ``key()``.
+
+        Returns:
+            The metadata, or None if missing or expired.
+        """
+        row = self._db.execute(
+            "SELECT value FROM metadata WHERE key = ? AND stored > ?",
+            (key, time.time() - self.ttl),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, metadata: dict[str, Any]) -> None:
+        """Store metadata.
+
+        Args:
+            key: Cache key from ``key()``.
+            metadata: Metadata to store.
+        """
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?)",
+                (key, json.dumps(metadata), time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
@@ -9,7 +9,9 @@ class RateLimiter:
     """Global rate limiter for API calls across all sources.
 
     Ensures we don't exceed rate limits for any API by tracking
-    the last call time per source and waiting if needed.
+    the last call time per source and waiting if needed. Each source
+    has its own lock, so waiting on a slow source (e.g. arXiv) does
+    not hold up calls to the others.
     """
 
     def __init__(self, config: dict[str, Any] | None = None):
@@ -32,7 +34,7 @@ class RateLimiter:
         })
         self.global_delay = config.get("global_delay", 1.0)
         self.last_call: dict[str, float] = {}
-        self._lock = asyncio.Lock()
+        self._locks: dict[str, asyncio.Lock] = {}
 
     async def wait(self, source: str) -> None:
         """Wait appropriate time before next call to a source.
@@ -40,7 +42,11 @@ class RateLimiter:
         Args:
             source: The source identifier to rate limit.
         """
-        async with self._lock:
+        lock = self._locks.get(source)
+        if lock is None:
+            lock = self._locks[source] = asyncio.Lock()
+
+        async with lock:
             delay = self.delays.get(source, self.global_delay)
             last = self.last_call.get(source, 0)
             elapsed = time.time() - last
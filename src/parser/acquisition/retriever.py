@@ -6,19 +6,47 @@ Tries multiple sources in priority order to find and download PDFs.
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import json
+import os
 import re
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+import aiofiles
 import httpx
 
 from .config import Config
 from .logger import RetrievalLogger
+from .metadata_cache import MetadataCache
 from .rate_limiter import RateLimiter
 
+# Characters dropped from titles when comparing and when building filenames
+_NON_WORD_OR_SPACE = re.compile(r"[^\w\s]")
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\s-]")
+
+# arXiv id in an arXiv-issued DOI, e.g. 10.48550/arXiv.2005.11401
+_ARXIV_DOI = re.compile(r"arxiv\.(\d+\.\d+)")
+
+# DOI registrant prefix -> preprint server that issues DOIs under it
+_DOI_AUTHORITY = {
+    "10.48550": "arxiv",
+    "10.1101": "biorxiv",  # also medRxiv
+}
+
+# Bytes read per chunk when streaming a PDF to disk
+_DOWNLOAD_CHUNK_SIZE = 65536
+
+# DOIs per bulk CrossRef query when prefetching a batch's metadata
+_CROSSREF_BATCH_SIZE = 100
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 class RetrievalStatus(Enum):
     """Status of a retrieval attempt."""
@@ -63,6 +91,16 @@ class PaperRetriever:
         self.config = config or Config.load()
         self.rate_limiter = RateLimiter(self.config.rate_limits)
         self.clients = self._init_clients()
+        # Pooled client for PDF downloads, open while any download or batch
+        # uses it, and how many currently do
+        self._http: httpx.AsyncClient | None = None
+        self._http_users = 0
+        # Metadata cache in the output directory, open during a batch
+        self._metadata_cache: MetadataCache | None = None
+        # Metadata fetched in bulk for the current batch, by cache key
+        self._prefetched: dict[str, dict[str, Any]] = {}
+        # Directory -> file names in it, listed once per batch
+        self._existing_files: dict[Path, set[str]] = {}
 
     def _init_clients(self) -> dict[str, Any]:
         """Initialize all API clients."""
@@ -156,8 +194,31 @@ class PaperRetriever:
         # Create logger
         logger = RetrievalLogger(out_dir, doi, title, console_enabled=verbose)
 
+        # A PDF saved under the name derived from the identifier alone (the
+        # name used when metadata cannot be resolved) is skipped before any
+        # network lookup
+        if self.config.download.get("skip_existing"):
+            output_path = self._get_output_path({"doi": doi, "title": title}, out_dir)
+            if self._file_exists(output_path):
+                logger.header(doi, title)
+                logger.final_result(True, "cached", str(output_path))
+                return RetrievalResult(
+                    doi=doi,
+                    title=title or "",
+                    status=RetrievalStatus.SKIPPED,
+                    source="cached",
+                    pdf_path=str(output_path),
+                )
+
+        # The PDF of an arXiv DOI can be fetched while metadata resolves
+        prefetch = self._start_arxiv_prefetch(doi, out_dir)
+
         # Resolve metadata if needed
-        metadata = await self._resolve_metadata(doi, title)
+        try:
+            metadata = await self._resolve_metadata(doi, title)
+        except BaseException:
+            await self._discard_prefetch(prefetch)
+            raise
         resolved_doi = metadata.get("doi") if metadata else doi
         resolved_title = metadata.get("title") if metadata else title
         year = metadata.get("year") if metadata else None
@@ -169,7 +230,8 @@ class PaperRetriever:
         output_path = self._get_output_path(metadata or {"doi": doi, "title": title}, out_dir)
 
         # Check if already downloaded
-        if self.config.download.get("skip_existing") and output_path.exists():
+        if self.config.download.get("skip_existing") and self._file_exists(output_path):
+            await self._discard_prefetch(prefetch)
             logger.final_result(True, "cached", str(output_path))
             return RetrievalResult(
                 doi=resolved_doi,
@@ -180,8 +242,30 @@ class PaperRetriever:
                 metadata=metadata,
             )
 
+        # Set when the arXiv PDF was already requested, and not found, in the
+        # background; the arXiv source is then not tried again
+        arxiv_failed = False
+        if prefetch:
+            task, prefetch_path = prefetch
+            arxiv_failed = not await task
+            if not arxiv_failed:
+                prefetch_path.replace(output_path)
+                self._mark_downloaded(output_path)
+                logger.final_result(True, "arxiv", str(output_path))
+                return RetrievalResult(
+                    doi=resolved_doi,
+                    title=resolved_title or "",
+                    status=RetrievalStatus.SUCCESS,
+                    source="arxiv",
+                    pdf_path=str(output_path),
+                    metadata=metadata,
+                )
+
         # Try sources in priority order
-        sources = self.config.get_sorted_sources()
+        sources = [
+            s for s in self.config.get_sorted_sources()
+            if not (arxiv_failed and s == "arxiv")
+        ]
         total_sources = sum(1 for s in sources if self.config.is_source_enabled(s))
 
         source_index = 0
@@ -208,6 +292,8 @@ class PaperRetriever:
             )
 
             if result and result.status == RetrievalStatus.SUCCESS:
+                if result.pdf_path:
+                    self._mark_downloaded(Path(result.pdf_path))
                 logger.source_result(source_index, total_sources, source_name, True, reason, result.pdf_path)
                 logger.final_result(True, source_name, result.pdf_path)
                 result.metadata = metadata
@@ -224,15 +310,92 @@ class PaperRetriever:
             metadata=metadata,
         )
 
+    def _start_arxiv_prefetch(
+        self, doi: str | None, output_dir: Path
+    ) -> tuple[asyncio.Task[bool], Path] | None:
+        """Start downloading the PDF of an arXiv DOI in the background.
+
+        The arXiv PDF URL follows from the DOI alone, so the download can
+        run while metadata (which decides the final filename) is resolved.
+        Nothing is started when arXiv is disabled or the metadata is
+        already available locally, as there is then no lookup to overlap.
+
+        Returns:
+            The download task and the temporary path it writes to, or None
+        """
+        if not doi or self._doi_authority(doi) != "arxiv":
+            return None
+        match = _ARXIV_DOI.search(doi.lower())
+        if not match or not self.config.is_source_enabled("arxiv"):
+            return None
+
+        key = MetadataCache.key(doi, None)
+        if key in self._prefetched or (
+            self._metadata_cache and self._metadata_cache.get(key) is not None
+        ):
+            return None
+
+        arxiv_id = match.group(1)
+        path = output_dir / f".arxiv_{arxiv_id}.pdf.prefetch"
+
+        async def download() -> bool:
+            await self.rate_limiter.wait("arxiv")
+            return await self._download_pdf(f"https://arxiv.org/pdf/{arxiv_id}.pdf", path)
+
+        return asyncio.create_task(download()), path
+
+    @staticmethod
+    def _doi_authority(doi: str) -> str | None:
+        """Get the preprint server that issued a DOI, from its registrant prefix."""
+        return _DOI_AUTHORITY.get(doi.partition("/")[0])
+
+    @staticmethod
+    async def _discard_prefetch(prefetch: tuple[asyncio.Task[bool], Path] | None) -> None:
+        """Cancel a background arXiv download and remove anything it wrote."""
+        if prefetch is None:
+            return
+        task, path = prefetch
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        path.unlink(missing_ok=True)
+
     async def _resolve_metadata(
         self,
         doi: str | None = None,
         title: str | None = None
     ) -> dict[str, Any] | None:
-        """Resolve full metadata from DOI or title."""
+        """Resolve full metadata from DOI or title.
+
+        During a batch, successful lookups are stored in the metadata cache
+        and reused; failed lookups are not cached.
+        """
+        cache = self._metadata_cache
+        key = MetadataCache.key(doi, title)
+        if cache:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        metadata = self._prefetched.pop(key, None)
+        if metadata is None:
+            metadata = await self._lookup_metadata(doi, title)
+        if metadata is None:
+            return {"doi": doi, "title": title}
+
+        if cache:
+            cache.set(key, metadata)
+        return metadata
+
+    async def _lookup_metadata(
+        self,
+        doi: str | None = None,
+        title: str | None = None
+    ) -> dict[str, Any] | None:
+        """Look up metadata on CrossRef by DOI, then by title."""
         crossref = self.clients.get("crossref")
         if not crossref:
-            return {"doi": doi, "title": title}
+            return None
 
         if doi:
             try:
@@ -254,7 +417,40 @@ class PaperRetriever:
             except Exception:
                 pass
 
-        return {"doi": doi, "title": title}
+        return None
+
+    async def _prefetch_metadata(self, papers: list[dict[str, Any]]) -> None:
+        """Resolve the DOIs of a batch with bulk CrossRef queries.
+
+        One request covers up to ``_CROSSREF_BATCH_SIZE`` DOIs, instead of
+        one request per paper. Papers CrossRef does not return (and title-only
+        papers) are looked up individually as before.
+        """
+        crossref = self.clients.get("crossref")
+        if not crossref:
+            return
+
+        cache = self._metadata_cache
+        keys: dict[str, str] = {}
+        for paper in papers:
+            doi = paper.get("doi")
+            if not doi:
+                continue
+            key = MetadataCache.key(doi, None)
+            if key not in keys and not (cache and cache.get(key) is not None):
+                keys[key] = doi
+
+        dois = list(keys.values())
+        for start in range(0, len(dois), _CROSSREF_BATCH_SIZE):
+            try:
+                await self.rate_limiter.wait("crossref")
+                works = await crossref.get_works(dois[start:start + _CROSSREF_BATCH_SIZE])
+            except Exception:
+                continue
+            for work in works:
+                if work.get("DOI"):
+                    key = MetadataCache.key(work["DOI"], None)
+                    self._prefetched[key] = self._extract_crossref_metadata(work)
 
     def _extract_crossref_metadata(self, work: dict[str, Any]) -> dict[str, Any]:
         """Extract metadata from CrossRef work object."""
@@ -319,7 +515,7 @@ class PaperRetriever:
     @staticmethod
     def _normalize_title(title: str) -> str:
         """Normalize a title for comparison."""
-        normalized = re.sub(r"[^\w\s]", "", title.lower())
+        normalized = _NON_WORD_OR_SPACE.sub("", title.lower())
         return " ".join(normalized.split())
 
     def _get_output_path(self, metadata: dict[str, Any], output_dir: Path) -> Path:
@@ -338,7 +534,7 @@ class PaperRetriever:
 
         # Clean title
         max_len = self.config.download.get("max_title_length", 50)
-        title_short = re.sub(r"[^\w\s-]", "", title)[:max_len].strip()
+        title_short = _UNSAFE_FILENAME_CHARS.sub("", title)[:max_len].strip()
 
         # Build filename
         parts = [p for p in [first_author, year, title_short] if p]
@@ -427,7 +623,7 @@ class PaperRetriever:
         if doi and "arxiv" in doi.lower():
             logger.detail(f"arXiv DOI detected: {doi}")
             # Extract arXiv ID from DOI
-            arxiv_id = re.search(r"arxiv\.(\d+\.\d+)", doi.lower())
+            arxiv_id = _ARXIV_DOI.search(doi.lower())
             if arxiv_id:
                 pdf_url = f"https://arxiv.org/pdf/{arxiv_id.group(1)}.pdf"
                 logger.detail(f"PDF URL: {pdf_url}")
@@ -484,7 +680,7 @@ class PaperRetriever:
         """Try bioRxiv source."""
         if not doi:
             return None, "no DOI provided"
-        if not doi.startswith("10.1101"):
+        if self._doi_authority(doi) != "biorxiv":
             return None, "not a bioRxiv DOI"
 
         logger.detail(f"Checking bioRxiv for {doi}")
@@ -645,30 +841,121 @@ class PaperRetriever:
         total = len(words1 | words2)
         return common / total >= 0.6 if total > 0 else False
 
+    @asynccontextmanager
+    async def _shared_http_client(self, max_concurrent: int = 1) -> AsyncIterator[httpx.AsyncClient]:
+        """Use one pooled client for every PDF download in this block.
+
+        Connections (and TLS sessions) to hosts such as arxiv.org are then
+        kept alive across papers instead of being set up for each download.
+        The client is reference counted, so overlapping blocks (concurrent
+        ``retrieve`` calls, or downloads within a batch) share it and it is
+        only closed when the last of them exits.
+        """
+        if self._http is None:
+            limits = httpx.Limits(
+                max_connections=max_concurrent * 4,
+                max_keepalive_connections=max_concurrent * 2,
+            )
+            self._http = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=60,
+                http2=_HTTP2,
+                limits=limits,
+                headers={"User-Agent": "parser/1.0"},
+            )
+        client = self._http
+        self._http_users += 1
+        try:
+            yield client
+        finally:
+            self._http_users -= 1
+            if self._http_users == 0:
+                self._http = None
+                await client.aclose()
+
+    @asynccontextmanager
+    async def _batch_session(self, output_dir: Path, max_concurrent: int) -> AsyncIterator[None]:
+        """Share an HTTP client and the metadata cache across one batch.
+
+        The cache lives in the output directory, so a re-run into the same
+        directory reuses metadata resolved by earlier runs. Metadata
+        prefetched for the batch is dropped when it ends.
+
+        The output directory is also listed once up front, so checking
+        whether each paper was already downloaded is a set lookup rather
+        than a stat per paper.
+        """
+        cache_name = self.config.batch.get("metadata_cache")
+        async with self._shared_http_client(max_concurrent):
+            self._existing_files[output_dir] = {
+                entry.name for entry in os.scandir(output_dir) if entry.is_file()
+            }
+            open_cache = False
+            if cache_name and self._metadata_cache is None:
+                self._metadata_cache = MetadataCache(output_dir / cache_name)
+                open_cache = True
+            try:
+                yield
+            finally:
+                self._prefetched.clear()
+                self._existing_files.clear()
+                if open_cache and self._metadata_cache is not None:
+                    self._metadata_cache.close()
+                    self._metadata_cache = None
+
+    def _file_exists(self, path: Path) -> bool:
+        """Check whether a file exists, using the batch listing when there is one."""
+        names = self._existing_files.get(path.parent)
+        if names is None:
+            return path.exists()
+        return path.name in names
+
+    def _mark_downloaded(self, path: Path) -> None:
+        """Record a new download in the batch listing of its directory."""
+        names = self._existing_files.get(path.parent)
+        if names is not None:
+            names.add(path.name)
+
     async def _download_pdf(self, url: str, output_path: Path) -> bool:
-        """Download PDF from URL."""
+        """Download PDF from URL.
+
+        The body is streamed to a ``.part`` file in chunks, so memory use
+        does not grow with the size of the PDF. Only the first chunk is
+        checked for the PDF magic bytes, and the file is renamed into place
+        once complete so a failed download never leaves a truncated PDF.
+        """
+        part_path = output_path.with_name(output_path.name + ".part")
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=60) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "parser/1.0"},
-                )
+            async with (
+                self._shared_http_client() as client,
+                client.stream("GET", url) as response,
+            ):
                 response.raise_for_status()
 
-                content = response.content
                 content_type = response.headers.get("content-type", "")
+                chunks = response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE)
+                first = await anext(chunks, b"")
 
                 # Verify it's a PDF
-                if "pdf" not in content_type.lower() and not content.startswith(b"%PDF"):
+                if "pdf" not in content_type.lower() and not first.startswith(b"%PDF"):
                     return False
 
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_bytes(content)
-                return True
+                async with aiofiles.open(part_path, "wb") as f:
+                    await f.write(first)
+                    async for chunk in chunks:
+                        await f.write(chunk)
+
+            part_path.replace(output_path)
+            return True
 
         except Exception:
             return False
 
+        finally:
+            # Also covers cancellation part way through the download
+            part_path.unlink(missing_ok=True)
+
     async def retrieve_batch(
         self,
         papers: list[dict[str, Any]],
@@ -676,6 +963,7 @@ class PaperRetriever:
         verbose: bool = True,
         save_progress: bool = True,
         max_concurrent: int = 1,
+        on_result: Callable[[RetrievalResult], None] | None = None,
     ) -> list[RetrievalResult]:
         """Retrieve PDFs for multiple papers.
 
@@ -685,6 +973,8 @@ class PaperRetriever:
             verbose: Show progress
             save_progress: Save progress to file for resume
             max_concurrent: Maximum concurrent downloads (default 1 for rate limiting)
+            on_result: Called with each paper's result as it finishes,
+                e.g. to advance a progress bar
 
         Returns:
             List of RetrievalResult objects
@@ -706,57 +996,83 @@ class PaperRetriever:
             except Exception:
                 pass
 
-        results = []
         total = len(papers)
 
-        # Use semaphore for concurrency control
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def retrieve_one(idx: int, paper: dict) -> tuple[int, RetrievalResult]:
-            async with semaphore:
-                doi = paper.get("doi")
-                title = paper.get("title", "")
-                identifier = doi or title
-
-                # Skip if already completed
-                if identifier in completed:
-                    if verbose:
-                        print(f"[{idx}/{total}] Skipping (already done): {identifier[:50]}")
-                    return idx, RetrievalResult(
-                        doi=doi, title=title or "",
-                        status=RetrievalStatus.SKIPPED,
-                        pdf_path=None,
-                    )
+        async def retrieve_one(idx: int, paper: dict) -> RetrievalResult:
+            doi = paper.get("doi")
+            title = paper.get("title", "")
+            identifier = doi or title
 
+            # Skip if already completed
+            if identifier in completed:
                 if verbose:
-                    print(f"\n[{idx}/{total}] Processing: {identifier[:60]}...")
-
-                result = await self.retrieve(doi=doi, title=title, output_dir=out_dir, verbose=verbose)
-
-                # Save progress
-                if save_progress and result.status in (RetrievalStatus.SUCCESS, RetrievalStatus.SKIPPED):
-                    completed.add(identifier)
-                    try:
-                        with open(progress_file, "w") as f:
-                            json.dump({"completed": list(completed)}, f)
-                    except Exception:
-                        pass
-
-                return idx, result
-
-        if max_concurrent > 1:
-            # Concurrent execution
-            tasks = [retrieve_one(i, paper) for i, paper in enumerate(papers, 1)]
-            task_results = await asyncio.gather(*tasks)
-            # Sort by original index
-            task_results.sort(key=lambda x: x[0])
-            results = [r for _, r in task_results]
-        else:
-            # Sequential execution (original behavior)
-            for i, paper in enumerate(papers, 1):
-                _, result = await retrieve_one(i, paper)
-                results.append(result)
-                # Rate limit between papers
-                await asyncio.sleep(self.config.rate_limits.get("global_delay", 1.0))
+                    print(f"[{idx}/{total}] Skipping (already done): {identifier[:50]}")
+                return RetrievalResult(
+                    doi=doi, title=title or "",
+                    status=RetrievalStatus.SKIPPED,
+                    pdf_path=None,
+                )
+
+            if verbose:
+                print(f"\n[{idx}/{total}] Processing: {identifier[:60]}...")
+
+            result = await self.retrieve(doi=doi, title=title, output_dir=out_dir, verbose=verbose)
+
+            # Save progress
+            if save_progress and result.status in (RetrievalStatus.SUCCESS, RetrievalStatus.SKIPPED):
+                completed.add(identifier)
+                try:
+                    with open(progress_file, "w") as f:
+                        json.dump({"completed": list(completed)}, f)
+                except Exception:
+                    pass
+
+            return result
+
+        async with self._batch_session(out_dir, max_concurrent):
+            await self._prefetch_metadata(
+                [p for p in papers if (p.get("doi") or p.get("title", "")) not in completed]
+            )
+
+            if max_concurrent > 1:
+                # Concurrent execution: a fixed pool of workers fed through a
+                # bounded queue, so only max_concurrent papers are in flight
+                # and pending work does not grow with the batch size
+                slots: list[RetrievalResult | None] = [None] * total
+                queue: asyncio.Queue[tuple[int, dict] | None] = asyncio.Queue(maxsize=max_concurrent * 2)
+
+                async def produce() -> None:
+                    for item in enumerate(papers, 1):
+                        await queue.put(item)
+                    for _ in range(max_concurrent):
+                        await queue.put(None)
+
+                async def worker() -> None:
+                    while (item := await queue.get()) is not None:
+                        idx, paper = item
+                        slots[idx - 1] = result = await retrieve_one(idx, paper)
+                        if on_result:
+                            on_result(result)
+
+                tasks = [asyncio.create_task(produce())]
+                tasks += [asyncio.create_task(worker()) for _ in range(max_concurrent)]
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+                results = [r for r in slots if r is not None]
+            else:
+                # Sequential execution (original behavior)
+                results = []
+                for i, paper in enumerate(papers, 1):
+                    result = await retrieve_one(i, paper)
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+                    # Rate limit between papers
+                    await asyncio.sleep(self.config.rate_limits.get("global_delay", 1.0))
 
         return results
@@ -18,14 +18,31 @@ New commands:
 """
 
 import asyncio
+import atexit
+import contextlib
+import functools
+import io
+import itertools
 import json
 import re
+import shutil
+import subprocess
 import sys
+from collections import Counter
+from collections.abc import Callable, Coroutine, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import click
 
+T = TypeVar("T")
+
+# Identifier forms recognized in batch input files and `retrieve`
+_PDF_URL = re.compile(r'^https?://.*\.pdf(?:\?.*)?$', re.IGNORECASE)
+_DOI = re.compile(r'^10\.\d{4,}/')
+_ARXIV_ID = re.compile(r'^(?:arXiv[:\s]*)?(\d{4}\.\d{4,5})(?:v\d+)?$', re.IGNORECASE)
+_ARXIV_URL = re.compile(r'arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})', re.IGNORECASE)
+
 
 @click.group()
 @click.option(
@@ -129,9 +146,7 @@ def retrieve_paper(
             output_path = output_dir / filename
 
             with httpx.Client(follow_redirects=True, timeout=60.0) as client:
-                response = client.get(pdf_url)
-                response.raise_for_status()
-                output_path.write_bytes(response.content)
+                _stream_pdf(client, pdf_url, output_path)
 
             click.echo(click.style("✓ Downloaded: ", fg="green") + str(output_path))
             click.echo("  Source: direct URL")
@@ -144,7 +159,7 @@ def retrieve_paper(
         click.echo(f"Retrieving: {final_identifier}")
         click.echo(f"Output: {output_dir}")
 
-    result = asyncio.run(retriever.retrieve(
+    result = _run(retriever.retrieve(
         doi=doi,
         title=title,
         output_dir=output_dir,
@@ -201,44 +216,72 @@ def batch(
     output_dir = Path(output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load papers from file
-    papers = _load_papers_from_file(input_file)
-    if not papers:
+    # Load papers from file, handling direct PDF URLs separately and
+    # dropping repeats of the same URL, DOI or title
+    pdf_urls: list[dict[str, str | None]] = []
+    doi_papers: list[dict[str, str | None]] = []
+    seen: set[str] = set()
+    duplicates = 0
+    for paper in _iter_papers_from_file(input_file):
+        key = _paper_key(paper)
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        (pdf_urls if paper.get("pdf_url") else doi_papers).append(paper)
+
+    total = len(pdf_urls) + len(doi_papers)
+    if not total:
         click.echo(click.style("No papers found in file", fg="yellow"))
         return
 
-    # Handle direct PDF URLs separately
-    pdf_urls = [p for p in papers if p.get("pdf_url")]
-    doi_papers = [p for p in papers if not p.get("pdf_url")]
-
-    click.echo(f"Found {len(papers)} papers to retrieve ({len(pdf_urls)} direct URLs, {len(doi_papers)} DOI/titles)")
+    click.echo(f"Found {total} papers to retrieve ({len(pdf_urls)} direct URLs, {len(doi_papers)} DOI/titles)")
+    if duplicates:
+        click.echo(f"Skipped {duplicates} duplicate entries")
 
     # Download direct PDF URLs first
     from urllib.parse import urlparse
 
     import httpx
 
-    for i, paper in enumerate(pdf_urls, 1):
-        pdf_url: str = paper["pdf_url"] or ""
-        if verbose:
-            click.echo(f"\n[{i}/{len(pdf_urls)}] Downloading direct PDF: {pdf_url[:60]}...")
-
-        try:
-            parsed = urlparse(pdf_url)
-            filename = Path(parsed.path).name
-            if not filename.endswith('.pdf'):
-                filename = f"downloaded_{hash(pdf_url) % 10000}.pdf"
-
-            output_path = output_dir / filename
-
-            with httpx.Client(follow_redirects=True, timeout=60.0) as client:
-                response = client.get(pdf_url)
-                response.raise_for_status()
-                output_path.write_bytes(response.content)
-
-            click.echo(click.style("✓ Downloaded: ", fg="green") + str(output_path))
-        except Exception as e:
-            click.echo(click.style("✗ Failed: ", fg="red") + str(e))
+    if pdf_urls:
+        # Without -v a progress bar replaces the per-URL lines and only
+        # failures are listed, after the bar
+        failed_urls: list[str] = []
+        # One client for every direct URL, so connections to a host are reused
+        with (
+            httpx.Client(follow_redirects=True, timeout=60.0) as client,
+            _progress(len(pdf_urls), "Direct URLs", enabled=not verbose) as advance,
+        ):
+            for i, paper in enumerate(pdf_urls, 1):
+                pdf_url: str = paper["pdf_url"] or ""
+                if verbose:
+                    click.echo(f"\n[{i}/{len(pdf_urls)}] Downloading direct PDF: {pdf_url[:60]}...")
+
+                try:
+                    parsed = urlparse(pdf_url)
+                    filename = Path(parsed.path).name
+                    if not filename.endswith('.pdf'):
+                        filename = f"downloaded_{hash(pdf_url) % 10000}.pdf"
+
+                    output_path = output_dir / filename
+
+                    _stream_pdf(client, pdf_url, output_path)
+
+                    if verbose:
+                        click.echo(click.style("✓ Downloaded: ", fg="green") + str(output_path))
+                except Exception as e:
+                    if verbose:
+                        click.echo(click.style("✗ Failed: ", fg="red") + str(e))
+                    else:
+                        failed_urls.append(f"{pdf_url}: {e}")
+                advance()
+
+        if not verbose:
+            downloaded = len(pdf_urls) - len(failed_urls)
+            click.echo(click.style(f"✓ Downloaded: {downloaded} direct URLs", fg="green"))
+            for failure in failed_urls:
+                click.echo(click.style("✗ Failed: ", fg="red") + failure)
 
     # If no DOI papers left, we're done
     if not doi_papers:
@@ -246,15 +289,14 @@ def batch(
 
     retriever = PaperRetriever(config)
 
-    async def run():
-        return await retriever.retrieve_batch(
+    with _progress(len(doi_papers), "Retrieving", enabled=not verbose) as advance:
+        results = _run(retriever.retrieve_batch(
             doi_papers,
             output_dir=output_dir,
             verbose=verbose,
             max_concurrent=concurrent,
-        )
-
-    results = asyncio.run(run())
+            on_result=lambda result: advance(),
+        ))
 
     success = sum(1 for r in results if r.status == RetrievalStatus.SUCCESS)
     skipped = sum(1 for r in results if r.status == RetrievalStatus.SKIPPED)
@@ -409,6 +451,7 @@ batch:
   retry_failed: true
   max_retries: 2
   progress_file: ".retrieval_progress.json"
+  metadata_cache: ".metadata_cache.db"  # empty to disable
 '''
 
     config_path.write_text(default_config)
@@ -493,9 +536,12 @@ def config() -> None:
 def config_push(ctx: click.Context, gist_id: str | None) -> None:
     """Push config to a private GitHub gist.
 
-    Requires GitHub CLI (gh) to be installed and authenticated.
+    Uses the GitHub API directly when GH_TOKEN or GITHUB_TOKEN is set;
+    otherwise requires GitHub CLI (gh) to be installed and authenticated.
     """
-    import subprocess
+    import httpx
+
+    from .acquisition.gist import GistClient, github_token
 
     config_path = Path(ctx.obj.get("config_path") or "config.yaml")
     gist_id_file = Path(".parser_gist_id")
@@ -504,61 +550,54 @@ def config_push(ctx: click.Context, gist_id: str | None) -> None:
         click.echo(click.style("Error: ", fg="red") + f"Config file not found: {config_path}")
         return
 
-    # Check gh is available
-    try:
-        subprocess.run(["gh", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        click.echo(click.style("Error: ", fg="red") + "GitHub CLI (gh) not found")
-        click.echo("Install from: https://cli.github.com/")
-        return
+    token = github_token()
 
     if not gist_id and gist_id_file.exists():
         gist_id = gist_id_file.read_text().strip()
 
-    if gist_id:
-        # Update existing gist
-        click.echo(f"Updating gist {gist_id}...")
-        result = subprocess.run(
-            ["gh", "gist", "edit", gist_id, "-f", str(config_path)],
-            capture_output=True, text=True,
-        )
-        if result.returncode != 0:
-            click.echo(click.style("Error: ", fg="red") + result.stderr)
-            return
-        click.echo(click.style("Success! ", fg="green") + f"Config updated in gist {gist_id}")
-    else:
-        # Create new gist
-        click.echo("Creating new private gist...")
-        result = subprocess.run(
-            ["gh", "gist", "create", str(config_path), "--desc", "parser config"],
-            capture_output=True, text=True,
-        )
-        if result.returncode != 0:
-            click.echo(click.style("Error: ", fg="red") + result.stderr)
-            return
-
-        gist_url = result.stdout.strip()
-        new_gist_id = gist_url.split("/")[-1]
-        gist_id_file.write_text(new_gist_id)
+    try:
+        if gist_id:
+            # Update existing gist
+            click.echo(f"Updating gist {gist_id}...")
+            if token:
+                with GistClient(token) as gists:
+                    gists.update(gist_id, config_path)
+            else:
+                _gh("gist", "edit", gist_id, "-f", str(config_path))
+            click.echo(click.style("Success! ", fg="green") + f"Config updated in gist {gist_id}")
+        else:
+            # Create new gist
+            click.echo("Creating new private gist...")
+            if token:
+                with GistClient(token) as gists:
+                    new_gist_id, gist_url = gists.create(config_path, "parser config")
+            else:
+                gist_url = _gh("gist", "create", str(config_path), "--desc", "parser config").strip().decode()
+                new_gist_id = gist_url.split("/")[-1]
+            gist_id_file.write_text(new_gist_id)
 
-        click.echo(click.style("Success! ", fg="green") + f"Config uploaded to: {gist_url}")
+            click.echo(click.style("Success! ", fg="green") + f"Config uploaded to: {gist_url}")
+    except (RuntimeError, httpx.HTTPError) as e:
+        click.echo(click.style("Error: ", fg="red") + str(e))
 
 
 @config.command("pull")
 @click.option("--gist-id", help="Gist ID to pull from")
 @click.pass_context
 def config_pull(ctx: click.Context, gist_id: str | None) -> None:
-    """Pull config from a private GitHub gist."""
-    import subprocess
+    """Pull config from a private GitHub gist.
+
+    Uses the GitHub API directly when GH_TOKEN or GITHUB_TOKEN is set;
+    otherwise requires GitHub CLI (gh).
+    """
+    import httpx
+
+    from .acquisition.gist import GistClient, github_token
 
     config_path = Path(ctx.obj.get("config_path") or "config.yaml")
     gist_id_file = Path(".parser_gist_id")
 
-    try:
-        subprocess.run(["gh", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        click.echo(click.style("Error: ", fg="red") + "GitHub CLI (gh) not found")
-        return
+    token = github_token()
 
     if not gist_id:
         if gist_id_file.exists():
@@ -569,26 +608,55 @@ def config_pull(ctx: click.Context, gist_id: str | None) -> None:
 
     click.echo(f"Pulling config from gist {gist_id}...")
 
-    result = subprocess.run(
-        ["gh", "gist", "view", gist_id, "-r"],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        click.echo(click.style("Error: ", fg="red") + result.stderr)
+    try:
+        if token:
+            with GistClient(token) as gists:
+                content = gists.read(gist_id, config_path.name).encode()
+        else:
+            content = _gh("gist", "view", gist_id, "-r")
+    except (RuntimeError, LookupError, httpx.HTTPError) as e:
+        click.echo(click.style("Error: ", fg="red") + str(e))
         return
 
-    # Backup existing
+    # Backup existing. It is copied rather than moved so the config is
+    # never missing; the new one is then renamed over it in one step.
     if config_path.exists():
         backup_path = config_path.with_suffix(".yaml.bak")
-        config_path.rename(backup_path)
+        shutil.copy2(config_path, backup_path)
         click.echo(f"Backed up existing config to {backup_path}")
 
-    config_path.write_text(result.stdout)
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(content)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(config_path)
     gist_id_file.write_text(gist_id)
 
     click.echo(click.style("Success! ", fg="green") + f"Config saved to {config_path}")
 
 
+def _gh(*args: str) -> bytes:
+    """Run a GitHub CLI command and return its raw output.
+
+    The output is left undecoded: gist content is written to disk as is.
+
+    Raises:
+        RuntimeError: With gh's error output, if the command fails.
+    """
+    # A missing gh shows up here rather than through a separate probe
+    try:
+        result = subprocess.run(["gh", *args], capture_output=True)
+    except FileNotFoundError:
+        raise RuntimeError(
+            "GitHub CLI (gh) not found. Install from: https://cli.github.com/ or set GH_TOKEN"
+        ) from None
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode(errors="replace"))
+    return result.stdout
+
+
 # =============================================================================
 # Commands from doi2bib
 # =============================================================================
@@ -632,7 +700,7 @@ def doi2bib(
         elif output_format == "markdown":
             return result.to_markdown()
         else:
-            return json.dumps(result.to_dict(), indent=2, default=str)
+            return _dumps_json(result.to_dict())
 
     # File mode
     if input_file:
@@ -647,23 +715,26 @@ def doi2bib(
             click.echo("No DOIs found in file", err=True)
             sys.exit(1)
 
-        results = []
-        for doi in dois:
-            click.echo(f"Processing: {doi}...", err=True)
-            result = asyncio.run(get_metadata(doi))
-            if result:
-                results.append(format_result(result))
-            else:
-                click.echo(f"  Failed: {doi}", err=True)
-
+        # Entries are written as they are resolved rather than collected
+        # and joined at the end
         separator = "\n\n" if output_format == "bibtex" else "\n---\n"
-        output = separator.join(results)
+        written = 0
+        with click.open_file(output_file or "-", "w") as out:
+            for doi in dois:
+                click.echo(f"Processing: {doi}...", err=True)
+                result = _run(get_metadata(doi))
+                if result:
+                    out.write((separator if written else "") + format_result(result))
+                    out.flush()
+                    written += 1
+                else:
+                    click.echo(f"  Failed: {doi}", err=True)
+
+            if not output_file:
+                out.write("\n")
 
         if output_file:
-            Path(output_file).write_text(output)
-            click.echo(f"Wrote {len(results)} entries to {output_file}", err=True)
-        else:
-            click.echo(output)
+            click.echo(f"Wrote {written} entries to {output_file}", err=True)
         return
 
     # Single identifier mode
@@ -671,7 +742,7 @@ def doi2bib(
         click.echo("Error: Provide an identifier or use -i for file input", err=True)
         sys.exit(1)
 
-    result = asyncio.run(get_metadata(identifier))
+    result = _run(get_metadata(identifier))
 
     if not result:
         click.echo(f"Could not find: {identifier}", err=True)
@@ -755,7 +826,7 @@ def verify(
                 input_p, output_dir, skip_keys=skip_set, dry_run=dry_run
             )
 
-        stats, results = asyncio.run(run_dir())
+        stats, results = _run(run_dir())
     else:
         # Single file mode
         click.echo("=" * 60)
@@ -776,7 +847,7 @@ def verify(
                 input_p, output_dir, skip_keys=skip_set, manual_path=manual_p, dry_run=dry_run
             )
 
-        stats, results = asyncio.run(run_file())
+        stats, results = _run(run_file())
 
     # Print results
     click.echo()
@@ -826,21 +897,19 @@ def parse_refs(input_file: str, output: str | None, output_format: str):
         click.echo("No references found.", err=True)
         sys.exit(1)
 
-    grouped = parser.group_by_type(refs)
-
     if output_format in ("json", "both"):
         json_path = output_dir / "references.json"
-        json_path.write_text(json.dumps([
+        _write_json(json_path, [
             {"type": r.type.value, "value": r.value, "title": r.title,
              "authors": r.authors, "year": r.year, "url": r.url}
             for r in refs
-        ], indent=2))
+        ])
         click.echo(f"✓ JSON: {json_path}")
 
     if output_format in ("md", "both"):
         md_path = output_dir / "references.md"
         md_lines = ["# Extracted References\n"]
-        for ref_type, type_refs in grouped.items():
+        for ref_type, type_refs in parser.group_by_type(refs).items():
             md_lines.append(f"\n## {ref_type.value.title()} ({len(type_refs)})\n")
             for r in type_refs:
                 line = f"- [{r.value}]({r.url})" if r.url else f"- {r.value}"
@@ -851,8 +920,8 @@ def parse_refs(input_file: str, output: str | None, output_format: str):
         click.echo(f"✓ Markdown: {md_path}")
 
     click.echo(f"\nFound {len(refs)} references:")
-    for ref_type, type_refs in grouped.items():
-        click.echo(f"  {ref_type.value}: {len(type_refs)}")
+    for ref_type, count in Counter(r.type for r in refs).items():
+        click.echo(f"  {ref_type.value}: {count}")
 
 
 @cli.command()
@@ -909,29 +978,32 @@ def citations(
 
         return results
 
-    results = asyncio.run(fetch())
+    results = _run(fetch())
 
     # Format output
     if output_format == "json":
-        content = json.dumps(results, indent=2, default=str)
+        content = _dumps_json(results)
     elif output_format == "bibtex":
-        entries = []
-        for i, paper in enumerate(results.get("citations", []) + results.get("references", [])):
+        # Entries are written straight into one buffer instead of being
+        # built by repeated concatenation and joined at the end
+        buf = io.StringIO()
+        papers = itertools.chain(results.get("citations", []), results.get("references", []))
+        for i, paper in enumerate(papers):
             if paper.get("title"):
                 # Generate simple BibTeX entry
+                if buf.tell():
+                    buf.write("\n\n")
                 authors = " and ".join(paper.get("authors", [])[:5])
-                key = f"paper{i+1}"
-                entry = f"@misc{{{key},\n"
-                entry += f"  title = {{{paper.get('title')}}},\n"
+                buf.write(f"@misc{{paper{i+1},\n")
+                buf.write(f"  title = {{{paper.get('title')}}},\n")
                 if authors:
-                    entry += f"  author = {{{authors}}},\n"
+                    buf.write(f"  author = {{{authors}}},\n")
                 if paper.get("year"):
-                    entry += f"  year = {{{paper['year']}}},\n"
+                    buf.write(f"  year = {{{paper['year']}}},\n")
                 if paper.get("doi"):
-                    entry += f"  doi = {{{paper['doi']}}},\n"
-                entry += "}"
-                entries.append(entry)
-        content = "\n\n".join(entries)
+                    buf.write(f"  doi = {{{paper['doi']}}},\n")
+                buf.write("}")
+        content = buf.getvalue()
     else:  # text
         lines = []
         if results.get("citations"):
@@ -984,22 +1056,22 @@ def _parse_identifier(ident: str) -> tuple[str | None, str | None, str | None]:
     ident = ident.strip()
 
     # Direct PDF URL
-    if re.match(r'^https?://.*\.pdf(?:\?.*)?$', ident, re.IGNORECASE):
+    if _PDF_URL.match(ident):
         return None, None, ident
 
     # DOI format: 10.xxxx/... or doi:10.xxxx/...
-    if re.match(r'^10\.\d{4,}/', ident) or ident.lower().startswith('doi:'):
+    if _DOI.match(ident) or ident.lower().startswith('doi:'):
         return ident.replace("doi:", "").replace("DOI:", "").strip(), None, None
 
     # arXiv format: arXiv:YYMM.NNNNN or just YYMM.NNNNN
-    arxiv_match = re.match(r'^(?:arXiv[:\s]*)?(\d{4}\.\d{4,5})(?:v\d+)?$', ident, re.IGNORECASE)
+    arxiv_match = _ARXIV_ID.match(ident)
     if arxiv_match:
         arxiv_id = arxiv_match.group(1)
         # Return as DOI format so it's recognized
         return f"10.48550/arXiv.{arxiv_id}", None, None
 
     # arxiv.org URL
-    arxiv_url_match = re.search(r'arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})', ident, re.IGNORECASE)
+    arxiv_url_match = _ARXIV_URL.search(ident)
     if arxiv_url_match:
         arxiv_id = arxiv_url_match.group(1)
         return f"10.48550/arXiv.{arxiv_id}", None, None
@@ -1008,6 +1080,104 @@ def _parse_identifier(ident: str) -> tuple[str | None, str | None, str | None]:
     return None, ident, None
 
 
+def _stream_pdf(client: Any, url: str, output_path: Path, chunk_size: int = 65536) -> None:
+    """Stream a PDF from a URL to disk without holding the body in memory.
+
+    The first chunk is checked for the PDF magic bytes (unless the server
+    says it is a PDF) before anything is written. Data goes to a ``.part``
+    file that is renamed into place once complete, so a failed download
+    never leaves a truncated PDF behind.
+
+    Args:
+        client: httpx.Client to download with
+        url: PDF URL
+        output_path: Destination path
+        chunk_size: Bytes per read
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response is not a PDF
+    """
+    part_path = output_path.with_name(output_path.name + ".part")
+    with client.stream("GET", url) as response:
+        response.raise_for_status()
+        is_pdf_type = "pdf" in response.headers.get("content-type", "").lower()
+        chunks = response.iter_bytes(chunk_size)
+        first = next(chunks, b"")
+        if not is_pdf_type and not first.startswith(b"%PDF"):
+            raise ValueError(f"Not a PDF: {url}")
+
+        try:
+            with open(part_path, "wb") as f:
+                f.write(first)
+                for chunk in chunks:
+                    f.write(chunk)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+    part_path.replace(output_path)
+
+
+@functools.cache
+def _runner() -> asyncio.Runner:
+    """Event loop shared by every coroutine the CLI runs in this process.
+
+    Commands such as ``doi2bib -i`` run one coroutine per line; reusing a
+    single loop avoids creating and tearing one down each time. The loop
+    is uvloop's when it is installed, which speeds up concurrent batches.
+    """
+    loop_factory = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            loop_factory = uvloop.new_event_loop
+
+    runner = asyncio.Runner(loop_factory=loop_factory)
+    atexit.register(runner.close)
+    return runner
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the shared event loop."""
+    return _runner().run(coro)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        path.write_text(json.dumps(data, indent=2))
+        return
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed.
+
+    Values JSON has no type for are written as their ``str()``.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2, default=str)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+
+def _load_json(path: Path) -> Any:
+    """Read a JSON file, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path) as f:
+            return json.load(f)
+    return orjson.loads(path.read_bytes())
+
+
 def _safe_str(text: str) -> str:
     """Convert text to ASCII-safe string for Windows console."""
     try:
@@ -1017,29 +1187,54 @@ def _safe_str(text: str) -> str:
         return text.encode("ascii", errors="replace").decode("ascii")
 
 
-def _load_papers_from_file(filepath: str) -> list[dict[str, str | None]]:
-    """Load paper identifiers from file."""
-    import csv
+@contextlib.contextmanager
+def _progress(length: int, label: str, enabled: bool = True) -> Iterator[Callable[[], None]]:
+    """Show a progress bar for a batch of ``length`` items.
 
+    Yields a function that advances the bar by one item. When disabled
+    (e.g. in verbose mode, which prints a line per item) it does nothing.
+    """
+    if not enabled:
+        yield lambda: None
+        return
+
+    with click.progressbar(length=length, label=label) as bar:
+        yield lambda: bar.update(1)
+
+
+def _paper_key(paper: dict[str, str | None]) -> str:
+    """Identity of a paper entry, for spotting duplicates in an input file."""
+    if pdf_url := paper.get("pdf_url"):
+        return f"url:{pdf_url}"
+    if doi := paper.get("doi"):
+        return f"doi:{doi.lower()}"
+    return "title:" + " ".join((paper.get("title") or "").lower().split())
+
+
+def _iter_papers_from_file(filepath: str) -> Iterator[dict[str, str | None]]:
+    """Yield paper identifiers from a file.
+
+    CSV and text files are read one row at a time, so the rows are never
+    all held in memory alongside the parsed identifiers.
+    """
     path = Path(filepath)
-    papers = []
 
     if path.suffix == ".json":
-        with open(path) as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                for item in data:
-                    if isinstance(item, str):
-                        doi, title, pdf_url = _parse_identifier(item)
-                        papers.append({"doi": doi, "title": title, "pdf_url": pdf_url})
-                    elif isinstance(item, dict):
-                        papers.append({"doi": item.get("doi"), "title": item.get("title"), "pdf_url": item.get("pdf_url")})
+        data = _load_json(path)
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, str):
+                    doi, title, pdf_url = _parse_identifier(item)
+                    yield {"doi": doi, "title": title, "pdf_url": pdf_url}
+                elif isinstance(item, dict):
+                    yield {"doi": item.get("doi"), "title": item.get("title"), "pdf_url": item.get("pdf_url")}
 
     elif path.suffix == ".csv":
+        import csv
+
         with open(path) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                papers.append({"doi": row.get("doi"), "title": row.get("title")})
+            for row in csv.DictReader(f):
+                yield {"doi": row.get("doi"), "title": row.get("title")}
 
     else:  # txt - one identifier per line
         with open(path) as f:
@@ -1048,9 +1243,7 @@ def _load_papers_from_file(filepath: str) -> list[dict[str, str | None]]:
                 if not line or line.startswith("#"):
                     continue
                 doi, title, pdf_url = _parse_identifier(line)
-                papers.append({"doi": doi, "title": title, "pdf_url": pdf_url})
-
-    return papers
+                yield {"doi": doi, "title": title, "pdf_url": pdf_url}
 
 
 def main():
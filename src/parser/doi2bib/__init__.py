@@ -13,23 +13,59 @@ Key Features:
 - Metadata retrieval from CrossRef, Semantic Scholar, OpenAlex
 """
 
-from .metadata import (
-    Author,
-    PaperMetadata,
-    get_metadata,
-)
-from .resolver import (
-    IdentifierType,
-    PaperIdentifier,
-    resolve_identifier,
-)
-from .verifier import (
-    BibEntry,
-    CitationVerifier,
-    VerificationResult,
-    VerificationStats,
-    parse_bib_file,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .metadata import (
+        Author,
+        PaperMetadata,
+        get_metadata,
+    )
+    from .resolver import (
+        IdentifierType,
+        PaperIdentifier,
+        resolve_identifier,
+    )
+    from .verifier import (
+        BibEntry,
+        CitationVerifier,
+        VerificationResult,
+        VerificationStats,
+        parse_bib_file,
+    )
+
+# Public name -> defining module. Resolved on first attribute access so
+# that importing the resolver alone does not also load httpx.
+_LAZY_EXPORTS = {
+    "CitationVerifier": ".verifier",
+    "VerificationResult": ".verifier",
+    "VerificationStats": ".verifier",
+    "BibEntry": ".verifier",
+    "parse_bib_file": ".verifier",
+    "PaperIdentifier": ".resolver",
+    "IdentifierType": ".resolver",
+    "resolve_identifier": ".resolver",
+    "PaperMetadata": ".metadata",
+    "Author": ".metadata",
+    "get_metadata": ".metadata",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Verifier
@@ -8,6 +8,11 @@ from typing import Any
 
 from .resolver import IdentifierType, PaperIdentifier
 
+_NON_WORD = re.compile(r"[^\w]")
+
+# Articles and prepositions skipped when picking the title word of a key
+_KEY_SKIP_WORDS = frozenset({"a", "an", "the", "on", "in", "of", "for", "to"})
+
 
 @dataclass
 class Author:
@@ -118,18 +123,17 @@ class PaperMetadata:
     def bibtex_key(self) -> str:
         """Generate BibTeX citation key."""
         # Format: LastName + Year + FirstWordOfTitle
-        last_name = re.sub(r"[^\w]", "", self.first_author_last_name.lower())
+        last_name = _NON_WORD.sub("", self.first_author_last_name.lower())
         year = str(self.year) if self.year else "0000"
 
         # Get first significant word from title
         if self.title:
             # Skip common articles
-            skip_words = {"a", "an", "the", "on", "in", "of", "for", "to"}
             words = self.title.lower().split()
             first_word = ""
             for word in words:
-                clean = re.sub(r"[^\w]", "", word)
-                if clean and clean not in skip_words:
+                clean = _NON_WORD.sub("", word)
+                if clean and clean not in _KEY_SKIP_WORDS:
                     first_word = clean
                     break
         else:
@@ -270,29 +274,23 @@ class PaperMetadata:
         """
         import yaml
 
-        # Build frontmatter data
+        # Build frontmatter data; optional fields are omitted when unset
+        optional_fields = (
+            ("year", self.year),
+            ("venue", self.venue),
+            ("doi", self.doi),
+            ("arxiv", self.arxiv_id),
+            ("url", self.url or self.pdf_url),
+            ("citations", self.citation_count),
+            ("keywords", self.keywords),
+            ("date", self.publication_date),
+        )
         frontmatter: dict[str, Any] = {
             "title": self.title,
             "authors": [a.name for a in self.authors],
+            **{key: value for key, value in optional_fields if value not in (None, "", [])},
         }
 
-        if self.year:
-            frontmatter["year"] = self.year
-        if self.venue:
-            frontmatter["venue"] = self.venue
-        if self.doi:
-            frontmatter["doi"] = self.doi
-        if self.arxiv_id:
-            frontmatter["arxiv"] = self.arxiv_id
-        if self.url or self.pdf_url:
-            frontmatter["url"] = self.url or self.pdf_url
-        if self.citation_count is not None:
-            frontmatter["citations"] = self.citation_count
-        if self.keywords:
-            frontmatter["keywords"] = self.keywords
-        if self.publication_date:
-            frontmatter["date"] = self.publication_date
-
         # Generate YAML frontmatter
         yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
@@ -14,15 +14,18 @@ Outputs:
 from __future__ import annotations
 
 import asyncio
-import json
 import re
+import time
 import urllib.parse
-import urllib.request
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+import httpx
+
 # Website URL patterns (no DOI expected)
 WEBSITE_PATTERNS = [
     r"github\.com",
@@ -259,26 +262,82 @@ class CitationVerifier:
         self,
         email: str | None = None,
         rate_limit: float = 0.5,
+        max_concurrent: int = 4,
+        client: httpx.AsyncClient | None = None,
     ):
         """Initialize verifier.
 
         Args:
             email: Email for API access
             rate_limit: Seconds between API requests
+            max_concurrent: Entries verified at the same time
+            client: HTTP client to share (one is opened per file or
+                directory run if not given)
         """
         self.email = email
         self.rate_limit = rate_limit
+        self.max_concurrent = max_concurrent
+        self._client = client
+        # Client opened for verify runs when none was given, and how many
+        # runs are using it
+        self._run_client: httpx.AsyncClient | None = None
+        self._runs = 0
         self._last_request = 0.0
+        self._rate_lock = asyncio.Lock()
 
     async def _rate_limit_wait(self):
         """Wait to respect rate limits."""
-        import time
+        async with self._rate_lock:
+            elapsed = time.time() - self._last_request
+            if elapsed < self.rate_limit:
+                await asyncio.sleep(self.rate_limit - elapsed)
+            self._last_request = time.time()
+
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Get the shared client, opening one for this block if there is none.
+
+        Within a verify run, DOI, arXiv and CrossRef lookups reuse the run's
+        keep-alive connections. A lookup made on its own gets a client of
+        its own, so it never closes one that another call is still using.
+        """
+        client = self._client or self._run_client
+        if client is not None:
+            yield client
+            return
 
-        now = time.time()
-        elapsed = now - self._last_request
-        if elapsed < self.rate_limit:
-            await asyncio.sleep(self.rate_limit - elapsed)
-        self._last_request = time.time()
+        async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+            yield client
+
+    @asynccontextmanager
+    async def _run_session(self) -> AsyncIterator[None]:
+        """Share one HTTP client across the lookups of a verify run.
+
+        Overlapping runs share the client, which is closed when the last
+        of them ends. A client given to the constructor is used as is.
+        """
+        if self._client is not None:
+            yield
+            return
+
+        if self._run_client is None:
+            self._run_client = httpx.AsyncClient(timeout=10, follow_redirects=True)
+        client = self._run_client
+        self._runs += 1
+        try:
+            yield
+        finally:
+            self._runs -= 1
+            if self._runs == 0:
+                self._run_client = None
+                await client.aclose()
+
+    async def _fetch_text(self, url: str, headers: dict[str, str]) -> str:
+        """GET a URL and return the response body as text."""
+        async with self._http_client() as client:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            return response.text
 
     async def get_bibtex_from_doi(self, doi: str) -> tuple[str, str | None]:
         """Fetch BibTeX from DOI.
@@ -299,9 +358,7 @@ class CitationVerifier:
                 "User-Agent": "ingestor/1.0 (mailto:research@example.com)",
             }
 
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                bibtex = response.read().decode("utf-8")
+            bibtex = await self._fetch_text(url, headers)
 
             if not bibtex or not bibtex.strip().startswith("@"):
                 return "", None
@@ -338,9 +395,7 @@ class CitationVerifier:
         headers = {"User-Agent": "ingestor/1.0"}
 
         try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                xml_data = response.read().decode()
+            xml_data = await self._fetch_text(url, headers)
 
             # Parse XML
             root = ET.fromstring(xml_data)
@@ -419,9 +474,10 @@ class CitationVerifier:
         headers = {"User-Agent": f"ingestor/1.0 (mailto:{self.email or 'research@example.com'})"}
 
         try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
+            async with self._http_client() as client:
+                response = await client.get(url, headers=headers)
+                response.raise_for_status()
+                data = response.json()
 
             return [
                 {
@@ -540,6 +596,26 @@ class CitationVerifier:
             message="Could not verify",
         )
 
+    async def _verify_entries(
+        self,
+        entries: list[BibEntry],
+        skip_keys: set[str] | None = None,
+    ) -> list[VerificationResult]:
+        """Verify entries concurrently, returning results in entry order.
+
+        Up to ``max_concurrent`` entries are in flight at once over one
+        shared HTTP client; requests are still spaced by ``rate_limit``.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def verify(entry: BibEntry) -> VerificationResult:
+            async with semaphore:
+                return await self.verify_entry(entry, skip_keys)
+
+        async with self._run_session(), asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(verify(entry)) for entry in entries]
+        return [task.result() for task in tasks]
+
     async def verify_file(
         self,
         input_path: Path,
@@ -574,8 +650,7 @@ class CitationVerifier:
         failed = []
 
         # Process entries
-        for entry in entries:
-            result = await self.verify_entry(entry, skip_keys)
+        for result in await self._verify_entries(entries, skip_keys):
             setattr(stats, result.status, getattr(stats, result.status) + 1)
 
             if result.status == "failed":
@@ -659,16 +734,19 @@ class CitationVerifier:
         all_failed = []
         file_results = []
 
-        for bib_file in bib_files:
-            entries = parse_bib_file(bib_file)
-            if not entries:
-                continue
+        # Entries from every file are verified together, then grouped back
+        # by file in their original order
+        files = [(bib_file, entries) for bib_file in bib_files if (entries := parse_bib_file(bib_file))]
+        results = iter(await self._verify_entries(
+            [entry for _, entries in files for entry in entries], skip_keys
+        ))
 
+        for bib_file, entries in files:
             file_verified = []
             file_failed = []
 
-            for entry in entries:
-                result = await self.verify_entry(entry, skip_keys)
+            for _ in entries:
+                result = next(results)
                 result.source_file = bib_file.name
                 setattr(stats, result.status, getattr(stats, result.status) + 1)
 
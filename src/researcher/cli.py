@@ -129,7 +129,22 @@ def research(query: str, output: str, output_format: str | None,
             click.echo(click.style(f"Research failed: {result.error}", fg="red"), err=True)
             sys.exit(1)
 
-    asyncio.run(run())
+    _run(run())
+
+
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    loop_factory = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
 
 
 def main():
@@ -7,6 +7,13 @@ import pytest
 from ingestor.core.registry import ExtractorRegistry, create_default_registry
 from ingestor.types import IngestConfig
 
+
+@pytest.fixture(autouse=True)
+def no_registry_cache(monkeypatch):
+    """Keep tests from reading or writing the user's entry point cache."""
+    monkeypatch.setenv("INGESTOR_NO_CACHE", "1")
+
+
 # ============================================================================
 # Path Fixtures
 # ============================================================================
@@ -113,3 +113,33 @@ class TestBatchCommand:
 
         # Should complete (may have 0 files processed)
         assert "Completed" in result.output or result.exit_code == 0
+
+    def test_batch_nonexistent_folder(self, runner, tmp_path):
+        """Test batch on a folder that does not exist."""
+        result = runner.invoke(main, [
+            "batch",
+            str(tmp_path / "missing"),
+            "-o", str(tmp_path / "output"),
+        ])
+
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+        assert "Usage:" in result.output
+
+    def test_batch_unreadable_folder(self, runner, tmp_path, monkeypatch):
+        """Test batch reports an unreadable folder as a usage error."""
+        import os
+
+        def deny(path, *args, **kwargs):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(os, "stat", deny)
+        result = runner.invoke(main, [
+            "batch",
+            str(tmp_path / "locked"),
+            "-o", str(tmp_path / "output"),
+        ])
+
+        assert result.exit_code == 2
+        assert "Permission denied" in result.output
+        assert "Usage:" in result.output
@@ -0,0 +1,50 @@
+"""Tests for the shared HTTP client."""
+
+import asyncio
+
+from ingestor.core.http import http_client, shared_http_client
+
+
+class TestHttpClient:
+    """Tests for http_client and shared_http_client."""
+
+    async def test_temporary_client_without_shared(self):
+        """Test a fresh client is created and closed outside a shared block."""
+        async with http_client() as client:
+            assert not client.is_closed
+        assert client.is_closed
+
+    async def test_shared_client_is_reused(self):
+        """Test http_client yields the shared client inside the block."""
+        async with shared_http_client() as shared:
+            async with http_client() as first:
+                pass
+            async with http_client() as second:
+                pass
+
+            assert first is shared
+            assert second is shared
+            assert not shared.is_closed
+
+        assert shared.is_closed
+
+    async def test_nested_shared_block_reuses_client(self):
+        """Test a nested shared block keeps the outer client open."""
+        async with shared_http_client() as outer:
+            async with shared_http_client() as inner:
+                assert inner is outer
+            assert not outer.is_closed
+
+        assert outer.is_closed
+
+    async def test_shared_client_visible_in_tasks(self):
+        """Test tasks started inside the block inherit the shared client."""
+
+        async def get_client():
+            async with http_client() as client:
+                return client
+
+        async with shared_http_client() as shared:
+            client = await asyncio.create_task(get_client())
+
+        assert client is shared
@@ -1,6 +1,8 @@
 """Tests for ExtractorRegistry."""
 
+from importlib.metadata import EntryPoint
 
+from ingestor.core import registry as registry_module
 from ingestor.core.registry import ExtractorRegistry, create_default_registry
 from ingestor.extractors.base import BaseExtractor
 from ingestor.types import MediaType
@@ -115,3 +117,77 @@ class TestCreateDefaultRegistry:
         registry = create_default_registry()
         # JSON should be available as it uses built-in json
         assert MediaType.JSON in registry
+
+
+class TestLazyRegistration:
+    """Tests for lazily registered extractors."""
+
+    def test_lazy_extractor_resolved_on_get(self, empty_registry):
+        """Test a lazy spec is imported and instantiated on first get."""
+        empty_registry.register_lazy(
+            MediaType.JSON, "ingestor.extractors.data.json_extractor", "JsonExtractor"
+        )
+
+        assert MediaType.JSON in empty_registry
+        extractor = empty_registry.get(MediaType.JSON)
+        assert extractor is not None
+        assert empty_registry.get(MediaType.JSON) is extractor
+
+    def test_missing_module_resolves_to_none(self, empty_registry):
+        """Test a spec whose module cannot be imported is dropped."""
+        empty_registry.register_lazy(MediaType.PDF, "ingestor.no_such_module", "Nope")
+
+        assert empty_registry.get(MediaType.PDF) is None
+        assert MediaType.PDF not in empty_registry
+
+    def test_shared_spec_shares_instance(self):
+        """Test GIT and GITHUB resolve to the same extractor instance."""
+        registry = create_default_registry()
+
+        assert registry.get(MediaType.GIT) is registry.get(MediaType.GITHUB)
+
+    def test_preload_resolves_requested_types_only(self):
+        """Test preload resolves the given types and leaves others pending."""
+        registry = create_default_registry()
+
+        registry.preload([MediaType.TXT, MediaType.JSON])
+
+        assert MediaType.TXT in registry._extractors
+        assert MediaType.JSON in registry._extractors
+        assert MediaType.PDF not in registry._extractors
+        assert MediaType.PDF in registry
+
+
+class TestEntryPointCache:
+    """Tests for the on-disk cache of entry point extractor specs."""
+
+    def test_entry_points_scanned_once(self, tmp_path, monkeypatch):
+        """Test a second registry reuses the cached specs."""
+        scans = []
+
+        def fake_entry_points(group):
+            scans.append(group)
+            return [EntryPoint("json", "my_pkg.fast_json:FastJsonExtractor", group)]
+
+        monkeypatch.delenv("INGESTOR_NO_CACHE")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(registry_module, "entry_points", fake_entry_points)
+
+        first = create_default_registry()
+        second = create_default_registry()
+
+        assert len(scans) == 1
+        assert first._specs[MediaType.JSON] == ("my_pkg.fast_json", "FastJsonExtractor")
+        assert second._specs[MediaType.JSON] == ("my_pkg.fast_json", "FastJsonExtractor")
+
+    def test_no_cache_env(self, tmp_path, monkeypatch):
+        """Test INGESTOR_NO_CACHE scans every time and writes nothing."""
+        scans = []
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(registry_module, "entry_points", lambda group: scans.append(group) or [])
+
+        create_default_registry()
+        create_default_registry()
+
+        assert len(scans) == 2
+        assert list(tmp_path.iterdir()) == []
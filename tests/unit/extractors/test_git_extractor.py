@@ -1,10 +1,18 @@
 """Unit tests for unified Git extractor."""
 
+import asyncio
+import base64
+import hashlib
+import io
+import zipfile
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
+from ingestor.extractors.git import git_extractor as git_module
 from ingestor.extractors.git.git_extractor import GitExtractor, GitRepoConfig
 from ingestor.types import MediaType
 
@@ -333,6 +341,213 @@ class TestGitExtractorAsync:
                                 # Expected due to incomplete mocking
                                 pass
 
+    @pytest.mark.asyncio
+    async def test_extract_github_directory_fetches_concurrently(self, extractor):
+        """Test directory files are fetched concurrently and kept in order."""
+        listing = [
+            {"type": "file", "name": name, "path": f"src/{name}", "size": 10}
+            for name in ("a.py", "b.py", "broken.py", "c.py")
+        ]
+        active = 0
+        peak = 0
+
+        async def fetch_file(owner, repo, branch, path):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if path == "src/broken.py":
+                raise RuntimeError("not found")
+            return f"# {path.split('/')[-1]}".encode()
+
+        with (
+            patch.object(extractor, "_api_request", return_value=listing),
+            patch.object(extractor, "_fetch_file", side_effect=fetch_file),
+        ):
+            result = await extractor.extract("https://github.com/owner/repo/tree/main/src")
+
+        assert peak > 1
+        contents = result.markdown.split("## File Contents")[1]
+        assert contents.index("# a.py") < contents.index("# b.py") < contents.index("# c.py")
+        assert "# broken.py" not in contents
+
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        """Route the extractor's HTTP requests to a mock handler."""
+
+        def install(handler):
+            @asynccontextmanager
+            async def client():
+                async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+                    yield c
+
+            monkeypatch.setattr(git_module, "http_client", client)
+
+        return install
+
+    @pytest.mark.asyncio
+    async def test_api_response_cached(self, extractor, serve):
+        """Test a fresh API response is reused without a request."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"name": "repo"}, headers={"ETag": '"v1"'})
+
+        serve(handler)
+        url = "https://api.github.com/repos/owner/repo"
+
+        assert await extractor._api_request(url) == {"name": "repo"}
+        assert await extractor._api_request(url) == {"name": "repo"}
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_api_response_revalidated_with_etag(self, extractor, serve):
+        """Test a stale API response is revalidated and kept on 304."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"name": "repo"}, headers={"ETag": '"v1"'})
+
+        serve(handler)
+        extractor.API_CACHE_TTL = 0
+        url = "https://api.github.com/repos/owner/repo"
+
+        assert await extractor._api_request(url) == {"name": "repo"}
+        assert await extractor._api_request(url) == {"name": "repo"}
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+
+    @pytest.mark.asyncio
+    async def test_extract_github_directory_from_zipball(self, extractor, serve):
+        """Test a directory with many files is read from one zipball."""
+        names = [f"m{i}.py" for i in range(6)]
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            for name in names:
+                zf.writestr(f"owner-repo-abc123/src/{name}", f"# {name}")
+        listing = [
+            {"type": "file", "name": name, "path": f"src/{name}", "size": 10}
+            for name in [*names, "gone.py"]
+        ]
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            if request.url.path == "/repos/owner/repo":
+                return httpx.Response(200, json={"size": 100})
+            if request.url.path == "/repos/owner/repo/zipball/main":
+                return httpx.Response(200, content=buf.getvalue())
+            if request.url.host == "raw.githubusercontent.com":
+                return httpx.Response(200, content=b"# gone.py")
+            return httpx.Response(200, json=listing)
+
+        serve(handler)
+        result = await extractor.extract("https://github.com/owner/repo/tree/main/src")
+
+        # Only the file missing from the archive is fetched on its own
+        assert not any("/contents/src/" in path for path in requests)
+        assert [path for path in requests if path.startswith("/owner/")] == ["/owner/repo/main/src/gone.py"]
+        contents = result.markdown.split("## File Contents")[1]
+        assert [line for line in contents.splitlines() if line.startswith("# ")] == [
+            f"# {name}" for name in [*names, "gone.py"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_file_content_raw(self, extractor, serve):
+        """Test file content is downloaded from the raw endpoint."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(200, content=b"print('hi')\n")
+
+        serve(handler)
+        content = await extractor._get_file_content("owner", "repo", "main", "src/my file.py")
+
+        assert content == "print('hi')\n"
+        assert [str(url) for url in requests] == [
+            "https://raw.githubusercontent.com/owner/repo/main/src/my%20file.py"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_file_content_falls_back_to_api(self, extractor, serve):
+        """Test the contents API is used when the raw endpoint 404s."""
+
+        def handler(request):
+            if request.url.host == "raw.githubusercontent.com":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"content": base64.b64encode(b"data").decode()})
+
+        serve(handler)
+
+        assert await extractor._get_file_content("owner", "repo", "main", "sub") == "data"
+
+    @pytest.mark.asyncio
+    async def test_api_response_revalidated_across_runs(self, serve, monkeypatch, tmp_path):
+        """Test a response cached on disk is revalidated by a new extractor."""
+        monkeypatch.delenv("INGESTOR_NO_CACHE")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-Modified-Since") == "Mon, 05 Oct 2026 10:00:00 GMT":
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={"name": "repo"}, headers={"Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}
+            )
+
+        serve(handler)
+        url = "https://api.github.com/repos/owner/repo"
+
+        assert await GitExtractor()._api_request(url) == {"name": "repo"}
+        assert await GitExtractor()._api_request(url) == {"name": "repo"}
+        assert len(requests) == 2
+        assert "If-Modified-Since" in requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_blob_cache(self, extractor, serve, monkeypatch, tmp_path):
+        """Test a file with a known blob SHA is downloaded only once."""
+        monkeypatch.delenv("INGESTOR_NO_CACHE")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"cached\n")
+
+        serve(handler)
+        sha = hashlib.sha1(b"blob 7\0cached\n").hexdigest()
+
+        assert await extractor._get_file_content("owner", "repo", "main", "a.py", sha) == "cached\n"
+        assert await extractor._get_file_content("owner", "repo", "main", "a.py", sha) == "cached\n"
+        assert len(requests) == 1
+        assert (tmp_path / "ingestor" / "github" / "blobs" / sha[:2] / sha).read_bytes() == b"cached\n"
+
+    @pytest.mark.asyncio
+    async def test_blob_cache_skips_mismatched_content(self, extractor, serve, monkeypatch, tmp_path):
+        """Test content that does not hash to the listed SHA is not cached."""
+        monkeypatch.delenv("INGESTOR_NO_CACHE")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"moved on\n")
+
+        serve(handler)
+        sha = "a" * 40
+
+        assert await extractor._get_file_content("owner", "repo", "main", "a.py", sha) == "moved on\n"
+        assert await extractor._get_file_content("owner", "repo", "main", "a.py", sha) == "moved on\n"
+        assert len(requests) == 2
+        assert not (tmp_path / "ingestor" / "github" / "blobs" / "aa" / sha).exists()
+
 
 class TestDownloadGitFile:
     """Tests for .download_git file parsing."""
@@ -0,0 +1,33 @@
+"""Tests for PaperDownloader BibTeX output."""
+
+
+from parser.acquisition.downloader import PaperDownloader
+
+
+def _metadata(title: str) -> dict:
+    return {"title": title, "authors": [{"name": "John Doe", "family": "Doe"}], "year": 2024}
+
+
+class TestGenerateBibtex:
+    """Tests for PaperDownloader._generate_bibtex."""
+
+    def test_appends_new_entries(self, tmp_path):
+        """Test each paper adds its own entry to citation.bib."""
+        downloader = PaperDownloader()
+
+        downloader._generate_bibtex(_metadata("Attention Is All You Need"), tmp_path)
+        path = downloader._generate_bibtex(_metadata("Deep Residual Learning"), tmp_path)
+
+        text = path.read_text()
+        assert text.count("@") == 2
+        assert "doe2024attention" in text
+        assert "doe2024deep" in text
+
+    def test_skips_existing_key(self, tmp_path):
+        """Test an entry whose key is already in the file is not duplicated."""
+        (tmp_path / "citation.bib").write_text("@article{doe2024attention,\n  title = {X}\n}\n")
+        downloader = PaperDownloader()
+
+        path = downloader._generate_bibtex(_metadata("Attention Is All You Need"), tmp_path)
+
+        assert path.read_text().count("@") == 1
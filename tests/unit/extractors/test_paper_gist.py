@@ -0,0 +1,81 @@
+"""Tests for the config gist client."""
+
+import json
+
+import httpx
+import pytest
+
+from parser.acquisition import gist as gist_module
+from parser.acquisition.gist import GistClient
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the gist client's HTTP requests to a mock handler."""
+    real_client = httpx.Client
+
+    def install(handler):
+        def client(*args, **kwargs):
+            return real_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+        monkeypatch.setattr(gist_module.httpx, "Client", client)
+
+    return install
+
+
+class TestGistClient:
+    """Tests for GistClient."""
+
+    def test_create_private_gist(self, tmp_path, serve):
+        """Test a new gist is created private with the file's content."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json={"id": "abc123", "html_url": "https://gist.github.com/abc123"})
+
+        serve(handler)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("email: me@example.org\n")
+
+        with GistClient("token") as gists:
+            gist_id, url = gists.create(config_path, "parser config")
+
+        assert (gist_id, url) == ("abc123", "https://gist.github.com/abc123")
+        assert requests[0].headers["Authorization"] == "Bearer token"
+        body = json.loads(requests[0].content)
+        assert body["public"] is False
+        assert body["files"] == {"config.yaml": {"content": "email: me@example.org\n"}}
+
+    def test_read_named_file(self, serve):
+        """Test the file matching the requested name is returned."""
+        serve(lambda request: httpx.Response(200, json={"files": {
+            "notes.md": {"content": "notes"},
+            "config.yaml": {"content": "email: me@example.org\n"},
+        }}))
+
+        with GistClient("token") as gists:
+            assert gists.read("abc123", "config.yaml") == "email: me@example.org\n"
+
+    def test_read_truncated_file(self, serve):
+        """Test a truncated file is fetched from its raw URL."""
+        def handler(request):
+            if request.url.host == "gist.githubusercontent.com":
+                return httpx.Response(200, text="full content")
+            return httpx.Response(200, json={"files": {"config.yaml": {
+                "content": "full",
+                "truncated": True,
+                "raw_url": "https://gist.githubusercontent.com/u/abc123/raw/config.yaml",
+            }}})
+
+        serve(handler)
+
+        with GistClient("token") as gists:
+            assert gists.read("abc123") == "full content"
+
+    def test_http_error(self, serve):
+        """Test a failed request raises."""
+        serve(lambda request: httpx.Response(404))
+
+        with GistClient("token") as gists, pytest.raises(httpx.HTTPStatusError):
+            gists.read("missing")
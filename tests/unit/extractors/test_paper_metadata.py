@@ -304,3 +304,18 @@ class TestMetadataSerialization:
         assert restored.arxiv_id == original.arxiv_id
         assert restored.citation_count == original.citation_count
         assert restored.keywords == original.keywords
+
+    def test_markdown_frontmatter_omits_unset_fields(self):
+        """Test markdown frontmatter keeps zero citations and drops empty fields."""
+        meta = PaperMetadata(
+            title="Test Paper",
+            authors=[Author(name="John Doe")],
+            year=2024,
+            citation_count=0,
+        )
+        frontmatter = meta.to_markdown().split("---")[1]
+
+        assert "year: 2024" in frontmatter
+        assert "citations: 0" in frontmatter
+        assert "doi:" not in frontmatter
+        assert "keywords:" not in frontmatter
@@ -0,0 +1,85 @@
+"""Tests for the on-disk metadata cache."""
+
+from parser.acquisition.config import Config
+from parser.acquisition.metadata_cache import MetadataCache
+from parser.acquisition.retriever import PaperRetriever
+
+METADATA = {"doi": "10.1234/abc", "title": "A Paper", "authors": [], "year": 2024}
+
+
+class TestMetadataCache:
+    """Tests for MetadataCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test stored metadata is returned after reopening the cache."""
+        cache = MetadataCache(tmp_path / "cache.db")
+        cache.set(MetadataCache.key("10.1234/ABC", None), METADATA)
+        cache.close()
+
+        cache = MetadataCache(tmp_path / "cache.db")
+        assert cache.get(MetadataCache.key("10.1234/abc", None)) == METADATA
+        assert cache.get(MetadataCache.key(None, "Other")) is None
+
+    def test_expired_entry_ignored(self, tmp_path):
+        """Test entries older than the TTL are treated as missing."""
+        cache = MetadataCache(tmp_path / "cache.db", ttl=-1)
+        cache.set("doi:10.1234/abc", METADATA)
+
+        assert cache.get("doi:10.1234/abc") is None
+
+
+class TestResolveMetadataCache:
+    """Tests for PaperRetriever._resolve_metadata caching."""
+
+    async def test_hit_skips_lookup(self, tmp_path, monkeypatch):
+        """Test a cached lookup is not repeated and failures are not cached."""
+        calls = []
+
+        async def lookup(doi=None, title=None):
+            calls.append(doi or title)
+            return METADATA if doi else None
+
+        retriever = PaperRetriever(Config(batch={"metadata_cache": "cache.db"}))
+        monkeypatch.setattr(retriever, "_lookup_metadata", lookup)
+
+        async with retriever._batch_session(tmp_path, max_concurrent=1):
+            assert await retriever._resolve_metadata("10.1234/abc") == METADATA
+            assert await retriever._resolve_metadata("10.1234/abc") == METADATA
+            assert await retriever._resolve_metadata(title="Unknown") == {"doi": None, "title": "Unknown"}
+            assert await retriever._resolve_metadata(title="Unknown") == {"doi": None, "title": "Unknown"}
+
+        assert calls == ["10.1234/abc", "Unknown", "Unknown"]
+        assert retriever._metadata_cache is None
+
+
+class TestPrefetchMetadata:
+    """Tests for PaperRetriever._prefetch_metadata."""
+
+    async def test_bulk_lookup_replaces_per_paper_calls(self, tmp_path, monkeypatch):
+        """Test DOIs returned by the bulk query are not looked up again."""
+        requested = []
+        lookups = []
+
+        async def get_works(dois):
+            requested.append(dois)
+            return [{"DOI": "10.1234/a", "title": ["Paper A"], "author": []}]
+
+        async def lookup(doi=None, title=None):
+            lookups.append(doi or title)
+            return None
+
+        retriever = PaperRetriever(Config())
+        monkeypatch.setattr(retriever.clients["crossref"], "get_works", get_works)
+        monkeypatch.setattr(retriever, "_lookup_metadata", lookup)
+        monkeypatch.setattr(retriever.rate_limiter, "delays", {"crossref": 0})
+
+        async with retriever._batch_session(tmp_path, max_concurrent=1):
+            await retriever._prefetch_metadata(
+                [{"doi": "10.1234/A"}, {"doi": "10.1234/b"}, {"doi": "10.1234/a"}, {"title": "T"}]
+            )
+            assert (await retriever._resolve_metadata("10.1234/A"))["title"] == "Paper A"
+            await retriever._resolve_metadata("10.1234/b")
+
+        assert requested == [["10.1234/A", "10.1234/b"]]
+        assert lookups == ["10.1234/b"]
+        assert retriever._prefetched == {}
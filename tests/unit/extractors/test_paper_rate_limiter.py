@@ -0,0 +1,33 @@
+"""Tests for the acquisition RateLimiter."""
+
+import asyncio
+import time
+
+from parser.acquisition.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter.wait."""
+
+    async def test_spaces_calls_to_same_source(self):
+        """Test back-to-back calls to one source wait for its delay."""
+        limiter = RateLimiter({"per_source_delays": {"arxiv": 0.2}})
+
+        start = time.monotonic()
+        await asyncio.gather(limiter.wait("arxiv"), limiter.wait("arxiv"))
+
+        assert time.monotonic() - start >= 0.15
+
+    async def test_sources_do_not_block_each_other(self):
+        """Test waiting on one source does not delay another."""
+        limiter = RateLimiter({"per_source_delays": {"arxiv": 0.5, "crossref": 0.0}})
+        await limiter.wait("arxiv")
+
+        start = time.monotonic()
+        slow = asyncio.create_task(limiter.wait("arxiv"))
+        await asyncio.sleep(0)
+        await limiter.wait("crossref")
+        elapsed = time.monotonic() - start
+        await slow
+
+        assert elapsed < 0.25
@@ -0,0 +1,267 @@
+"""Tests for PaperRetriever PDF downloads and batches."""
+
+import asyncio
+import random
+from pathlib import Path
+
+import httpx
+import pytest
+
+from parser.acquisition import retriever as retriever_module
+from parser.acquisition.config import Config
+from parser.acquisition.retriever import PaperRetriever, RetrievalResult, RetrievalStatus
+
+PDF_BODY = b"%PDF-1.7\n" + b"x" * 200_000
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the retriever's HTTP client to a mock handler."""
+    real_client = httpx.AsyncClient
+
+    def install(handler):
+        def client(*args, **kwargs):
+            return real_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+        monkeypatch.setattr(retriever_module.httpx, "AsyncClient", client)
+
+    return install
+
+
+class TestDownloadPdf:
+    """Tests for PaperRetriever._download_pdf."""
+
+    async def test_streams_pdf_to_disk(self, tmp_path, serve):
+        """Test the whole body is written and no partial file is left."""
+        serve(lambda request: httpx.Response(200, content=PDF_BODY))
+        output_path = tmp_path / "papers" / "paper.pdf"
+
+        assert await PaperRetriever(Config())._download_pdf("https://example.org/p", output_path)
+
+        assert output_path.read_bytes() == PDF_BODY
+        assert list(output_path.parent.iterdir()) == [output_path]
+
+    async def test_rejects_non_pdf(self, tmp_path, serve):
+        """Test an HTML page is not saved as a PDF."""
+        serve(lambda request: httpx.Response(
+            200, content=b"<html></html>", headers={"content-type": "text/html"}
+        ))
+        output_path = tmp_path / "paper.pdf"
+
+        assert not await PaperRetriever(Config())._download_pdf("https://example.org/p", output_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_http_error(self, tmp_path, serve):
+        """Test a failed request returns False."""
+        serve(lambda request: httpx.Response(404))
+        output_path = tmp_path / "paper.pdf"
+
+        assert not await PaperRetriever(Config())._download_pdf("https://example.org/p", output_path)
+
+        assert not output_path.exists()
+
+    async def test_shared_client_reused(self, tmp_path, serve, monkeypatch):
+        """Test downloads inside a shared-client block use one connection pool."""
+        serve(lambda request: httpx.Response(200, content=PDF_BODY))
+        created = []
+        make_client = retriever_module.httpx.AsyncClient
+        monkeypatch.setattr(
+            retriever_module.httpx,
+            "AsyncClient",
+            lambda *args, **kwargs: created.append(1) or make_client(*args, **kwargs),
+        )
+        retriever = PaperRetriever(Config())
+
+        async with retriever._shared_http_client(max_concurrent=2):
+            assert await retriever._download_pdf("https://example.org/a", tmp_path / "a.pdf")
+            assert await retriever._download_pdf("https://example.org/b", tmp_path / "b.pdf")
+
+        assert len(created) == 1
+        assert retriever._http is None
+
+    async def test_overlapping_downloads_outside_batch(self, tmp_path, serve, monkeypatch):
+        """Test concurrent downloads without a batch do not close each other's client."""
+        clients = []
+
+        async def handler(request):
+            # The first download finishes while the second is still in flight
+            if request.url.path == "/b":
+                await asyncio.sleep(0.05)
+                if any(client.is_closed for client in clients):
+                    return httpx.Response(500)
+            return httpx.Response(200, content=PDF_BODY)
+
+        serve(handler)
+        make_client = retriever_module.httpx.AsyncClient
+        monkeypatch.setattr(
+            retriever_module.httpx,
+            "AsyncClient",
+            lambda *args, **kwargs: clients.append(make_client(*args, **kwargs)) or clients[-1],
+        )
+        retriever = PaperRetriever(Config())
+
+        results = await asyncio.gather(
+            retriever._download_pdf("https://example.org/a", tmp_path / "a.pdf"),
+            retriever._download_pdf("https://example.org/b", tmp_path / "b.pdf"),
+        )
+
+        assert results == [True, True]
+        assert (tmp_path / "b.pdf").read_bytes() == PDF_BODY
+        assert retriever._http is None
+
+
+class TestRetrieveBatch:
+    """Tests for PaperRetriever.retrieve_batch."""
+
+    async def test_concurrent_results_in_input_order(self, tmp_path, monkeypatch):
+        """Test a concurrent batch caps in-flight papers and keeps input order."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_retrieve(doi=None, title=None, output_dir=None, verbose=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(random.random() / 100)
+            in_flight -= 1
+            return RetrievalResult(doi=doi, title="", status=RetrievalStatus.SUCCESS)
+
+        retriever = PaperRetriever(Config())
+        monkeypatch.setattr(retriever, "retrieve", fake_retrieve)
+        papers = [{"doi": f"10.1234/{i}"} for i in range(20)]
+
+        results = await retriever.retrieve_batch(
+            papers, output_dir=tmp_path, verbose=False, save_progress=False, max_concurrent=3
+        )
+
+        assert [r.doi for r in results] == [p["doi"] for p in papers]
+        assert peak == 3
+
+    async def test_on_result_called_per_paper(self, tmp_path, monkeypatch):
+        """Test on_result sees every paper's result, in sequential mode too."""
+        async def fake_retrieve(doi=None, title=None, output_dir=None, verbose=True):
+            return RetrievalResult(doi=doi, title="", status=RetrievalStatus.SUCCESS)
+
+        retriever = PaperRetriever(Config(rate_limits={"global_delay": 0}))
+        monkeypatch.setattr(retriever, "retrieve", fake_retrieve)
+        seen = []
+
+        await retriever.retrieve_batch(
+            [{"doi": "10.1234/a"}, {"doi": "10.1234/b"}],
+            output_dir=tmp_path, verbose=False, save_progress=False, on_result=seen.append,
+        )
+
+        assert [r.doi for r in seen] == ["10.1234/a", "10.1234/b"]
+
+
+class TestRetrieveSkipExisting:
+    """Tests for PaperRetriever.retrieve with skip_existing."""
+
+    async def test_identifier_named_pdf_skipped_without_lookup(self, tmp_path, monkeypatch):
+        """Test a PDF named after the DOI is skipped before resolving metadata."""
+        async def lookup(doi=None, title=None):
+            raise AssertionError("metadata lookup should not run")
+
+        retriever = PaperRetriever(Config(download={"skip_existing": True}))
+        monkeypatch.setattr(retriever, "_lookup_metadata", lookup)
+        (tmp_path / "10.1234_abc.pdf").write_bytes(PDF_BODY)
+
+        result = await retriever.retrieve(doi="10.1234/abc", output_dir=tmp_path, verbose=False)
+
+        assert result.status == RetrievalStatus.SKIPPED
+        assert result.pdf_path == str(tmp_path / "10.1234_abc.pdf")
+
+    async def test_batch_uses_directory_listing(self, tmp_path, monkeypatch):
+        """Test existence checks inside a batch are answered from one listing."""
+        retriever = PaperRetriever(Config(download={"skip_existing": True}))
+        (tmp_path / "10.1234_abc.pdf").write_bytes(PDF_BODY)
+
+        async with retriever._batch_session(tmp_path, max_concurrent=1):
+            monkeypatch.setattr(Path, "exists", lambda self: False)
+            result = await retriever.retrieve(doi="10.1234/abc", output_dir=tmp_path, verbose=False)
+
+        assert result.status == RetrievalStatus.SKIPPED
+
+
+class TestArxivPrefetch:
+    """Tests for downloading arXiv PDFs while metadata resolves."""
+
+    async def test_prefetched_pdf_saved_under_metadata_name(self, tmp_path, serve, monkeypatch):
+        """Test the early download is moved to the metadata-based filename."""
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, content=PDF_BODY)
+
+        async def lookup(doi=None, title=None):
+            return {"doi": doi, "title": "Some Paper", "authors": [{"family": "Doe"}], "year": 2020}
+
+        serve(handler)
+        retriever = PaperRetriever(Config(sources={"arxiv": {"enabled": True, "priority": 1}}))
+        monkeypatch.setattr(retriever, "_lookup_metadata", lookup)
+
+        result = await retriever.retrieve(doi="10.48550/arXiv.2005.11401", output_dir=tmp_path, verbose=False)
+
+        assert result.status == RetrievalStatus.SUCCESS
+        assert result.source == "arxiv"
+        assert requested == ["https://arxiv.org/pdf/2005.11401.pdf"]
+        assert sorted(p.name for p in tmp_path.glob("*.pdf*")) == ["Doe_2020_Some_Paper.pdf"]
+
+    async def test_prefetch_discarded_when_already_downloaded(self, tmp_path, serve, monkeypatch):
+        """Test an existing PDF wins and the early download leaves nothing behind."""
+        async def lookup(doi=None, title=None):
+            return {"doi": doi, "title": "Some Paper", "authors": [{"family": "Doe"}], "year": 2020}
+
+        serve(lambda request: httpx.Response(200, content=PDF_BODY))
+        retriever = PaperRetriever(Config(
+            sources={"arxiv": {"enabled": True, "priority": 1}},
+            download={"skip_existing": True},
+        ))
+        monkeypatch.setattr(retriever, "_lookup_metadata", lookup)
+        (tmp_path / "Doe_2020_Some_Paper.pdf").write_bytes(b"%PDF-old")
+
+        result = await retriever.retrieve(doi="10.48550/arXiv.2005.11401", output_dir=tmp_path, verbose=False)
+
+        assert result.status == RetrievalStatus.SKIPPED
+        assert sorted(p.name for p in tmp_path.glob("*.pdf*")) == ["Doe_2020_Some_Paper.pdf"]
+        assert not list(tmp_path.glob(".arxiv_*"))
+
+    async def test_failed_prefetch_not_retried(self, tmp_path, serve, monkeypatch):
+        """Test the arXiv source is skipped once the early download has failed."""
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(404)
+
+        async def lookup(doi=None, title=None):
+            return {"doi": doi, "title": "Some Paper", "authors": [{"family": "Doe"}], "year": 2020}
+
+        async def try_source(*args, **kwargs):
+            raise AssertionError("arXiv source should not run")
+
+        serve(handler)
+        retriever = PaperRetriever(Config(sources={"arxiv": {"enabled": True, "priority": 1}}))
+        monkeypatch.setattr(retriever, "_lookup_metadata", lookup)
+        monkeypatch.setattr(retriever, "_try_source", try_source)
+
+        result = await retriever.retrieve(doi="10.48550/arXiv.2005.11401", output_dir=tmp_path, verbose=False)
+
+        assert result.status == RetrievalStatus.NOT_FOUND
+        assert requested == ["https://arxiv.org/pdf/2005.11401.pdf"]
+
+
+class TestDoiAuthority:
+    """Tests for PaperRetriever._doi_authority."""
+
+    def test_known_prefixes(self):
+        """Test preprint DOIs map to the server that issued them."""
+        assert PaperRetriever._doi_authority("10.48550/arXiv.2005.11401") == "arxiv"
+        assert PaperRetriever._doi_authority("10.1101/2020.01.01.123456") == "biorxiv"
+
+    def test_matches_whole_prefix(self):
+        """Test a registrant that only starts with a known prefix is not matched."""
+        assert PaperRetriever._doi_authority("10.11012/abc") is None
+        assert PaperRetriever._doi_authority("10.1038/nature12373") is None
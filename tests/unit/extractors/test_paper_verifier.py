@@ -1,6 +1,8 @@
 """Tests for citation verifier module."""
 
+import asyncio
 
+import httpx
 import pytest
 
 from parser.doi2bib.verifier import (
@@ -411,3 +413,66 @@ class TestCitationVerifier:
         # Check verified.bib content
         verified_content = (output_dir / "verified.bib").read_text()
         assert "github_test" in verified_content
+
+
+class TestVerifierHttp:
+    """Tests for CitationVerifier lookups over a shared HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_directory_results_keep_file_order(self, tmp_path):
+        """Test concurrent verification reports entries per file, in order."""
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.host)
+            doi = request.url.path.rsplit("/", 1)[-1].replace("%2F", "/")
+            return httpx.Response(200, text=f"@article{{x,\n  title = {{Paper {doi[-1]}}}\n}}")
+
+        (tmp_path / "a.bib").write_text(
+            "@article{a1,\n  title = {Paper 1},\n  doi = {10.1234/1}\n}\n"
+            "@article{a2,\n  title = {Paper 2},\n  doi = {10.1234/2}\n}\n"
+        )
+        (tmp_path / "b.bib").write_text("@article{b1,\n  title = {Paper 3},\n  doi = {10.1234/3}\n}\n")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            verifier = CitationVerifier(rate_limit=0, client=client)
+            stats, results = await verifier.verify_directory(tmp_path, tmp_path / "out", dry_run=True)
+
+        assert [(r.source_file, r.key, r.status) for r in results] == [
+            ("a.bib", "a1", "verified"),
+            ("a.bib", "a2", "verified"),
+            ("b.bib", "b1", "verified"),
+        ]
+        assert requested == ["doi.org"] * 3
+
+    @pytest.mark.asyncio
+    async def test_overlapping_lookups_keep_their_clients(self, monkeypatch):
+        """Test a standalone lookup never closes a client another call is using."""
+        from parser.doi2bib import verifier as verifier_module
+
+        async def handler(request, client):
+            # The fast lookup finishes while the slow one is still in flight
+            slow = request.url.path.endswith("slow")
+            await asyncio.sleep(0.05 if slow else 0.01)
+            if client.is_closed:
+                return httpx.Response(500)
+            return httpx.Response(200, text="@article{x,\n  title = {Paper}\n}")
+
+        real_client = httpx.AsyncClient
+
+        def make_client(*args, **kwargs):
+            client = real_client(
+                *args, transport=httpx.MockTransport(lambda request: handler(request, client)), **kwargs
+            )
+            return client
+
+        monkeypatch.setattr(verifier_module.httpx, "AsyncClient", make_client)
+        verifier = CitationVerifier(rate_limit=0)
+
+        fast, slow = await asyncio.gather(
+            verifier.get_bibtex_from_doi("10.1234/fast"),
+            verifier.get_bibtex_from_doi("10.1234/slow"),
+        )
+
+        assert fast[1] == "Paper"
+        assert slow[1] == "Paper"
@@ -1,11 +1,24 @@
 """Real unit tests for CLI commands - no mocking."""
 
+import asyncio
+import importlib.util
+import json
+import sys
 from pathlib import Path
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from ingestor.cli import _create_registry, create_config, main
+from ingestor.cli import (
+    _AsyncGroup,
+    _create_registry,
+    _iter_images,
+    _PlainConsole,
+    _StatusBuffer,
+    create_config,
+    main,
+)
 from ingestor.types import IngestConfig, MediaType
 
 
@@ -81,6 +94,10 @@ class TestCreateRegistry:
         registry = _create_registry()
         assert registry is not None
 
+    def test_registry_shared_across_calls(self):
+        """Test _create_registry reuses one registry per process."""
+        assert _create_registry() is _create_registry()
+
     def test_registry_has_text_extractor(self):
         """Test registry contains text extractor."""
         registry = _create_registry()
@@ -206,6 +223,106 @@ class TestCLIHelp:
         assert "--ollama-host" in result.output
 
 
+class TestPrerenderedHelp:
+    """Tests for the help text pre-rendered into ingestor._help."""
+
+    def test_help_is_up_to_date(self):
+        """Test _help.py matches the live CLI (run scripts/gen_help.py if not)."""
+        from ingestor._help import HELP
+
+        script = Path(__file__).parents[2] / "scripts" / "gen_help.py"
+        spec = importlib.util.spec_from_file_location("gen_help", script)
+        gen_help = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(gen_help)
+
+        assert gen_help.render_help() == HELP
+
+    def test_command_help_bypasses_click(self, monkeypatch, capsys):
+        """Test ``ingestor <command> --help`` prints the pre-rendered text."""
+        from ingestor.__main__ import main as entry_point
+        from ingestor._help import HELP
+
+        monkeypatch.setattr(sys, "argv", ["ingestor", "batch", "--help"])
+        entry_point()
+
+        assert capsys.readouterr().out == HELP["batch"] + "\n"
+
+
+class TestAsyncGroup:
+    """Tests for running coroutine commands."""
+
+    def test_context_closes_after_command_body(self):
+        """Test close callbacks run after the coroutine body, not before."""
+        events = []
+
+        @click.group(cls=_AsyncGroup)
+        def group():
+            pass
+
+        @group.command()
+        @click.pass_context
+        async def run(ctx):
+            ctx.call_on_close(lambda: events.append("close"))
+            await asyncio.sleep(0)
+            events.append("body")
+            assert click.get_current_context() is ctx
+
+        result = CliRunner().invoke(group, ["run"])
+
+        assert result.exit_code == 0, result.output
+        assert events == ["body", "close"]
+
+
+class TestPlainConsole:
+    """Tests for the console used when output is not a terminal."""
+
+    def test_strips_markup(self, capsys):
+        """Test markup tags are removed but literal brackets are kept."""
+        _PlainConsole().print("[red]Error:[/red] page [depth=1] [bold]done[/bold]")
+
+        assert capsys.readouterr().out == "Error: page [depth=1] done\n"
+
+    def test_keeps_bracketed_words(self, capsys):
+        """Test bracketed text that is not a CLI style tag is left intact."""
+        _PlainConsole().print("[green]Saved:[/green] notes [draft].md []")
+
+        assert capsys.readouterr().out == "Saved: notes [draft].md []\n"
+
+    def test_redirected_output_has_no_ansi_codes(self, tmp_path):
+        """Test command output written to a non-terminal has no escape codes."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+
+        result = CliRunner().invoke(main, [
+            "batch",
+            str(input_dir),
+            "-o", str(tmp_path / "output"),
+        ])
+
+        assert result.exit_code == 0
+        assert "Completed: 0 files" in result.output
+        assert "\x1b[" not in result.output
+
+
+class TestStatusBuffer:
+    """Tests for the batched status line printer."""
+
+    async def test_piped_records_flushed_on_exit(self, capsys):
+        """Test piped records are written as JSON lines when the buffer closes."""
+        async with _StatusBuffer(piped=True) as status:
+            status.add({"source": "a.txt", "status": "ok"}, "  OK a.txt")
+            assert capsys.readouterr().out == ""
+
+        assert json.loads(capsys.readouterr().out) == {"source": "a.txt", "status": "ok"}
+
+    async def test_flush_scheduled_only_when_pending(self):
+        """Test no flush timer exists until a line is added."""
+        async with _StatusBuffer() as status:
+            assert status._timer is None
+            status.add({}, "line")
+            assert status._timer is not None
+
+
 class TestIngestCommand:
     """Real tests for ingest command."""
 
@@ -381,6 +498,25 @@ class TestBatchCommand:
         assert result.exit_code == 0
         assert "Completed" in result.output
 
+    def test_batch_piped_emits_json_lines(self, runner, tmp_path):
+        """Test batch writes one JSON record per file when stdout is piped."""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        (input_dir / "file1.txt").write_text("Content 1")
+        (input_dir / "file2.txt").write_text("Content 2")
+
+        result = runner.invoke(main, [
+            "batch",
+            str(input_dir),
+            "-o", str(tmp_path / "output"),
+        ])
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+        assert len(records) == 2
+        assert all(r["status"] == "ok" for r in records)
+        assert "Completed" in result.stderr
+
     def test_batch_recursive(self, runner, tmp_path):
         """Test batch with recursive flag."""
         input_dir = tmp_path / "input"
@@ -467,6 +603,60 @@ class TestDescribeCommand:
         assert result.exit_code != 0
 
 
+class TestIterImages:
+    """Tests for _iter_images helper."""
+
+    def test_finds_images_recursively(self, tmp_path):
+        """Test images in nested folders are found, other files skipped."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.png").write_bytes(b"x")
+        (tmp_path / "sub" / "b.JPG").write_bytes(b"x")
+        (tmp_path / "notes.txt").write_text("x")
+
+        names = sorted(p.name for p in _iter_images(tmp_path))
+
+        assert names == ["a.png", "b.JPG"]
+
+    def test_skips_directories_named_like_images(self, tmp_path):
+        """Test directories with image suffixes are not yielded."""
+        (tmp_path / "folder.png").mkdir()
+        (tmp_path / "folder.png" / "c.webp").write_bytes(b"x")
+
+        assert [p.name for p in _iter_images(tmp_path)] == ["c.webp"]
+
+    def test_linked_file_yielded_once(self, tmp_path):
+        """Test an image and a symlink to it are described only once."""
+        (tmp_path / "a.png").write_bytes(b"x")
+        (tmp_path / "alias.png").symlink_to(tmp_path / "a.png")
+
+        assert len(list(_iter_images(tmp_path))) == 1
+
+    def test_skips_dangling_symlinks(self, tmp_path):
+        """Test links with image names that point nowhere are not yielded."""
+        (tmp_path / "real.gif").write_bytes(b"x")
+        (tmp_path / "broken.png").symlink_to(tmp_path / "missing.png")
+
+        assert [p.name for p in _iter_images(tmp_path)] == ["real.gif"]
+
+    def test_skips_unreadable_directories(self, tmp_path, monkeypatch):
+        """Test a subdirectory that cannot be listed is skipped, not fatal."""
+        import os
+
+        (tmp_path / "a.png").write_bytes(b"x")
+        (tmp_path / "locked").mkdir()
+        (tmp_path / "locked" / "b.png").write_bytes(b"x")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(tmp_path / "locked"):
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr("ingestor.cli.os.scandir", scandir)
+
+        assert [p.name for p in _iter_images(tmp_path)] == ["a.png"]
+
+
 class TestCloneCommand:
     """Tests for clone command (limited without real repos)."""
 
@@ -147,6 +147,18 @@ class TestFileDetector:
         result = detector.detect("https://github.com/user/repo")
         assert result in [MediaType.GIT, MediaType.GITHUB]
 
+    def test_detect_url_kinds(self):
+        """Test every URL form is detected, with or without a scheme."""
+        detector = FileDetector()
+
+        assert detector.detect("youtube.com/watch?v=abc123") == MediaType.YOUTUBE
+        assert detector.detect("www.youtube.com/playlist?list=PL1") == MediaType.YOUTUBE
+        assert detector.detect("youtu.be/abc123") == MediaType.YOUTUBE
+        assert detector.detect("git@github.com:user/repo.git") == MediaType.GIT
+        assert detector.detect("ssh://git@host.org/user/repo") == MediaType.GIT
+        assert detector.detect("https://example.com/paper.pdf?dl=1") == MediaType.PDF
+        assert detector.detect("notes/youtube.md") == MediaType.TXT
+
     def test_detect_unknown_extension(self, tmp_path):
         """Test detecting unknown file extension - returns TXT for text content."""
         detector = FileDetector()
@@ -207,6 +219,82 @@ class TestFileDetector:
         # Magika may detect as ZIP, PPTX, or TXT with minimal content
         assert result in [MediaType.PPTX, MediaType.ZIP, MediaType.TXT]
 
+    def test_magika_labels_are_lowercase(self):
+        """Test Magika's labels can be looked up without lowercasing them."""
+        from magika.types import ContentTypeLabel
+
+        assert all(label == label.lower() for label in ContentTypeLabel)
+
+    def test_detect_by_extension_any_case(self, tmp_path):
+        """Test extension fallback is case-insensitive."""
+        detector = FileDetector()
+
+        assert detector._detect_by_extension(tmp_path / "paper.pdf") == MediaType.PDF
+        assert detector._detect_by_extension(tmp_path / "PAPER.PDF") == MediaType.PDF
+        assert detector._detect_by_extension(tmp_path / "notes.Md") == MediaType.TXT
+        assert detector._detect_by_extension(tmp_path / "noext") == MediaType.UNKNOWN
+
+    def test_trusted_extension_skips_magika(self, tmp_path):
+        """Test a trusted extension with a matching signature is typed without the model."""
+        detector = FileDetector()
+
+        test_file = tmp_path / "test.png"
+        test_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 32)
+
+        assert detector.detect(test_file) == MediaType.IMAGE
+        assert detector._magika is None
+
+    def test_trusted_extension_signature_mismatch(self, tmp_path):
+        """Test a file whose content contradicts its extension is checked by Magika."""
+        detector = FileDetector()
+
+        test_file = tmp_path / "notes.pdf"
+        test_file.write_text("Just some plain text notes.\n" * 20)
+
+        assert detector.detect(test_file) == MediaType.TXT
+
+    def test_same_content_identified_once(self, tmp_path):
+        """Test Magika results are reused for files with the same content."""
+        detector = FileDetector()
+        magika = detector.magika
+        calls = []
+
+        class CountingMagika:
+            def identify_paths(self, paths):
+                calls.append(paths)
+                return magika.identify_paths(paths)
+
+        detector._magika = CountingMagika()
+        first = tmp_path / "first.json"
+        second = tmp_path / "second.json"
+        first.write_text('{"key": "value", "items": [1, 2, 3]}')
+        second.write_text('{"key": "value", "items": [1, 2, 3]}')
+
+        assert detector.detect(first) == MediaType.JSON
+        assert detector.detect(second) == MediaType.JSON
+        assert len(calls) == 1
+
+        second.write_text('{"key": "other value"}')
+        detector.detect(second)
+        assert len(calls) == 2
+
+    def test_detect_many_matches_detect(self, tmp_path):
+        """Test batched detection gives the same types as detect()."""
+        detector = FileDetector()
+
+        txt_file = tmp_path / "test.txt"
+        txt_file.write_text("Hello, world!\n" * 20)
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"key": "value", "items": [1, 2, 3]}')
+        sources = [
+            str(txt_file),
+            "https://www.youtube.com/watch?v=abc123",
+            json_file,
+            tmp_path / "missing.pdf",
+        ]
+
+        assert detector.detect_many(sources) == [detector.detect(s) for s in sources]
+
 
 class TestRouter:
     """Tests for Router class."""
@@ -367,3 +455,86 @@ class TestRouterDirectoryProcessing:
             results.append(result)
 
         assert len(results) == 0
+
+    @pytest.mark.asyncio
+    async def test_process_directory_non_recursive_skips_subdirs(self, registry, config, tmp_path):
+        """Test non-recursive processing ignores nested files."""
+        router = Router(registry, config)
+
+        (tmp_path / "root.txt").write_text("Root")
+        subdir = tmp_path / "subdir"
+        subdir.mkdir()
+        (subdir / "nested.txt").write_text("Nested")
+
+        results = []
+        async for result in router.process_directory(str(tmp_path), recursive=False, concurrency=2):
+            results.append(result)
+
+        assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_process_directory_stops_early(self, registry, config, tmp_path):
+        """Test breaking out of the stream stops the scanner cleanly."""
+        router = Router(registry, config)
+
+        for i in range(50):
+            (tmp_path / f"file{i}.txt").write_text(f"Content {i}")
+
+        results = []
+        async for result in router.process_directory(str(tmp_path), concurrency=1):
+            results.append(result)
+            break
+
+        assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_process_directory_skips_unreadable_subdir(self, registry, config, tmp_path, monkeypatch):
+        """Test an unreadable subdirectory is skipped, not fatal."""
+        import os
+
+        router = Router(registry, config)
+
+        (tmp_path / "root.txt").write_text("Root")
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "hidden.txt").write_text("Hidden")
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(locked):
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr("ingestor.core.router.os.scandir", scandir)
+
+        results = []
+        async for result in router.process_directory(str(tmp_path), concurrency=2):
+            results.append(result)
+
+        assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_process_directory_preloads_detected_types(self, config, tmp_path):
+        """Test extractors for the detected files are resolved while scanning."""
+        registry = ExtractorRegistry()
+        registry.register_lazy(MediaType.TXT, "ingestor.extractors.text.txt_extractor", "TxtExtractor")
+        router = Router(registry, config)
+
+        (tmp_path / "file.txt").write_text("Content")
+
+        preloaded = []
+        real_preload = registry.preload
+
+        def preload(media_types):
+            preloaded.extend(media_types)
+            real_preload(media_types)
+
+        registry.preload = preload
+
+        results = []
+        async for result in router.process_directory(str(tmp_path), concurrency=1):
+            results.append(result)
+
+        assert len(results) == 1
+        assert MediaType.TXT in preloaded